@@ -1,5 +1,6 @@
 import os.path
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
 import wandb
@@ -14,6 +15,8 @@ from agent_manager.agents.welfare_diplomacy.data_types import (
     MessageSummaryHistory,
     PromptAblation,
 )
+from agent_manager.prompts.json_extraction import extract_json
+from agent_manager.prompts.renderer import format_render_stats, get_render_stats
 from games.welfare_diplomacy.diplomacy import GamePhaseData, Message
 import shutil
 from tasks_config import WANDB_ENTITY,WEAVE_OPEN
@@ -52,24 +55,28 @@ class AgentEval(object):
 
     def play(self):
         self.logger.info("=" * 5 + f"AgentEval play() beginning: " + "=" * 5)
-        if self.args.game.game_name.__contains__("WereWolf"):
-            self.were_wolf_play()
-            return
-        if self.args.game.game_name.__contains__("WelfareDiplomacy"):
-            self.wd_play()
-            return
-        if self.args.game.game_name.__contains__("Civ"):
-            self.civ_play()
-            return
-        if self.args.game.game_name.__contains__("Stratego"):
-            self.stratego_play()
-            return
-        if self.args.game.game_name.__contains__("StreetFight3"):
-            self.streetfight3_play()
-            return
-        if self.args.game.game_name.__contains__("Starcraft"):
-            self.sc_play()
-            return
+        render_stats = get_render_stats()
+        try:
+            if self.args.game.game_name.__contains__("WereWolf"):
+                self.were_wolf_play()
+                return
+            if self.args.game.game_name.__contains__("WelfareDiplomacy"):
+                self.wd_play()
+                return
+            if self.args.game.game_name.__contains__("Civ"):
+                self.civ_play()
+                return
+            if self.args.game.game_name.__contains__("Stratego"):
+                self.stratego_play()
+                return
+            if self.args.game.game_name.__contains__("StreetFight3"):
+                self.streetfight3_play()
+                return
+            if self.args.game.game_name.__contains__("Starcraft"):
+                self.sc_play()
+                return
+        finally:
+            self.logger.info(f"AgentEval match prompt rendering: {format_render_stats(render_stats)}")
 
     def sc_play(self):
         if len(self.agent_list) == 1:
@@ -174,7 +181,14 @@ class AgentEval(object):
                         break
 
     def were_wolf_play(self):
-        self.env.reset()
+        # A checkpoint is written after each round, so an interrupted match resumes from its last completed round
+        checkpoint_path = os.path.join(self.args.eval.output_path, self.args.game.game_name,
+                                       "checkpoint_match_" + str(self.args.match_idx) + ".json")
+        trajectories = {}
+        if os.path.exists(checkpoint_path):
+            trajectories = self.env.load_checkpoint(checkpoint_path)
+        else:
+            self.env.reset()
         # Create an agent for each player
         player_agent_dict = {}
         for name, player in self.env.game.state.players.items():
@@ -184,13 +198,19 @@ class AgentEval(object):
                     print("====player.model==", player.model)
                     player_agent_dict[name] = agent
                     agent.agent_name = name
+                    agent.trajectory = trajectories.get(name, [])
                     break
-        observations, _ = self.env.step('')
-        # Provide action based on observation
-        while not self.env.game.state.winner:
-            action_agent = player_agent_dict[observations['player_name']]
-            action = action_agent.step(observations)
-            observations, winner = self.env.step(action, observations)
+        self.env.enable_checkpoints(checkpoint_path, {name: agent.trajectory for name, agent in player_agent_dict.items()})
+        observations, _ = self.env.step([])
+        # Provide actions based on observations. The env batches independent decisions
+        # (night actions, votes, summaries), so their LLM calls are sent concurrently.
+        max_workers = self.args.game.get('max_concurrent_actions') or len(player_agent_dict)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while not self.env.game.state.winner:
+                actions = list(executor.map(
+                    lambda observation: player_agent_dict[observation['player_name']].step(observation),
+                    observations))
+                observations, winner = self.env.step(actions, observations)
         tqdm.write("Game is complete!")
         if self.env.game.state.winner:
             info = {}
@@ -215,6 +235,8 @@ class AgentEval(object):
             self.history_tracker.save_result()
         log_directory = self.env.log_directory()
         self.env.save_game(self.env.state, self.env.game.logs, log_directory)
+        if os.path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
         print(self.env.game.state.winner)
 
     def streetfight3_play(self):
@@ -251,10 +273,6 @@ class AgentEval(object):
             # Environment stepping
             observation, reward, terminated, truncated, info = self.env.step(actions)
             time_step += 1
-            if "agent_0" in self.agent_list[0].actions:
-                del self.agent_list[0].actions["agent_0"]
-            if "agent_1" in self.agent_list[0].actions:
-                del self.agent_list[0].actions["agent_1"]
             sum_turns += 1
 
             from agent_manager.agents.streetfight3_agent.agent.config import META_INSTRUCTIONS
@@ -332,7 +350,9 @@ class AgentEval(object):
                 0].player_1.generate_times
             opp_grounding_acc = 1 - self.agent_list[0].player_2.grounding_errors / self.agent_list[
                 0].player_2.generate_times
-            wandb.log({"grounding_acc": grounding_acc, "opp_grounding_errors_rate": opp_grounding_acc},step=time_step)
+            decision_metrics = self.agent_list[0].get_decision_metrics()
+            wandb.log({"grounding_acc": grounding_acc, "opp_grounding_errors_rate": opp_grounding_acc,
+                       **decision_metrics},step=time_step)
             p1_wins = observation["P1"]["wins"][0]
             p2_wins = observation["P2"]["wins"][0]
             timer = 99-observation["timer"][0]
@@ -340,8 +360,7 @@ class AgentEval(object):
 
             # print(f"===================match_time_use:  {max_timer} ")
             if p1_wins == 1 or p2_wins == 1:
-                self.agent_list[0].player1_running = False
-                self.agent_list[0].player2_running = False
+                self.agent_list[0].stop_player_planAndAct(timeout=5)
                 match_info={}
                 if p1_wins == 1 :
                     match_info['player']=1
@@ -364,6 +383,7 @@ class AgentEval(object):
                 # opp_grounding_acc = 1 - self.agent_list[0].player_2.grounding_errors / self.agent_list[0].player_2.generate_times
                 match_info['grounding_acc']=grounding_acc
                 match_info['opp_grounding_acc']=opp_grounding_acc
+                match_info.update(decision_metrics)
                 self.history_tracker.extract_match_info(match_info, True)
                 self.history_tracker.save_result()
                 break
@@ -554,15 +574,12 @@ class AgentEval(object):
                             )
                             num_valid_orders += 1
                             invalid_orders.append(order)
-                            continue
-                        location = word[1]
-                        if (
-                                location in possible_orders
-                                and order in possible_orders[location]
-                        ):
-                            num_valid_orders += 1
-                        else:
-                            invalid_orders.append(order)
+                    # Orders are expanded and validated like set_orders() would, in one pass.
+                    valid_orders, rejected_orders, invalid_reasons = self.env.game.validate_orders(
+                        power_name, agent_response.orders
+                    )
+                    num_valid_orders += len([order for order in valid_orders if order != "WAIVE"])
+                    invalid_orders += [order for order in rejected_orders if order not in invalid_orders]
                     num_orders = len(agent_response.orders)
                     valid_order_ratio = (
                         num_valid_orders / num_orders if num_orders > 0 else None
@@ -577,7 +594,7 @@ class AgentEval(object):
                             self.logger,
                             f"✔️  {power_name} valid orders: {num_valid_orders}/{num_orders} = {valid_order_display_percent:.2f}%"
                             + (
-                                f". Invalid Orders: {invalid_orders}"
+                                f". Invalid Orders: {invalid_orders} ({[str(reason) for reason in invalid_reasons]})"
                                 if invalid_orders
                                 else ""
                             ),
@@ -596,12 +613,12 @@ class AgentEval(object):
                             invalid_orders,
                         )
                     )
-                    valid_od = [od for od in agent_response.orders if od not in invalid_orders]
-                    turn_order[power_name] = valid_od
-                    # Set orders, clearing first due to multiple message rounds
+                    turn_order[power_name] = [order for order in valid_orders if order != "WAIVE"]
+                    # Set orders, clearing first due to multiple message rounds.
+                    # Orders are already validated and normalized, so they are not expanded again.
                     self.env.game.set_orders(power_name, [])
                     try:
-                        self.env.game.set_orders(power_name, agent_response.orders)
+                        self.env.game.set_orders(power_name, valid_orders, expand=False)
                     except Exception as exc:
                         # If the agent gave an invalid order, we need to log the error and continue
                         phase_num_completion_errors += 1
@@ -666,10 +683,9 @@ class AgentEval(object):
             )
             # Save summaries of the message history
             if not self.env.game.no_press:
-                for power_name, power in tqdm(
-                        self.env.game.powers.items(), desc="✍️ Summarizing messages"
-                ):
-                    phase_message_summary = self.env.message_summarizer.summarize(
+                # Summaries are independent per power, so they are requested concurrently
+                phase_message_summaries = self.env.message_summarizer.summarize_batch(
+                    [
                         AgentParams(
                             game=self.env.game,
                             power=power,
@@ -682,8 +698,14 @@ class AgentEval(object):
                             possible_orders={},
                             current_message_round=-1,
                             max_message_rounds=-1,
-                        ),turn_orders=turn_order
-                    )
+                        )
+                        for power in self.env.game.powers.values()
+                    ],
+                    turn_orders=turn_order,
+                )
+                for power_name, phase_message_summary in zip(
+                        self.env.game.powers, phase_message_summaries
+                ):
                     message_summary_history[power_name].append(phase_message_summary)
                     game_tokens_prompt_sum += phase_message_summary.prompt_tokens
                     game_tokens_completion_sum += phase_message_summary.completion_tokens
@@ -704,11 +726,9 @@ class AgentEval(object):
                         if summ.phase not in betr_pairs.keys():
                             betr_pairs[summ.phase] = []
                         # print(power, "===", type(summ.summary))
-                        json_completion = summ.summary
-                        start = json_completion.index("{")
-                        end = json_completion.rindex("}") + 1  # +1 to include the } in the slice
-                        json_completion = json_completion[start:end]
-                        json_summ = json.loads(json_completion)
+                        json_summ = extract_json(summ.summary)
+                        if not isinstance(json_summ, dict):
+                            raise ValueError("No JSON object found in summary")
                         print("======", json_summ)
                         if "negotiations_powers" in json_summ.keys():
                             nego_nums += len(json_summ['negotiations_powers'])
@@ -826,7 +846,10 @@ class AgentEval(object):
             if int(self.env.game.phase.split()[1]) - 1900 > self.env.simulation_max_years:
                 self.env.game._finish([])
             rendered_state = self.env.game.render(incl_abbrev=True)
-            from agent_manager.agents.welfare_diplomacy.utils import get_phase_fractional_years_passed
+            from agent_manager.agents.welfare_diplomacy.utils import (
+                get_phase_fractional_years_passed,
+                string_list_similarity,
+            )
             log_object = {
                 "_progress/year_fractional": get_phase_fractional_years_passed(phase),
                 "board/rendering_with_orders": wandb.Html(rendered_with_orders),
@@ -839,6 +862,14 @@ class AgentEval(object):
                     log_object[f"score/units/{short_name}"] = len(power.units)
                     log_object[f"score/welfare/{short_name}"] = power.welfare_points
                     log_object[f"score/centers/{short_name}"] = len(power.centers)
+            # Message diversity: BLEU similarity between all pairs of this phase's messages
+            phase_message_similarity_list = string_list_similarity(
+                [message for (_, _, _, _, message) in phase_message_history]
+            )
+            if phase_message_similarity_list:
+                game_message_similarity_list.extend(phase_message_similarity_list)
+                log_object["message/similarity_avg"] = np.mean(phase_message_similarity_list)
+                log_object["message/game_similarity_avg"] = np.mean(game_message_similarity_list)
 
             wandb.log(log_object,step=time_step)
             # Update the progress bar based on how many turns have progressed (just counting M and A)
@@ -1,14 +1,11 @@
 import json
 
+from agent_manager.prompts import json_extraction
+
 
 def extract_json(text):
-    start_index = text.find("{")
-    end_index = text.rfind("}") + 1
-    json_string = text[start_index:end_index]
-    
-    try:
-        json_data = json.loads(json_string)
-    except json.JSONDecodeError:
+    json_data = json_extraction.extract_json(text)
+    if json_data is None:
         return text
 
     return json.dumps(json_data)
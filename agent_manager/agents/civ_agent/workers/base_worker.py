@@ -165,8 +165,8 @@ class BaseWorker(ABC):
                 break
         return exec_action_name
     def format_prompt(self,prompt_template, worldstate) -> str:
-        import jinja2
-        return jinja2.Template(prompt_template).render(worldstate)
+        from agent_manager.prompts.renderer import render_prompt
+        return render_prompt(prompt_template, worldstate)
     # ==============================================================
     # ====================== Index Maintanence =====================
     # ==============================================================
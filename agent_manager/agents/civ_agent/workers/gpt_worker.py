@@ -15,7 +15,6 @@
 
 import os
 import random
-import json
 import pinecone
 
 from langchain_community.embeddings.openai import OpenAIEmbeddings
@@ -26,6 +25,7 @@ from agent_manager.agents.civ_agent.prompt_handlers.base_prompt_handler import B
 
 # from .base_worker import BaseWorker
 from agent_manager.agents.civ_agent.workers.base_worker import BaseWorker
+from agent_manager.prompts.json_extraction import extract_json
 
 class AzureGPTWorker(BaseWorker):
     """
@@ -156,15 +156,10 @@ class AzureGPTWorker(BaseWorker):
 
     def parse_response(self, response):
         # content = response.choices[0].message.content # for openai==1.45.0
-        content = response
-        start_index = content.find('{')
-        end_index = content.rfind('}') + 1
-        rlack = content.count("{") - content.count("}")
-        if rlack > 0:
-            content = content[start_index:end_index] + "}" * rlack
-        else:
-            content = content[start_index:end_index]
-        return json.loads(content)
+        command_json = extract_json(response)
+        if not isinstance(command_json, dict):
+            raise ValueError('No JSON object found in response')
+        return command_json
 
     def process_command(self, response, obs_input_prompt,
                         current_avail_actions):
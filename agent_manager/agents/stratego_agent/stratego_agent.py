@@ -2,9 +2,8 @@ import json
 import time
 import random
 import numpy as np
-import marko
 import os
-import yaml
+from agent_manager.prompts.json_extraction import extract_json
 from agent_manager.agents.trajectory import Trajectory,set_action_info,set_state_info,set_reward
 
 
@@ -140,7 +139,7 @@ class StrategoAgent(object):
                 post_messages = [{"role": "user", "content": post_prompt}]
                 raw_resp, _ = model.query_single_turn_gen(post_messages)
             # print("==============:raw_resp:",raw_resp)
-            llm_responce = parse_json(raw_resp)
+            llm_responce = extract_json(raw_resp)
 
             self.logger.info(f"=============model:{model.model_name}===============")
             self.logger.info(f"====model_input:{messages}")
@@ -213,8 +212,8 @@ class StrategoAgent(object):
         }
         return pieces_state
     def format_prompt(self,prompt_template, worldstate) -> str:
-        import jinja2
-        return jinja2.Template(prompt_template).render(worldstate)
+        from agent_manager.prompts.renderer import render_prompt
+        return render_prompt(prompt_template, worldstate)
 
     def set_trajectory_reward(self,env,role,score):
         reward = set_reward(env,role,score)
@@ -339,36 +338,3 @@ def get_gameState(env, current_player):
     # print(gameState)
 
     return gameState, his_valid_moves,current_player_valid_move,pieces_state
-
-
-
-
-
-def parse_json(text: str) :
-    result_json = parse_json_markdown(text)
-
-    if not result_json:
-        result_json = parse_json_str(text)
-    return result_json
-
-
-def parse_json_markdown(text: str) :
-    ast = marko.parse(text)
-
-    for c in ast.children:
-        # find the first json block (```json or ```JSON)
-        if hasattr(c, "lang") and c.lang.lower() == "json":
-            json_str = c.children[0].children
-            return parse_json_str(json_str)
-
-    return None
-
-
-def parse_json_str(text: str) :
-    try:
-        # use yaml.safe_load which handles missing quotes around field names.
-        result_json = yaml.safe_load(text)
-    except yaml.parser.ParserError:
-        return None
-
-    return result_json
\ No newline at end of file
@@ -165,3 +165,5 @@ REAL_MOVE_LIST = [
 ]
 
 NB_FRAME_WAIT = 1
+# Number of observations and actions kept in the robot history
+HISTORY_SIZE = 10
@@ -1,3 +1,5 @@
+from typing import Optional
+
 import numpy as np
 
 KEN_RED = [248, 0, 0]
@@ -24,11 +26,15 @@ def detect_position_from_color(
     if save_frame:
         np.save("observation.npy", frame)
 
-    frame = frame[100:200, :]
+    frame = np.asarray(frame)[100:200, :]
 
     # Detect the red color of Ken
-    diff = np.linalg.norm(np.array(frame) - np.array(color), axis=2)
-    mask = diff < epsilon
+    if epsilon <= 1:
+        # Pixel values are integers: a distance below 1 means an exact match
+        mask = (frame == np.asarray(color, dtype=frame.dtype)).all(axis=2)
+    else:
+        diff = np.linalg.norm(frame - np.array(color), axis=2)
+        mask = diff < epsilon
 
     # Return the index where the red color is detected
     coordinates = mask.nonzero()
@@ -40,3 +46,91 @@ def detect_position_from_color(
     first_match = (coordinates[1][0], coordinates[0][0] + 100)
 
     return first_match
+
+
+def _pack_color(color) -> int:
+    """Pack an RGB color into a 24-bit integer."""
+    return (int(color[0]) << 16) | (int(color[1]) << 8) | int(color[2])
+
+
+class PositionDetector:
+    """
+    Detect the positions of several colors in successive frames, like detect_position_from_color.
+
+    Pixels of uint8 frames are packed once per frame into 24-bit integers in preallocated
+    buffers, so that each color is found with an integer equality test. Each color is first
+    searched in a window of columns around its last position. A match there bounds the rows
+    holding the first match of the whole strip, so only the rows down to it are then searched
+    at full width. Positions are the same as detect_position_from_color's.
+    """
+
+    def __init__(self, colors: list, top: int = 100, bottom: int = 200, window: int = 64):
+        self.keys = [_pack_color(color) for color in colors]
+        self.top = top
+        self.bottom = bottom
+        self.window = window
+        self.last_positions = [None] * len(colors)
+        self._packed = None
+        self._buffer = None
+        self._mask = None
+
+    def _pack(self, strip: np.ndarray, left: int, right: int, rows: Optional[int] = None) -> np.ndarray:
+        """Pack the first rows of columns [left, right) of the strip into the preallocated buffer and return it."""
+        if self._packed is None or self._packed.shape != strip.shape[:2]:
+            self._packed = np.empty(strip.shape[:2], dtype=np.uint32)
+            self._buffer = np.empty(strip.shape[:2], dtype=np.uint32)
+            self._mask = np.empty(strip.shape[:2], dtype=bool)
+        if rows is None:
+            rows = strip.shape[0]
+        columns = strip[:rows, left:right]
+        packed = self._packed[:rows, :right - left]
+        buffer = self._buffer[:rows, :right - left]
+        np.left_shift(columns[..., 0], 16, out=packed, dtype=np.uint32)
+        np.left_shift(columns[..., 1], 8, out=buffer, dtype=np.uint32)
+        np.bitwise_or(packed, buffer, out=packed)
+        np.bitwise_or(packed, columns[..., 2], out=packed)
+        return packed
+
+    def _first_match(self, packed: np.ndarray, key: int, left: int) -> Optional[tuple]:
+        """Return the (x, y) frame coordinates of the first pixel of packed equal to key, or None."""
+        mask = np.equal(packed, key, out=self._mask[:packed.shape[0], :packed.shape[1]])
+        index = int(mask.argmax())
+        row, column = divmod(index, packed.shape[1])
+        if not mask[row, column]:
+            return None
+        return (column + left, row + self.top)
+
+    def detect(self, frame) -> list:
+        """
+        Return the position of each color in the frame, as a list of (x, y) tuples or None.
+        """
+        strip = np.asarray(frame)[self.top:self.bottom]
+        if strip.dtype != np.uint8:
+            strip = strip.astype(np.uint8)
+        width = strip.shape[1]
+        # Number of rows to search at full width for each color.
+        rows = [strip.shape[0]] * len(self.keys)
+
+        if all(position is not None for position in self.last_positions):
+            windows = [
+                (max(x - self.window, 0), min(x + self.window + 1, width))
+                for x, _ in self.last_positions
+            ]
+            left = min(start for start, _ in windows)
+            right = max(end for _, end in windows)
+            packed = self._pack(strip, left, right)
+            for index, (start, end) in enumerate(windows):
+                match = self._first_match(
+                    packed[:, start - left:end - left], self.keys[index], start
+                )
+                if match is not None:
+                    # The first match of the strip is at most on the row of the window match.
+                    rows[index] = match[1] - self.top + 1
+
+        packed = self._pack(strip, 0, width, max(rows))
+        positions = [
+            self._first_match(packed[:rows[index]], key, 0)
+            for index, key in enumerate(self.keys)
+        ]
+        self.last_positions = positions
+        return positions
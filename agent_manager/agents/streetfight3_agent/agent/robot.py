@@ -2,8 +2,8 @@ import os
 import random
 import re
 import time
-from collections import defaultdict
-from typing import Dict, List, Literal, Optional
+from collections import defaultdict, deque
+from typing import Deque, Dict, List, Literal, Optional
 
 import numpy as np
 from gymnasium import spaces
@@ -11,6 +11,7 @@ from loguru import logger
 from agent_manager.prompts import StreetFight3Prompt
 
 from .config import (
+    HISTORY_SIZE,
     INDEX_TO_MOVE,
     META_INSTRUCTIONS,
     META_INSTRUCTIONS_WITH_LOWER,
@@ -19,15 +20,15 @@ from .config import (
     X_SIZE,
     Y_SIZE,
 )
-from .observer import detect_position_from_color
+from .observer import PositionDetector
 
 from agent_manager.agents.trajectory import Trajectory,set_action_info,set_state_info,set_reward
 class Robot:
-    observations: List[Optional[dict]] = None  # memory
+    observations: Deque[dict] = None  # memory of the derived features of the last frames
     next_steps: List[int]  # action plan
     actions: dict  # actions of the agents during a step of the game
     # actions of the agents during the previous step of the game
-    previous_actions: Dict[str, List[int]]
+    previous_actions: Dict[str, Deque[int]]
     reward: float  # reward of the agent
 
     action_space: spaces.Space
@@ -54,7 +55,8 @@ class Robot:
         prompt_templete:StreetFight3Prompt=None,
         player_nb: int = 0,  # 0 means not specified
         weave_prj_name="StreetFight3",
-        logger=None
+        logger=None,
+        frame_downsample: Optional[int] = None,  # keep every n-th pixel of the frames, None to drop them
     ):
         self.action_space = action_space
         self.character = character
@@ -63,16 +65,18 @@ class Robot:
         elif side == 1:
             self.current_direction = "Left"
 
-        self.observations = []
+        self.observations = deque(maxlen=HISTORY_SIZE)
+        self.frame_downsample = frame_downsample
         self.next_steps = []
         self.character_color = character_color
         self.ennemy_color = ennemy_color
+        self.position_detector = PositionDetector([character_color, ennemy_color])
         self.side = side
         self.sleepy = sleepy
         self.only_punch = only_punch
         self.model = model
         self.prompt_templete = prompt_templete
-        self.previous_actions = defaultdict(list)
+        self.previous_actions = defaultdict(lambda: deque(maxlen=HISTORY_SIZE))
         self.actions = {}
         self.player_nb = player_nb
         self.weave_prj_name=weave_prj_name
@@ -178,37 +182,16 @@ class Robot:
         """
         The robot will observe the environment by calling this method.
 
-        The latest observations are at the end of the list.
+        Only the features used by the prompt are kept, in a ring buffer of the last
+        HISTORY_SIZE observations. The latest observations are at the end of the buffer.
         """
 
         # detect the position of characters and ennemy based on color
-        observation["character_position"] = detect_position_from_color(
-            observation, self.character_color
-        )
-        observation["ennemy_position"] = detect_position_from_color(
-            observation, self.ennemy_color
-        )
+        character_position, ennemy_position = self.position_detector.detect(observation["frame"])
         self.cur_time_step = observation.get("_time_step",1)
-        self.observations.append(observation)
-        # we delete the oldest observation if we have more than 10 observations
-        if len(self.observations) > 10:
-            self.observations.pop(0)
-
-        self.reward = reward
-
-        if actions.get("agent_0") is not None and actions.get("agent_0") != 0:
-            self.previous_actions["agent_0"].append(actions["agent_0"])
-        if actions.get("agent_1") is not None and actions.get("agent_1") != 0:
-            self.previous_actions["agent_1"].append(actions["agent_1"])
-
-        for key, value in actions.items():
-            if len(self.previous_actions[key]) > 10:
-                self.previous_actions[key].pop(0)
 
         # Keep track of the current direction by checking the position of the character
         # and the ennemy
-        character_position = observation.get("character_position")
-        ennemy_position = observation.get("ennemy_position")
         if (
             character_position is not None
             and ennemy_position is not None
@@ -220,6 +203,31 @@ class Robot:
             else:
                 self.current_direction = "Left"
 
+        features = {
+            "character_position": character_position,
+            "ennemy_position": ennemy_position,
+            "direction": self.current_direction,
+            "timer": int(observation["timer"][0]) if "timer" in observation else None,
+            "_time_step": self.cur_time_step,
+        }
+        for player in ("P1", "P2"):
+            features[player] = {
+                "health": int(observation[player]["health"]),
+                "super_bar": int(observation[player]["super_bar"][0]),
+            }
+        if self.frame_downsample:
+            # copy, so that the buffer does not keep the full frame alive
+            step = self.frame_downsample
+            features["frame"] = np.array(observation["frame"][::step, ::step])
+        self.observations.append(features)
+
+        self.reward = reward
+
+        if actions.get("agent_0") is not None and actions.get("agent_0") != 0:
+            self.previous_actions["agent_0"].append(actions["agent_0"])
+        if actions.get("agent_1") is not None and actions.get("agent_1") != 0:
+            self.previous_actions["agent_1"].append(actions["agent_1"])
+
     def context_prompt(self) -> str:
         """
         Return a str of the context
@@ -238,7 +246,7 @@ class Robot:
         # print("~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~")
         obs_own = self.observations[-1]["character_position"]
         obs_opp = self.observations[-1]["ennemy_position"]
-        super_bar_own = self.observations[-1]["P" + str(side + 1)]["super_bar"][0]
+        super_bar_own = self.observations[-1]["P" + str(side + 1)]["super_bar"]
 
         if obs_own is not None and obs_opp is not None:
             relative_position = np.array(obs_own) - np.array(obs_opp)
@@ -250,8 +258,8 @@ class Robot:
             normalized_relative_position = [0.3, 0]
 
         opp_side=1 if side==0 else 0
-        health=int(self.observations[-1]["P" + str(side + 1)]['health'])
-        opp_health=int(self.observations[-1]["P" + str(opp_side + 1)]['health'])
+        health=self.observations[-1]["P" + str(side + 1)]['health']
+        opp_health=self.observations[-1]["P" + str(opp_side + 1)]['health']
         # print(f"====={side}")
         health_prompt="Your current health  is {}, and ennemy current health is {}.".format(health,opp_health)
         # print(f"====={health_prompt}")
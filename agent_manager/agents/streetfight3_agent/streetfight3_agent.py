@@ -1,5 +1,7 @@
 import json
 import threading
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from threading import Thread
 import time
 from box import Box
@@ -59,10 +61,22 @@ class StreetFight3Agent(object):
             "agent_0": 0,
             "agent_1": 0,
         }
+        # actions executed by the env at the last step, observed by both players
+        self.last_actions = {}
         self.reward = 0.0
         self.asy_running = args.game.asynch_mode
-        self.player1_running = True
-        self.player2_running = True
+        # In asynchronous mode, planner threads wait on this condition until step()
+        # consumes their action
+        self.action_condition = threading.Condition()
+        self.plan_threads = []
+        # In synchronous mode, both players plan concurrently on this executor
+        self.plan_executor = None
+        # Decision metrics: number of frames played per LLM decision, and decision latency
+        self.frames_since_decision = defaultdict(int)
+        self.frames_per_decision = defaultdict(list)
+        self.decision_latencies = defaultdict(list)
+        # Separate from action_condition, which step() holds while the players plan
+        self.metrics_lock = threading.Lock()
         # print("====self.asy_running===",self.asy_running)
         self.generate_times = 1
         self.grounding_errors = 0
@@ -76,20 +90,60 @@ class StreetFight3Agent(object):
         self.logger.info("=" * 5 + f"StreetFight3Agent Init Successfully!: " + "=" * 5)
 
     def plan_act(self):
+        """
+        Observe, plan and act for both players in synchronous mode.
 
+        A player only calls the LLM once its queue of next steps is empty. When both
+        players need a decision, they plan concurrently, so the env waits for the slowest
+        LLM call instead of the sum of both calls. Otherwise the queued moves are played
+        without waiting for the LLM.
+        """
+        players = [(self.player_1, "agent_0", 1), (self.player_2, "agent_1", -1)]
         # Observe the environment
-        self.player_1.observe(self.observation, self.actions, self.reward)
-        # Plan
-        self.player_1.plan()
-        # Act
-        self.actions["agent_0"] = self.player_1.act()
+        for player, _, reward_sign in players:
+            player.observe(self.observation, self.last_actions, reward_sign * self.reward)
 
-        # Observe the environment
-        self.player_2.observe(self.observation, self.actions, -self.reward)
         # Plan
-        self.player_2.plan()
+        planning = [(player, agent_key) for player, agent_key, _ in players if not player.next_steps]
+        if len(planning) > 1:
+            if self.plan_executor is None:
+                self.plan_executor = ThreadPoolExecutor(max_workers=len(players))
+            futures = [self.plan_executor.submit(self.plan_player, player, agent_key)
+                       for player, agent_key in planning]
+            for future in futures:
+                future.result()
+        elif planning:
+            self.plan_player(*planning[0])
+
         # Act
-        self.actions["agent_1"] = self.player_2.act()
+        for player, agent_key, _ in players:
+            self.actions[agent_key] = player.act()
+
+    def plan_player(self, player, agent_key):
+        """Plan the next steps of a player, recording the decision metrics if the LLM was called."""
+        if player.next_steps:
+            return
+        start = time.perf_counter()
+        player.plan()
+        latency = time.perf_counter() - start
+        with self.metrics_lock:
+            self.decision_latencies[agent_key].append(latency)
+            self.frames_per_decision[agent_key].append(self.frames_since_decision[agent_key])
+            self.frames_since_decision[agent_key] = 0
+
+    def get_decision_metrics(self):
+        """
+        Return the mean number of frames played per LLM decision and the mean decision latency
+        in seconds, for the player and the opponent.
+        """
+        metrics = {}
+        with self.metrics_lock:
+            for agent_key, prefix in (("agent_0", ""), ("agent_1", "opp_")):
+                frames = self.frames_per_decision[agent_key]
+                latencies = self.decision_latencies[agent_key]
+                metrics[prefix + "frames_per_decision"] = sum(frames) / len(frames) if frames else 0
+                metrics[prefix + "decision_latency"] = sum(latencies) / len(latencies) if latencies else 0
+        return metrics
 
     def step(self, observation,reward=0.0):
         """
@@ -98,13 +152,17 @@ class StreetFight3Agent(object):
         :return:
         """
 
-        self.observation = observation
-        self.reward += reward
-        if not self.asy_running:
-            # print("not asy_running")
-            self.plan_act()
+        with self.action_condition:
+            self.observation = observation
+            self.reward += reward
+            if not self.asy_running:
+                # print("not asy_running")
+                self.plan_act()
 
-        actions = self.actions.copy()
+            # Take the actions, so that planner threads prepare the next ones while the env steps
+            actions = self.actions.copy()
+            self.actions.clear()
+            self.action_condition.notify_all()
         # print("==========================self.actions==========================")
         # print("self.actions", self.actions)
         # print("==========================self.actions==========================")
@@ -117,14 +175,29 @@ class StreetFight3Agent(object):
         # print("actions:",self.actions)
         # print("========")
 
+        with self.metrics_lock:
+            self.last_actions = actions
+            for agent_key in actions:
+                self.frames_since_decision[agent_key] += 1
+
         return actions
 
     def start_player_planAndAct(self):
         print("asy_running: True")
-        player1_thread = PlanAndActPlayer1(game=self)
-        player1_thread.start()
-        player2_thread = PlanAndActPlayer2(game=self)
-        player2_thread.start()
+        self.plan_threads = [PlanAndActPlayer1(game=self), PlanAndActPlayer2(game=self)]
+        for thread in self.plan_threads:
+            thread.start()
+
+    def stop_player_planAndAct(self, timeout=None):
+        """Stop the planner threads, waiting at most timeout seconds for each of them to exit."""
+        for thread in self.plan_threads:
+            thread.stop()
+        for thread in self.plan_threads:
+            thread.join(timeout)
+        self.plan_threads = []
+        if self.plan_executor is not None:
+            self.plan_executor.shutdown(wait=False)
+            self.plan_executor = None
 
     def set_trajectory_reward(self,env,role,score):
         reward = set_reward(env,role,score)
@@ -145,32 +218,47 @@ class StreetFight3Agent(object):
             json.dump(react_data, f, ensure_ascii=False, indent=2)
 
 class PlanAndAct(Thread):
-    def __init__(self, game):
+    """Plan and act for one player in asynchronous mode.
+
+    The thread sleeps until StreetFight3Agent.step() has consumed the player's previous
+    action, then plans its next action, and exits once stopped.
+    """
+    def __init__(self, game, player, agent_key, reward_sign):
         self.running = True
         self.game = game
+        self.player = player
+        self.agent_key = agent_key
+        self.reward_sign = reward_sign
         Thread.__init__(self, daemon=True)
-class PlanAndActPlayer1(PlanAndAct):
-    def run(self) -> None:
-        while self.running:
-            if "agent_0" not in self.game.actions:
-                # Plan
-                self.game.player_1.plan()
-                # Act
-                self.game.actions["agent_0"] = self.game.player_1.act()
-                # print(" ays player 1 =====", self.game.actions["agent_0"])
-                # Observe the environment
-                self.game.player_1.observe(self.game.observation, self.game.actions, self.game.reward)
 
-class PlanAndActPlayer2(PlanAndAct):
+    def _wait_for_turn(self):
+        """Block until the previous action was consumed. Return False if the thread was stopped."""
+        with self.game.action_condition:
+            self.game.action_condition.wait_for(
+                lambda: not self.running or self.agent_key not in self.game.actions)
+            return self.running
+
     def run(self) -> None:
-        while self.running:
-            if "agent_1" not in self.game.actions:
-                # Plan
-                self.game.player_2.plan()
-                # Act
-                self.game.actions["agent_1"] = self.game.player_2.act()
-                # print(" ays player 2 =====", self.game.actions["agent_1"])
-                                # Observe the environment
-                self.game.player_2.observe(self.game.observation, self.game.actions, -self.game.reward)
+        while self._wait_for_turn():
+            # Plan
+            self.game.plan_player(self.player, self.agent_key)
+            # Act
+            action = self.player.act()
+            with self.game.action_condition:
+                self.game.actions[self.agent_key] = action
+                observation, reward = self.game.observation, self.game.reward
+            # Observe the environment
+            self.player.observe(observation, self.game.actions, self.reward_sign * reward)
 
+    def stop(self):
+        with self.game.action_condition:
+            self.running = False
+            self.game.action_condition.notify_all()
 
+class PlanAndActPlayer1(PlanAndAct):
+    def __init__(self, game):
+        super().__init__(game, game.player_1, "agent_0", 1)
+
+class PlanAndActPlayer2(PlanAndAct):
+    def __init__(self, game):
+        super().__init__(game, game.player_2, "agent_1", -1)
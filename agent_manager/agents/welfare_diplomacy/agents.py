@@ -6,7 +6,6 @@ an underlying model for a response, and return back the extracted response.
 """
 
 from abc import ABC, abstractmethod
-import json
 import random
 import time
 import yaml
@@ -25,6 +24,7 @@ from agent_manager.agents.welfare_diplomacy.data_types import (
 )
 
 from agent_manager.prompts import welfare_diplomacy_prompt as prompts
+from agent_manager.prompts.json_extraction import extract_json
 
 class AgentCompletionError(ValueError):
     """Raised when an agent fails to complete a prompt."""
@@ -231,13 +231,10 @@ class LLMAgent2(Agent):
             # Remove repeated **system** from parroty completion models
             json_completion = json_completion.split("**")[0].strip(" `\n")
 
-            # Claude likes to add junk around the actual JSON object, so find it manually
-            start = json_completion.index("{")
-            end = json_completion.rindex("}") + 1  # +1 to include the } in the slice
-            json_completion = json_completion[start:end]
-
-            # Load the JSON
-            completion = json.loads(json_completion, strict=False)
+            # Models like to add junk around the actual JSON object, so extract it
+            completion = extract_json(json_completion)
+            if not isinstance(completion, dict):
+                raise ValueError("No JSON object found in completion")
 
             # Extract data from completion
             reasoning = (
@@ -317,13 +314,10 @@ class LLMAgent(Agent):
             # Remove repeated **system** from parroty completion models
             json_completion = json_completion.split("**")[0].strip(" `\n")
 
-            # Claude likes to add junk around the actual JSON object, so find it manually
-            start = json_completion.index("{")
-            end = json_completion.rindex("}") + 1  # +1 to include the } in the slice
-            json_completion = json_completion[start:end]
-
-            # Load the JSON
-            completion = json.loads(json_completion, strict=False)
+            # Models like to add junk around the actual JSON object, so extract it
+            completion = extract_json(json_completion)
+            if not isinstance(completion, dict):
+                raise ValueError("No JSON object found in completion")
 
             # Extract data from completion
             reasoning = (
@@ -406,13 +400,10 @@ class LLMAgentNew(Agent):
             # Remove repeated **system** from parroty completion models
             json_completion = json_completion.split("**")[0].strip(" `\n")
 
-            # Claude likes to add junk around the actual JSON object, so find it manually
-            start = json_completion.index("{")
-            end = json_completion.rindex("}") + 1  # +1 to include the } in the slice
-            json_completion = json_completion[start:end]
-
-            # Load the JSON
-            completion = json.loads(json_completion, strict=False)
+            # Models like to add junk around the actual JSON object, so extract it
+            completion = extract_json(json_completion)
+            if not isinstance(completion, dict):
+                raise ValueError("No JSON object found in completion")
 
             # Extract data from completion
             reasoning = (
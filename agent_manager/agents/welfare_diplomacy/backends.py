@@ -1,6 +1,7 @@
 """Language model backends."""
 import json
 from abc import ABC, abstractmethod
+import threading
 import time
 
 import os
@@ -38,6 +39,7 @@ class OpenAIChatBackend(LanguageModelBackend):
         self.role=role
         self.trajectory: Trajectory = []
         self.cur_time_step = 0
+        self._trajectory_lock = threading.Lock()  # complete() may run concurrently (batch summaries)
 
     def complete(self, system_prompt: str,user_prompt: str,completion_preface: str = "",) -> BackendResponse:
         assert (
@@ -57,10 +59,11 @@ class OpenAIChatBackend(LanguageModelBackend):
             state_info = set_state_info(from_="WelfareDiplomacy", role=self.role, step=self.cur_time_step,
                                         content=user_prompt,
                                         system_content=system_prompt, user_content=user_prompt)
-            self.trajectory.append(state_info)
             action = set_action_info(from_=self.llm_model.model_name, role=self.role, step=self.cur_time_step,
                                      content="", other_content=completion)
-            self.trajectory.append(action)
+            # Keep each state/action pair adjacent in the trajectory
+            with self._trajectory_lock:
+                self.trajectory.extend([state_info, action])
 
             completion_time_sec = time.time() - start_time
             return BackendResponse(
@@ -2,4 +2,6 @@
 
 MAX_BACKOFF_TIME_DEFAULT = 4096  # seconds
 
+SUMMARIZER_MAX_CONCURRENCY_DEFAULT = 7  # concurrent summarizer LLM calls (one per power)
+
 WANDB_PROJECT = "welfare-diplomacy-v3"
@@ -1,11 +1,13 @@
 """Summarize message history to condense prompts."""
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from logging import Logger
 
-from games.welfare_diplomacy.diplomacy import Game, Message, Power
+from games.welfare_diplomacy.diplomacy import Game, Power
 
 from agent_manager.agents.welfare_diplomacy.backends import OpenAIChatBackend
+from agent_manager.agents.welfare_diplomacy.constants import SUMMARIZER_MAX_CONCURRENCY_DEFAULT
 
 from agent_manager.agents.welfare_diplomacy.data_types import AgentParams, PhaseMessageSummary
 from agent_manager.agents.welfare_diplomacy import utils
@@ -23,6 +25,10 @@ class MessageSummarizer(ABC):
         Important: Must be called before game.process to get any messages!
         """
 
+    def summarize_batch(self, params_list: list[AgentParams], **kwargs) -> list[PhaseMessageSummary]:
+        """Summarize the most recent phase's messages for several powers, in the order of params_list."""
+        return [self.summarize(params, **kwargs) for params in params_list]
+
 
 class PassthroughMessageSummarizer(MessageSummarizer):
     """Don't summarize, just copy over the messages."""
@@ -54,10 +60,11 @@ class PassthroughMessageSummarizer(MessageSummarizer):
 class LLMMessageSummarizer:
     """Message summarizer using a language model backend."""
 
-    def __init__(self, model, logger,role,**kwargs):
+    def __init__(self, model, logger,role,max_concurrency=SUMMARIZER_MAX_CONCURRENCY_DEFAULT,**kwargs):
         self.backend = OpenAIChatBackend(model,logger, role)
         self.model_mame=model.model_name
         self.logger=logger
+        self.max_concurrency=max(1, max_concurrency)
 
 
     def __repr__(self) -> str:
@@ -102,6 +109,16 @@ class LLMMessageSummarizer:
             completion_tokens=response.completion_tokens,
         )
 
+    def summarize_batch(self, params_list: list[AgentParams], turn_orders={}) -> list[PhaseMessageSummary]:
+        """Summarize the most recent phase's messages for several powers concurrently.
+
+        At most max_concurrency backend calls run at once. Summaries are returned in the order of params_list.
+        """
+        if len(params_list) <= 1 or self.max_concurrency == 1:
+            return [self.summarize(params, turn_orders=turn_orders) for params in params_list]
+        with ThreadPoolExecutor(max_workers=min(self.max_concurrency, len(params_list))) as executor:
+            return list(executor.map(lambda params: self.summarize(params, turn_orders=turn_orders), params_list))
+
 
 def model_name_to_message_summarizer(model,logger, **kwargs) -> MessageSummarizer:
     """Given a model name, return an instantiated corresponding agent."""
@@ -110,19 +127,8 @@ def model_name_to_message_summarizer(model,logger, **kwargs) -> MessageSummarize
 
 def get_messages_list(game: Game, power: Power) -> list[str]:
     """Get a list of messages to pass through to the summarizer."""
-    message: Message
-    original_message_list = []
-    for message in game.messages.values():
-        if (
-            message.sender != power.name
-            and message.recipient != power.name
-            and message.recipient != "GLOBAL"
-        ):
-            # Limit messages seen by this power
-            continue
-        message_repr = f"{message.sender.title()} -> {message.recipient.title()}: {message.message}\n"
-        original_message_list.append(message_repr)
-    return original_message_list
+    # Limit messages seen by this power (the game keeps a per-power index of rendered messages)
+    return game.get_power_message_lines(power.name)
 
 
 def combine_messages(original_message_list: list[str]) -> str:
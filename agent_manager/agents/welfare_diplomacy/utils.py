@@ -6,7 +6,7 @@ from typing import Any
 
 from games.welfare_diplomacy.diplomacy import Game, GamePhaseData
 from logging import Logger
-from nltk.translate.bleu_score import sentence_bleu, SmoothingFunction
+from scipy import sparse
 from tqdm.contrib.logging import logging_redirect_tqdm
 import wandb
 
@@ -85,31 +85,72 @@ def get_power_scores_string(game: Game, abbrev: bool = False):
         )
 
 
-def bootstrap_string_list_similarity(
-    strings: list[str], num_bootstrap_comparisons: int = 1000
+def string_list_similarity(
+    strings: list[str],
+    max_order: int = 4,
+    min_words: int = 4,
+    max_strings: int = 1000,
 ) -> list[float]:
-    """Calculates the average BLEU similarity between all pairs of strings."""
-    if not isinstance(strings, list):
-        strings = list(strings)
-    if not strings:
+    """Calculates the BLEU similarity between all ordered pairs of distinct strings.
+
+    Matches nltk's sentence_bleu (uniform weights, smoothing method1) with one string as the reference and the
+    other as the hypothesis, but computes all pairs at once: each string is tokenized once into sparse n-gram
+    count vectors, and clipped n-gram matches are computed with sparse matrix products. Strings with fewer than
+    min_words words are skipped. If there are more than max_strings strings, an evenly spaced subset is used.
+    """
+    tokenized = [string.split() for string in strings]
+    tokenized = [words for words in tokenized if len(words) >= min_words]
+    if len(tokenized) > max_strings:
+        tokenized = [tokenized[int(index)] for index in np.linspace(0, len(tokenized) - 1, max_strings)]
+    if len(tokenized) < 2:
         return []
-    smoothing_function = SmoothingFunction().method1
-    similarities = []
-    for _ in range(num_bootstrap_comparisons):
-        # Sample 2 strings with replacement
-        sampled_strings = random.choices(strings, k=2)
-        # Split strings into words
-        split_1 = sampled_strings[0].split()
-        split_2 = sampled_strings[1].split()
-        # If too short, BLEU will divide by 0
-        if len(split_1) < 4 or len(split_2) < 4:
-            continue
-        # Calculate BLEU similarity
-        bleu_similarity = sentence_bleu(
-            [split_1], split_2, smoothing_function=smoothing_function
-        )
-        similarities.append(bleu_similarity)
-    return similarities
+    lengths = np.array([len(words) for words in tokenized], dtype=np.float64)
+
+    log_precision_sum = np.zeros((len(tokenized), len(tokenized)))
+    for order in range(1, max_order + 1):
+        counts = _ngram_counts(tokenized, order)
+        # min(count_1, count_2) is the number of levels k >= 1 with both counts >= k
+        clipped_matches = np.zeros_like(log_precision_sum)
+        while counts.nnz:
+            present = counts.copy()
+            present.data[:] = 1.0
+            clipped_matches += (present @ present.T).toarray()
+            counts.data -= 1.0
+            counts.eliminate_zeros()
+        if order == 1:
+            any_unigram_match = clipped_matches > 0
+        # Smoothing method1: zero matches count as epsilon = 0.1
+        numerators = np.where(clipped_matches > 0, clipped_matches, 0.1)
+        denominators = np.maximum(lengths - order + 1, 1)[np.newaxis, :]
+        log_precision_sum += np.log(numerators / denominators)
+
+    # Rows are references and columns are hypotheses
+    reference_lengths, hypothesis_lengths = lengths[:, np.newaxis], lengths[np.newaxis, :]
+    brevity_penalty = np.where(
+        hypothesis_lengths > reference_lengths,
+        1.0,
+        np.exp(1 - reference_lengths / hypothesis_lengths),
+    )
+    similarities = brevity_penalty * np.exp(log_precision_sum / max_order)
+    similarities[~any_unigram_match] = 0.0
+    return similarities[~np.eye(len(tokenized), dtype=bool)].tolist()
+
+
+def _ngram_counts(tokenized: list[list[str]], order: int) -> sparse.csr_matrix:
+    """Sparse (strings x distinct n-grams) matrix of n-gram counts."""
+    vocabulary: dict[tuple[str, ...], int] = {}
+    rows, columns = [], []
+    for row, words in enumerate(tokenized):
+        for start in range(len(words) - order + 1):
+            rows.append(row)
+            columns.append(
+                vocabulary.setdefault(tuple(words[start : start + order]), len(vocabulary))
+            )
+    counts = sparse.csr_matrix(
+        (np.ones(len(rows)), (rows, columns)), shape=(len(tokenized), len(vocabulary))
+    )
+    counts.sum_duplicates()
+    return counts
 
 
 def validate_config(config: wandb.Config, game: Game):
@@ -3,7 +3,7 @@ import json
 import os
 
 from agent_manager.prompts.werewolf_prompt import ACTION_PROMPTS_AND_SCHEMAS
-import jinja2
+from agent_manager.prompts.renderer import render_prompt
 from games.werewolf.lm import LmLog
 from games.werewolf.utils import parse_json
 import random
@@ -70,7 +70,7 @@ class WereWolfAgent(object):
             try:
                 raw_resp,_=self.model.query_single_turn_gen(messages)
                 try:
-                    result = parse_json(raw_resp)
+                    result = parse_json(raw_resp, response_schema)
                 except:
                     if self.model.model_name.__contains__("llama3.1") and action=="summarize":
 
@@ -90,7 +90,7 @@ class WereWolfAgent(object):
                         # raw_resp = self.model.query_single_turn(post_messages)
                         # raw_resp = raw_resp.choices[0].message.content
                         print("================after ==============",raw_resp)
-                    result = parse_json(raw_resp)
+                    result = parse_json(raw_resp, response_schema)
                     print("================final ==============",raw_resp)
                 self.logger.info(f"=============model:{self.model.model_name}===============")
                 self.logger.info(f"=============player:{game_state['role']}--{game_state['name']}=action:{action}=============")
@@ -141,4 +141,4 @@ class WereWolfAgent(object):
             json.dump(react_data, f, ensure_ascii=False, indent=2)
 
     def format_prompt(self,prompt_template, worldstate) -> str:
-        return jinja2.Template(prompt_template).render(worldstate)
+        return render_prompt(prompt_template, worldstate)
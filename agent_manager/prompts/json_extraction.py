@@ -0,0 +1,181 @@
+"""
+Shared extraction of JSON objects from LLM replies.
+
+Replies are scanned once for JSON candidates: fenced code blocks first, then bare
+objects found by brace matching. Each candidate is parsed with json, then with a
+tolerant repair pass (comments, trailing commas, single quotes, missing closing
+braces), then with yaml as a last resort. When a response schema is given, the
+first candidate matching the schema is returned, or the first parsed candidate if
+none matches.
+"""
+import itertools
+import json
+import re
+
+import jsonschema
+import yaml
+
+_FENCE_RE = re.compile(r"```[ \t]*([\w-]*)[^\n]*\n(.*?)(?:```|$)", re.DOTALL)
+
+_validators = {}
+
+
+def iter_json_candidates(text: str):
+    """
+    Yield substrings of text which may hold a JSON value:
+    contents of fenced code blocks (blocks labelled json first), then each top-level {...} object.
+    An object left open at the end of text is yielded up to the end of text.
+    """
+    fenced = _FENCE_RE.findall(text)
+    for lang, block in fenced:
+        if lang.lower() == "json":
+            yield block
+    for lang, block in fenced:
+        if lang.lower() != "json":
+            yield block
+
+    depth = 0
+    start = None
+    in_string = False
+    escaped = False
+    for index, char in enumerate(text):
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"' and depth:
+            in_string = True
+        elif char == "{":
+            if not depth:
+                start = index
+            depth += 1
+        elif char == "}" and depth:
+            depth -= 1
+            if not depth:
+                yield text[start:index + 1]
+    if depth:
+        yield text[start:]
+
+
+def repair_json(text: str) -> str:
+    """
+    Rewrite common LLM mistakes into valid JSON, in a single pass:
+    // and /* */ comments are dropped, single-quoted strings become double-quoted,
+    trailing commas are removed and unclosed objects and arrays are closed.
+    """
+    out = []
+    closers = []
+    index = 0
+    length = len(text)
+    while index < length:
+        char = text[index]
+        if char == '"' or (char == "'" and _starts_value(out)):
+            # Copy a string, converting a single-quoted string to a double-quoted one.
+            end = index + 1
+            chars = ['"']
+            while end < length and text[end] != char:
+                if text[end] == "\\" and end + 1 < length:
+                    # \' is not a valid JSON escape.
+                    chars.append("'" if text[end + 1] == "'" else text[end:end + 2])
+                    end += 2
+                    continue
+                chars.append('\\"' if text[end] == '"' else text[end])
+                end += 1
+            chars.append('"')
+            out.append("".join(chars))
+            index = end + 1
+            continue
+        if char == "/" and text.startswith("//", index):
+            newline = text.find("\n", index)
+            index = length if newline < 0 else newline
+            continue
+        if char == "/" and text.startswith("/*", index):
+            end = text.find("*/", index + 2)
+            index = length if end < 0 else end + 2
+            continue
+        if char in "{[":
+            closers.append("}" if char == "{" else "]")
+        elif char in "}]":
+            _drop_trailing_comma(out)
+            if closers:
+                closers.pop()
+        out.append(char)
+        index += 1
+    _drop_trailing_comma(out)
+    out.extend(reversed(closers))
+    return "".join(out)
+
+
+def _starts_value(out):
+    """Return True if a quote following out would open a key or a value."""
+    for chunk in reversed(out):
+        stripped = chunk.strip()
+        if stripped:
+            return stripped[-1] in "{[,:"
+    return False
+
+
+def _drop_trailing_comma(out):
+    """Remove a comma (and the whitespace after it) at the end of out."""
+    index = len(out) - 1
+    while index >= 0 and not out[index].strip():
+        index -= 1
+    if index >= 0 and out[index] == ",":
+        del out[index:]
+
+
+def parse_json_candidate(text: str):
+    """Parse a JSON candidate, repairing it if needed. Return None if it cannot be parsed."""
+    text = text.strip()
+    if not text:
+        return None
+    try:
+        return json.loads(text, strict=False)
+    except ValueError:
+        pass
+    try:
+        return json.loads(repair_json(text), strict=False)
+    except ValueError:
+        pass
+    try:
+        # yaml handles unquoted keys and values.
+        result = yaml.safe_load(text)
+    except yaml.YAMLError:
+        return None
+    return result if isinstance(result, (dict, list)) else None
+
+
+def validate_json(value, schema) -> bool:
+    """Return True if value matches the given JSON schema."""
+    validator = _validators.get(id(schema))
+    if validator is None or validator.schema is not schema:
+        validator = jsonschema.Draft7Validator(schema)
+        _validators[id(schema)] = validator
+    return validator.is_valid(value)
+
+
+def extract_json(text: str, schema=None):
+    """
+    Return the first JSON object or array found in an LLM reply, or None.
+
+    :param text: LLM reply.
+    :param schema: optional JSON schema (e.g. a werewolf response_schema) used to pick
+        among candidates. If no candidate matches it, the first parsed candidate is returned,
+        so that a reply missing an optional field (e.g. "reasoning") is still usable.
+    """
+    if not text:
+        return None
+    first_result = None
+    # The whole reply is tried last, for objects written without braces.
+    for candidate in itertools.chain(iter_json_candidates(text), [text]):
+        result = parse_json_candidate(candidate)
+        if result is None:
+            continue
+        if schema is None or validate_json(result, schema):
+            return result
+        if first_result is None:
+            first_result = result
+    return first_result
@@ -0,0 +1,83 @@
+"""
+Shared Jinja rendering for agent prompts.
+
+Templates are compiled once in a sandboxed environment and kept in a bounded
+cache keyed by template source and strictness, so rendering a prompt on each LLM call only
+evaluates the compiled template.
+"""
+import functools
+import logging
+import threading
+import time
+
+import jinja2
+from jinja2.sandbox import SandboxedEnvironment
+
+logger = logging.getLogger(__name__)
+
+TEMPLATE_CACHE_SIZE = 256
+
+_ENVIRONMENTS = {
+    False: SandboxedEnvironment(),
+    True: SandboxedEnvironment(undefined=jinja2.StrictUndefined),
+}
+
+_stats_lock = threading.Lock()
+_render_stats = {"renders": 0, "render_seconds": 0.0}
+
+
+@functools.lru_cache(maxsize=TEMPLATE_CACHE_SIZE)
+def get_template(prompt_template: str, strict: bool = False) -> jinja2.Template:
+    """
+    Return the compiled template for the given source.
+
+    With strict=True, rendering raises on undefined variables instead of printing nothing.
+    """
+    return _ENVIRONMENTS[strict].from_string(prompt_template)
+
+
+def render_prompt(prompt_template: str, worldstate, strict: bool = False) -> str:
+    """
+    Render a prompt template with the given worldstate, using the compiled template cache.
+    """
+    template = get_template(prompt_template, strict)
+    start = time.perf_counter()
+    prompt = template.render(worldstate)
+    elapsed = time.perf_counter() - start
+    with _stats_lock:
+        _render_stats["renders"] += 1
+        _render_stats["render_seconds"] += elapsed
+    logger.debug("Rendered prompt in %.3f ms", elapsed * 1e3)
+    return prompt
+
+
+def get_render_stats() -> dict:
+    """
+    Return the number of renders, total render time, and template cache counters,
+    accumulated since the process started.
+    """
+    cache_info = get_template.cache_info()
+    with _stats_lock:
+        stats = dict(_render_stats)
+    stats.update({
+        "cache_hits": cache_info.hits,
+        "cache_misses": cache_info.misses,
+        "cached_templates": cache_info.currsize,
+    })
+    return stats
+
+
+def format_render_stats(since: dict = None) -> str:
+    """
+    Describe render stats in one line, counting only renders after the `since` stats if given.
+    """
+    stats = get_render_stats()
+    if since:
+        stats = {key: value - since[key] for key, value in stats.items() if key != "cached_templates"}
+    renders = stats["renders"]
+    mean_ms = stats["render_seconds"] * 1e3 / renders if renders else 0.0
+    return (
+        f"{renders} prompt renders in {stats['render_seconds'] * 1e3:.1f} ms "
+        f"({mean_ms:.3f} ms per render), template cache: {stats['cache_hits']} hits, "
+        f"{stats['cache_misses']} misses"
+    )
@@ -152,18 +152,10 @@ def get_user_prompt(params: AgentParams) -> str:
         message_history += (
             f"{params.game.get_current_phase()} (current phase all messages)\n"
         )
-        phase_message_count = 0
-        for message in params.game.messages.values():
-            if (
-                message.sender != params.power.name
-                and message.recipient != params.power.name
-                and message.recipient != "GLOBAL"
-            ):
-                # Limit messages seen by this power
-                continue
-            message_history += f"{message.sender.title()} -> {message.recipient.title()}: {message.message}\n"
-            phase_message_count += 1
-        if phase_message_count == 0:
+        # Limit messages seen by this power
+        phase_message_lines = params.game.get_power_message_lines(params.power.name)
+        message_history += "".join(phase_message_lines)
+        if len(phase_message_lines) == 0:
             message_history += "None\n"
 
         message_history = message_history.strip()  # Remove trailing newline
@@ -17,6 +17,8 @@
 """Server -> Client notifications."""
 import inspect
 
+import ujson as json
+
 from games.welfare_diplomacy.diplomacy.engine.game import Game
 from games.welfare_diplomacy.diplomacy.engine.message import Message
 from games.welfare_diplomacy.diplomacy.utils import common, exceptions, parsing, strings
@@ -187,8 +189,12 @@ class GameProcessed(_GameNotification):
 
             - **previous_phase_data**: :class:`diplomacy.utils.game_phase_data.GamePhaseData` of the previous phase
             - **current_phase_data**: :class:`diplomacy.utils.game_phase_data.GamePhaseData` of the current phase
+
+        Attribute **encoded_params** is not part of the model. It may be set to the JSON encoding of the
+        notification parameters (see :meth:`encode_params`), so that notifications sharing the same phase data
+        (e.g. all tokens of a same power) encode it only once.
     """
-    __slots__ = ['previous_phase_data', 'current_phase_data']
+    __slots__ = ['previous_phase_data', 'current_phase_data', 'encoded_params']
     params = {
         strings.PREVIOUS_PHASE_DATA: parsing.JsonableClassType(GamePhaseData),
         strings.CURRENT_PHASE_DATA: parsing.JsonableClassType(GamePhaseData),
@@ -197,8 +203,31 @@ class GameProcessed(_GameNotification):
     def __init__(self, **kwargs):
         self.previous_phase_data = None  # type: GamePhaseData
         self.current_phase_data = None  # type: GamePhaseData
+        self.encoded_params = None  # type: str
         super(GameProcessed, self).__init__(**kwargs)
 
+    @classmethod
+    def encode_params(cls, previous_phase_data, current_phase_data):
+        """ Return JSON encoding of notification parameters, to be shared by many notifications.
+
+            :param previous_phase_data: game phase data before phase update
+            :param current_phase_data: game phase data after phase update
+            :return: JSON object members (without enclosing braces) for notification parameters.
+            :type previous_phase_data: diplomacy.utils.game_phase_data.GamePhaseData
+            :type current_phase_data: diplomacy.utils.game_phase_data.GamePhaseData
+            :rtype: str
+        """
+        return json.dumps({strings.PREVIOUS_PHASE_DATA: previous_phase_data.to_dict(),
+                           strings.CURRENT_PHASE_DATA: current_phase_data.to_dict()})[1:-1]
+
+    def json(self):
+        """ Convert this notification to a JSON string, reusing encoded parameters if available. """
+        if self.encoded_params is None:
+            return super(GameProcessed, self).json()
+        header = {key: parsing.to_json(getattr(self, key), key_type)
+                  for key, key_type in self.get_model().items() if key not in self.params}
+        return '%s,%s}' % (json.dumps(header)[:-1], self.encoded_params)
+
 class GamePhaseUpdate(_GameNotification):
     """ Notification about a game phase update.
 
@@ -22,6 +22,8 @@ from games.welfare_diplomacy.diplomacy.daide.tokens import Token
 
 # Constants
 LOGGER = logging.getLogger(__name__)
+OPE_PAR_BYTES = bytes(tokens.OPE_PAR)
+CLO_PAR_BYTES = bytes(tokens.CLO_PAR)
 
 def break_next_group(daide_bytes):
     """ If the next token is a parenthesis, finds its matching closing parenthesis and returns a tuple of the items
@@ -29,42 +31,44 @@ def break_next_group(daide_bytes):
         e.g. bytes for (ENG AMY PAR) MTO NWY would return --> (ENG AMY PAR) + MTO NWY
         e.g. bytes for ENG AMY PAR would return -> '' + ENG AMY PAR since the byte array does not start with a "("
 
+        Given bytes may be a memoryview, in which case returned parts are views on the same buffer (no copy).
+
         :return: A tuple consisting of the parenthesis group and the remaining bytes after the group
              or an empty byte array and the entire byte array if the byte array does not start with a parenthesis
     """
     if not daide_bytes:
         return b'', b''
+    if daide_bytes[:2] != OPE_PAR_BYTES:
+        return None, daide_bytes
 
     # Finding the matching closing parenthesis
-    pos = 0
+    # Parentheses are the only tokens with first byte 0x40, so other tokens are skipped on first byte
     parentheses_level = 0
-    while True:
-        if daide_bytes[pos:pos + 2] == bytes(tokens.OPE_PAR):
+    for pos in range(0, len(daide_bytes) - 1, 2):
+        if daide_bytes[pos] != OPE_PAR_BYTES[0]:
+            continue
+        if daide_bytes[pos + 1] == OPE_PAR_BYTES[1]:
             parentheses_level += 1
-        elif daide_bytes[pos:pos + 2] == bytes(tokens.CLO_PAR):
+        elif daide_bytes[pos + 1] == CLO_PAR_BYTES[1]:
             parentheses_level -= 1
-        if parentheses_level <= 0:
-            break
-        if pos >= len(daide_bytes):                         # Parentheses don't match - Not returning group
-            pos = 0
-            break
-        pos += 2
+            if not parentheses_level:
+                return daide_bytes[:pos + 2], daide_bytes[pos + 2:]
 
-    # Returning
-    return (daide_bytes[:pos + 2], daide_bytes[pos + 2:]) if pos else (None, daide_bytes)
+    # Parentheses don't match - Not returning group
+    return None, daide_bytes
 
 def add_parentheses(daide_bytes):
     """ Add parentheses to a list of bytes """
     if not daide_bytes:
         return daide_bytes
-    return bytes(tokens.OPE_PAR) + daide_bytes + bytes(tokens.CLO_PAR)
+    return OPE_PAR_BYTES + daide_bytes + CLO_PAR_BYTES
 
 def strip_parentheses(daide_bytes):
     """ Removes parentheses from the DAIDE bytes and returns the inner content.
         The first and last token are expected to be parentheses.
     """
-    assert daide_bytes[:2] == bytes(tokens.OPE_PAR), 'Expected bytes to start with "("'
-    assert daide_bytes[-2:] == bytes(tokens.CLO_PAR), 'Expected bytes to end wth ")"'
+    assert daide_bytes[:2] == OPE_PAR_BYTES, 'Expected bytes to start with "("'
+    assert daide_bytes[-2:] == CLO_PAR_BYTES, 'Expected bytes to end wth ")"'
     return daide_bytes[2:-2]
 
 def parse_bytes(clause_constructor, daide_bytes, on_error='raise'):
@@ -176,8 +180,8 @@ class SingleToken(AbstractClause):
             return remaining_bytes
 
         # Getting the token
-        self._bytes = token_bytes
-        self._str = str(Token(from_bytes=token_bytes))
+        self._bytes = bytes(token_bytes)
+        self._str = tokens.get_token_str(self._bytes)
         return remaining_bytes
 
     def from_string(self, string, on_error='raise'):
@@ -261,9 +265,8 @@ class String(AbstractClause):
             return daide_bytes
 
         # Extract its content
-        nb_bytes = len(str_group_bytes)
-        self._bytes = str_group_bytes
-        self._str = ''.join([str(Token(from_bytes=str_group_bytes[pos:pos + 2])) for pos in range(2, nb_bytes - 2, 2)])
+        self._bytes = bytes(str_group_bytes)
+        self._str = ''.join(tokens.decode_tokens(str_group_bytes[2:-2]))
         return remaining_bytes
 
     def from_string(self, string, on_error='raise'):
@@ -308,7 +311,7 @@ class Number(AbstractClause):
             self.error(on_error, 'Expected at least 1 byte to parse a number')
             return daide_bytes
 
-        number_bytes, remaining_bytes = daide_bytes[:2], daide_bytes[2:]
+        number_bytes, remaining_bytes = bytes(daide_bytes[:2]), daide_bytes[2:]
         number_token = Token(from_bytes=number_bytes)
         if not tokens.is_integer_token(number_token):
             self.error(on_error, 'The token is not an integer. Got %s' % number_token)
@@ -370,7 +373,7 @@ class Province(AbstractClause):
         # Is a province with coast
         # Syntax (STP NCS)
         if province_group_bytes:
-            self._bytes = province_group_bytes
+            self._bytes = bytes(province_group_bytes)
 
             province_group_bytes = strip_parentheses(province_group_bytes)
             province, province_group_bytes = parse_bytes(SingleToken, province_group_bytes, on_error=on_error)
@@ -460,7 +463,7 @@ class Turn(AbstractClause):
             self.error(on_error, 'Unable to find a set of parentheses to extract the turn clause.')
             return daide_bytes
 
-        self._bytes = turn_group_bytes
+        self._bytes = bytes(turn_group_bytes)
 
         turn_group_bytes = strip_parentheses(turn_group_bytes)
         season, turn_group_bytes = parse_bytes(SingleToken, turn_group_bytes, on_error=on_error)
@@ -562,7 +565,7 @@ class Unit(AbstractClause):
             return daide_bytes
 
         # Extract its content
-        self._bytes = unit_group_bytes
+        self._bytes = bytes(unit_group_bytes)
 
         unit_group_bytes = strip_parentheses(unit_group_bytes)
         power, unit_group_bytes = parse_bytes(Power, unit_group_bytes, on_error=on_error)
@@ -757,7 +760,7 @@ class Order(AbstractClause):
             return daide_bytes
 
         # Extract its content
-        self._bytes = order_group_bytes
+        self._bytes = bytes(order_group_bytes)
 
         # Parsing the unit group (or just the power)
         order_group_bytes = strip_parentheses(order_group_bytes)
@@ -619,6 +619,15 @@ MAPPING = {
     requests.AdminMessageRequest: on_admin_message_request
 }
 
+@gen.coroutine
+def _handle_request_after_process(server, request, connection_handler):
+    """ (coroutine) Wait for game targeted by given request to be processed, then handle request.
+        See handle_request() for parameters and returned value.
+    """
+    yield server.wait_game_processed(request.game_id)
+    response = yield handle_request(server, request, connection_handler)
+    return response
+
 def handle_request(server, request, connection_handler):
     """ (coroutine) Find request handler function for associated request, run it and return its result.
 
@@ -633,6 +642,11 @@ def handle_request(server, request, connection_handler):
     if not request_handler_fn:
         raise exceptions.RequestException()
 
+    if server.is_game_in_process(request.game_id):
+        # Game is being processed by an adjudication worker. Handle request once processing is done,
+        # so that game is not read while it is modified.
+        return _handle_request_after_process(server, request, connection_handler)
+
     game = server.get_game(request.game_id)
 
     # Game not found
@@ -19,7 +19,7 @@ from games.welfare_diplomacy.diplomacy.communication.requests import _AbstractGa
 from games.welfare_diplomacy.diplomacy.daide.clauses import String, Number, Power, Order, Turn, SingleToken, strip_parentheses, \
     break_next_group, parse_bytes
 from games.welfare_diplomacy.diplomacy.daide import tokens
-from games.welfare_diplomacy.diplomacy.daide.tokens import Token, is_ascii_token
+from games.welfare_diplomacy.diplomacy.daide.tokens import Token
 from games.welfare_diplomacy.diplomacy.utils import parsing, strings
 
 class RequestBuilder:
@@ -28,12 +28,14 @@ class RequestBuilder:
     def from_bytes(daide_bytes, **kwargs):
         """ Builds a request from DAIDE bytes
 
-            :param daide_bytes: The bytes representation of a request
+            :param daide_bytes: The bytes representation of a request (bytes, bytearray or memoryview).
+                Request is parsed on a memoryview of given bytes, so that parsing does not copy remaining bytes.
             :return: The DaideRequest built from the bytes
         """
         if len(daide_bytes) < 2:
             return None
-        initial_bytes = daide_bytes[:2]
+        daide_bytes = memoryview(daide_bytes)
+        initial_bytes = bytes(daide_bytes[:2])
         if initial_bytes not in __REQUEST_CONSTRUCTORS__:
             raise ValueError('Unable to find a constructor for %s' % str(Token(from_bytes=initial_bytes)))
         request = __REQUEST_CONSTRUCTORS__[initial_bytes](**kwargs)             # type: DaideRequest
@@ -63,18 +65,17 @@ class DaideRequest(_AbstractGameRequest):
     def parse_bytes(self, daide_bytes):
         """ Builds the request from DAIDE bytes """
         assert len(daide_bytes) % 2 == 0, 'Expected request to have an even number of bytes. Got %d' % len(daide_bytes)
-        self._bytes = daide_bytes
+        self._bytes = bytes(daide_bytes)
 
         # Building str representation
-        while daide_bytes:
-            token = Token(from_bytes=(daide_bytes[0], daide_bytes[1]))
-            new_str = str(token)
-            daide_bytes = daide_bytes[2:]
-            pad = '' if (not self._str
-                         or self._str[-1] == '('
+        str_buffer = []
+        for value, new_str in zip(tokens.unpack_tokens(daide_bytes), tokens.decode_tokens(daide_bytes)):
+            pad = '' if (not str_buffer
+                         or str_buffer[-1][-1] == '('
                          or new_str == ')'
-                         or (is_ascii_token(token) and new_str != '(')) else ' '
-            self._str = self._str + pad + new_str
+                         or (value >> 8 == tokens.ASCII_BYTE and new_str != '(')) else ' '
+            str_buffer += [pad, new_str]
+        self._str = ''.join(str_buffer)
 
 
 # ====================
@@ -562,7 +563,7 @@ class SendMessageRequest(DaideRequest):
         # Setting properties
         self.phase = '' if not turn else str(turn)
         self.powers = [str(power) for power in powers]
-        self.message_bytes = message_group_bytes
+        self.message_bytes = bytes(message_group_bytes)
 
 # ====================
 # Cancel Request
@@ -641,7 +642,7 @@ class AcceptRequest(DaideRequest):
         assert not daide_bytes, '%s bytes remaining. Request is malformed' % len(daide_bytes)
 
         # Setting properties
-        self.response_bytes = response_bytes
+        self.response_bytes = bytes(response_bytes)
 
 class RejectRequest(DaideRequest):
     """ Represents a REJ DAIDE request.
@@ -672,7 +673,7 @@ class RejectRequest(DaideRequest):
         assert not daide_bytes, '%s bytes remaining. Request is malformed' % len(daide_bytes)
 
         # Setting properties
-        self.response_bytes = response_bytes
+        self.response_bytes = bytes(response_bytes)
 
 # ====================
 # Errors
@@ -711,7 +712,7 @@ class ParenthesisErrorRequest(DaideRequest):
         assert not daide_bytes, '%s bytes remaining. Request is malformed' % len(daide_bytes)
 
         # Setting properties
-        self.message_bytes = message_bytes
+        self.message_bytes = bytes(message_bytes)
 
 class SyntaxErrorRequest(DaideRequest):
     """ Represents a HUH DAIDE request. Sent by the client to specify an error in a message.
@@ -742,7 +743,7 @@ class SyntaxErrorRequest(DaideRequest):
         assert not daide_bytes, '%s bytes remaining. Request is malformed' % len(daide_bytes)
 
         # Setting properties
-        self.message_bytes = message_bytes
+        self.message_bytes = bytes(message_bytes)
 
 
 # ====================
@@ -884,3 +884,15 @@ def test_adm():
     assert bytes(request) == str_to_bytes(daide_str)
     assert str(request) == expected_str
     assert request.adm_message == 'I\'m having connection problems'
+
+def test_sub_from_buffer():
+    """ Tests the SUB request parsed from a bytearray and from a memoryview """
+    daide_str = 'SUB ( ( ENG AMY LVP ) SUP ( ENG FLT LON ) MTO NTH ) ( ( ENG FLT BAR ) MTO ( STP NCS ) )'
+    expected_str = 'SUB ((ENG AMY LVP) SUP (ENG FLT LON) MTO NTH) ((ENG FLT BAR) MTO (STP NCS))'
+    for daide_bytes in (bytearray(str_to_bytes(daide_str)), memoryview(str_to_bytes(daide_str))):
+        request = RequestBuilder.from_bytes(daide_bytes)
+        assert isinstance(request, requests.SUB), 'Expected a SUB request'
+        assert bytes(request) == str_to_bytes(daide_str)
+        assert str(request) == expected_str
+        assert request.power_name == 'ENGLAND'
+        assert request.orders == ['A LVP S F LON - NTH', 'F BAR - STP/NC']
@@ -16,7 +16,7 @@
 # ==============================================================================
 """ Tests the DAIDE tokens"""
 from enum import Enum
-from games.welfare_diplomacy.diplomacy.daide.tokens import Token
+from games.welfare_diplomacy.diplomacy.daide.tokens import Token, decode_tokens, get_token_str, unpack_tokens
 
 class ExpectedTokens(Enum):
     """ Copy of the tokens definition from aiclient/adjudicator/TOKENS.h """
@@ -266,3 +266,15 @@ def test_tokens():
         assert str(token_from_bytes) == token_str
         assert bytes(token_from_str) == token_bytes
         assert bytes(token_from_bytes) == token_bytes
+
+def test_token_tables():
+    """ Test precomputed token tables against tokens """
+    tokens = [Token(from_str='ECS'), Token(from_str='A'), Token(from_int=0), Token(from_int=8191),
+              Token(from_bytes=b'\x3F\xFF'), Token(from_str='(')]
+    daide_bytes = b''.join(bytes(token) for token in tokens)
+    for buffer in (daide_bytes, bytearray(daide_bytes), memoryview(daide_bytes)):
+        assert unpack_tokens(buffer) == tuple(int.from_bytes(bytes(token), byteorder='big') for token in tokens)
+        assert decode_tokens(buffer) == [str(token) for token in tokens]
+    assert [get_token_str(bytes(token)) for token in tokens] == [str(token) for token in tokens]
+    assert str(Token(from_bytes=b'\x3F\xFF')) == '-1'
+    assert int(Token(from_bytes=b'\x3F\xFF')) == -1
@@ -15,11 +15,23 @@
 #  with this program.  If not, see <https://www.gnu.org/licenses/>.
 # ==============================================================================
 """ Contains the list of valid tokens and their byte representation """
+import struct
 
 # Constants
 BYTES_TO_STR = {}         # (0x46, 0x04) -> 'ECS'
 STR_TO_BYTES = {}         # 'ECS' -> (0x46, 0x04)
 ASCII_BYTE = 0x4B         # Byte identifying an ASCII char
+INTEGER_LIMIT = 0x4000    # Tokens with a 16-bit value lower than this limit are integers
+
+# Precomputed lookup table indexed by the 16-bit (big endian) value of each token:
+# 0x4604 -> 'ECS', 0x4B41 -> 'A', 0x0005 -> '5', 0x3FFF -> '-1'. None for unknown tokens.
+# Integer and ASCII tokens are filled below, other tokens are added by register_token()
+TOKEN_STRINGS = [None] * 0x10000
+for _value in range(INTEGER_LIMIT):
+    TOKEN_STRINGS[_value] = str((_value & 0x1FFF) - (_value & 0x2000))
+for _char in range(256):
+    TOKEN_STRINGS[(ASCII_BYTE << 8) | _char] = chr(_char)
+del _value, _char
 
 # Utilities
 class Token:
@@ -61,7 +73,7 @@ class Token:
         # 1) Known token
         # 2) ASCII Text
         if from_str in STR_TO_BYTES:
-            self.repr_str = BYTES_TO_STR[STR_TO_BYTES[from_str]]
+            self.repr_str = from_str
             self.repr_bytes = STR_TO_BYTES[from_str]
         elif len(from_str) == 1 and ord(from_str[0]) <= 255:
             self.repr_str = from_str
@@ -84,42 +96,27 @@ class Token:
             from_int += 8192
 
         # Encoding the number as 14 bit. + a prefix of '00' for a total of 16 bit
-        bit_encoding = bin(from_int)[2:]
-        bit_encoding = '00' + prefix + '0' * (13 - len(bit_encoding)) + bit_encoding
+        value = (0x2000 if prefix == '1' else 0) | from_int
         self.repr_str = str(from_int)
         self.repr_int = from_int
-        self.repr_bytes = bytes((int(bit_encoding[0:8], 2), int(bit_encoding[8:16], 2)))
+        self.repr_bytes = bytes((value >> 8, value & 0xFF))
 
     def _load_from_bytes(self, from_bytes):
         """ Creates a token from its bytes representation """
-        if isinstance(from_bytes, tuple):
-            from_bytes = bytes(from_bytes)
+        from_bytes = bytes(from_bytes)
         if len(from_bytes) != 2:
             raise ValueError('Expected a couple of 2 bytes 0x000xFF. Got [{}]' \
                              .format(''.join([hex(b) for b in from_bytes])))
 
-        # Known token
-        if from_bytes in BYTES_TO_STR:
-            self.repr_str = BYTES_TO_STR[from_bytes]
-            self.repr_bytes = from_bytes
-
-        # Ascii text
-        elif from_bytes[0] == ASCII_BYTE:
-            self.repr_str = chr(from_bytes[1])
-            self.repr_bytes = from_bytes
-
-        # Integer
-        elif from_bytes[0] < 64:
-            bin_0, bin_1 = bin(from_bytes[0])[2:], bin(from_bytes[1])[2:]
-            from_binary = '0' * (6 - len(bin_0)) + bin_0 + '0' * (8 - len(bin_1)) + bin_1
-            is_negative = int(from_binary[0] == '1')
-            self.repr_int = is_negative * -8192 + int(from_binary[1:14], 2)
-            self.repr_str = str(self.repr_int)
-            self.repr_bytes = from_bytes
-
-        else:
+        # Known token, ascii text or integer
+        value = (from_bytes[0] << 8) | from_bytes[1]
+        if TOKEN_STRINGS[value] is None:
             # Unknown value
             raise ValueError('Unable to parse bytes %s as a token' % (from_bytes,))
+        self.repr_str = TOKEN_STRINGS[value]
+        self.repr_bytes = from_bytes
+        if value < INTEGER_LIMIT:
+            self.repr_int = int(self.repr_str)
 
     def __bytes__(self):
         """ Returns bytes representation """
@@ -156,6 +153,38 @@ def is_integer_token(token):
     return isinstance(token, Token) and \
            len(token.repr_bytes) == 2 and token.repr_bytes[0] < 64
 
+def get_token_str(token_bytes):
+    """ Return the string representation of a token from its bytes representation, without building a Token
+
+        :param token_bytes: The byte representation of the token (i.e. bytes of length 2)
+        :return: The DAIDE string representation of the token (e.g. 'ECS')
+    """
+    if len(token_bytes) != 2:
+        return str(Token(from_bytes=token_bytes))           # Raises the same error as Token
+    token_str = TOKEN_STRINGS[(token_bytes[0] << 8) | token_bytes[1]]
+    if token_str is None:
+        raise ValueError('Unable to parse bytes %s as a token' % (bytes(token_bytes),))
+    return token_str
+
+def unpack_tokens(daide_bytes):
+    """ Return the 16-bit values of all tokens in a DAIDE byte buffer
+
+        :param daide_bytes: A bytes-like object (e.g. bytes or memoryview) with an even number of bytes
+        :return: A tuple of integers (e.g. (0x4800, 0x4100) for bytes of CCD AUS)
+    """
+    return struct.unpack_from('>%dH' % (len(daide_bytes) // 2), daide_bytes)
+
+def decode_tokens(daide_bytes):
+    """ Return the string representations of all tokens in a DAIDE byte buffer
+
+        :param daide_bytes: A bytes-like object (e.g. bytes or memoryview) with an even number of bytes
+        :return: A list of DAIDE strings (e.g. ['CCD', 'AUS'])
+    """
+    token_strs = [TOKEN_STRINGS[value] for value in unpack_tokens(daide_bytes)]
+    if None in token_strs:
+        raise ValueError('Unable to parse bytes %s as a token' % (bytes(daide_bytes),))
+    return token_strs
+
 def register_token(str_repr, bytes_repr):
     """ Registers a token in the registry
 
@@ -169,6 +198,7 @@ def register_token(str_repr, bytes_repr):
         raise ValueError('Bytes %s have already been registered.' % bytes_repr)
     STR_TO_BYTES[str_repr] = bytes_repr
     BYTES_TO_STR[bytes_repr] = str_repr
+    TOKEN_STRINGS[(bytes_repr[0] << 8) | bytes_repr[1]] = str_repr
     return Token(from_str=str_repr)
 
 
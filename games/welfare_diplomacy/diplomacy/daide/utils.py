@@ -16,7 +16,8 @@
 # ==============================================================================
 """ Settings - Contains a list of utils to help handle DAIDE communication """
 from collections import namedtuple
-from games.welfare_diplomacy.diplomacy.daide.tokens import is_integer_token, Token
+from games.welfare_diplomacy.diplomacy.daide.tokens import INTEGER_LIMIT, STR_TO_BYTES, TOKEN_STRINGS, Token, \
+    unpack_tokens
 
 ClientConnection = namedtuple('ClientConnection', ['username', 'daide_user', 'token', 'power_name'])
 
@@ -48,7 +49,9 @@ def str_to_bytes(daide_str):
     buffer = []
     str_split = daide_str.split(' ') if daide_str else []
     for word in str_split:
-        if word == '':
+        if word in STR_TO_BYTES:
+            buffer.append(STR_TO_BYTES[word])
+        elif word == '':
             buffer.append(bytes(Token(from_str=' ')))
         elif word[0] == '#':
             buffer.append(bytes(Token(from_int=int(word[1:]))))
@@ -59,17 +62,15 @@ def str_to_bytes(daide_str):
 def bytes_to_str(daide_bytes):
     """ Converts a bytes into its str representation
 
-        :param daide_bytes: A DAIDE bytes with tokens separated by spaces
+        :param daide_bytes: A DAIDE bytes with tokens separated by spaces (bytes or memoryview)
         :return: The bytes representation of the string
 
         Note: Integers starts with a '#' character
     """
     buffer = []
-    length = len(daide_bytes) if daide_bytes else 0
-    for i in range(0, length, 2):
-        token = Token(from_bytes=(daide_bytes[i], daide_bytes[i + 1]))
-        if is_integer_token(token):
-            buffer.append('#' + str(token))
-        else:
-            buffer.append(str(token))
+    for value in unpack_tokens(daide_bytes) if daide_bytes else ():
+        token_str = TOKEN_STRINGS[value]
+        if token_str is None:
+            raise ValueError('Unable to parse bytes %s as a token' % (bytes((value >> 8, value & 0xFF)),))
+        buffer.append('#' + token_str if value < INTEGER_LIMIT else token_str)
     return ' '.join(buffer)
@@ -113,6 +113,8 @@ class Game(Jsonable):
       - Reset to None when exited from with-statement.
 
     - **game_id**: String that contains the current game's ID. e.g. '123456'
+    - **keep_history**: (not saved) Boolean. If False, histories only keep the last processed phase.
+      Default is True, except in simulation mode.
     - **lost**:
 
       - Contains a dictionary of centers that have been lost during the term
@@ -198,6 +200,9 @@ class Game(Jsonable):
     - **role**: Either a power name (for player game) or a value in diplomacy.utils.strings.ALL_ROLE_TYPES.
     - **rules**: Contains a list of active rules. e.g. ['NO_PRESS', ...]. Default is
       :const:`diplomacy.utils.constants.DEFAULT_GAME_RULES`.
+    - **simulation**: (not saved) Boolean. If True, game is a local headless simulation: Zobrist hash and
+      votes are not maintained, method process() does not return phase data, and histories only keep
+      the last processed phase unless keep_history is True. Set with ``Game(simulation=True)``.
     - **state_history**:
 
       - history of previous game states (returned by method get_state()) for this game.
@@ -285,11 +290,31 @@ class Game(Jsonable):
         "_phase_wrapper_type",
         "phase_abbr",
         "_unit_owner_cache",
+        "_power_messages_cache",
+        "_possible_orders_cache",
         "daide_port",
         "fixed_state",
+        "simulation",
+        "keep_history",
     ]
     zobrist_tables = {}
     rule_cache = ()
+    # Slots handled explicitly by Game.fork().
+    _fork_skipped_slots = (
+        "powers",
+        "renderer",
+        "fixed_state",
+        "_unit_owner_cache",
+        "_power_messages_cache",
+        "_possible_orders_cache",
+    )
+    # Slots that are immutable, or only ever replaced (never modified in place), and can be shared by forks.
+    _fork_shared_slots = (
+        "map",
+        "_phase_wrapper_type",
+        "convoy_paths_possible",
+        "convoy_paths_dest",
+    )
     model = {
         strings.CONTROLLED_POWERS: parsing.OptionalValueType(parsing.SequenceType(str)),
         strings.DAIDE_PORT: parsing.OptionalValueType(int),
@@ -392,6 +417,14 @@ class Game(Jsonable):
 
         # Caches
         self._unit_owner_cache = None  # {(unit, coast_required): owner}
+        # {'messages': indexed messages, 'count': nb indexed, 'inboxes': {power_name: ([message], [line])}}
+        self._power_messages_cache = None
+        self._possible_orders_cache = None  # (phase, {loc: {possible orders}})
+
+        # Simulation settings are not part of game model.
+        # They must be set before game begins, as units are hashed when added.
+        self.simulation = kwargs.pop("simulation", False)
+        self.keep_history = kwargs.pop("keep_history", not self.simulation)
 
         # Remove rules from kwargs (if present), as we want to add them manually using self.add_rule().
         rules = kwargs.pop(strings.RULES, None)
@@ -530,16 +563,52 @@ class Game(Jsonable):
 
         # Deep copying
         for key in self._slots:
-            if key in ["map", "renderer", "powers"]:
+            if key in ["map", "renderer", "powers", "_power_messages_cache", "_possible_orders_cache"]:
                 continue
             setattr(result, key, deepcopy(getattr(self, key)))
         setattr(result, "map", self.map)
+        setattr(result, "_power_messages_cache", None)
+        setattr(result, "_possible_orders_cache", None)
         setattr(result, "powers", {})
         for power in self.powers.values():
             result.powers[power.name] = deepcopy(power)
             setattr(result.powers[power.name], "game", result)
         return result
 
+    def fork(self):
+        """Return a lightweight copy of this game, e.g. for lookahead or evaluation.
+
+        Unlike ``deepcopy(game)``, phase histories (orders, messages, states, results) and current
+        phase messages are shared copy-on-write with the original game, as archived phases are never
+        modified in place. Only current phase state (powers, orders, adjudication fields) is copied,
+        so forking a game costs O(board) instead of O(game length).
+        The map is shared and no renderer is attached to the forked game.
+
+        :return: a new Game (same class as this game)
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+
+        for key in self._slots:
+            if key in self._fork_skipped_slots:
+                continue
+            value = getattr(self, key)
+            if key in self._fork_shared_slots:
+                setattr(result, key, value)
+            elif isinstance(value, SortedDict):
+                setattr(result, key, value.share())
+            else:
+                setattr(result, key, deepcopy(value))
+        result.renderer = None
+        result.fixed_state = None
+        result._unit_owner_cache = None
+        result._power_messages_cache = None
+        result._possible_orders_cache = None
+        result.powers = {
+            power_name: power.fork(result) for power_name, power in self.powers.items()
+        }
+        return result
+
     # ====================================================================
     #   Public Interface
     # ====================================================================
@@ -962,6 +1031,7 @@ class Game(Jsonable):
         self.clear_vote()
         self.clear_orders()
         self.messages.clear()
+        self._power_messages_cache = None
         assert isinstance(self.state_history, SortedDict)
         assert isinstance(self.order_history, SortedDict)
         assert isinstance(self.message_history, SortedDict)
@@ -1094,9 +1164,35 @@ class Game(Jsonable):
             message.time_sent = common.timestamp_microseconds()
 
         assert isinstance(self.messages, SortedDict)
+        # Messages are usually appended, so the per-power index can be updated in place.
+        appended = self._is_power_messages_cache_valid() and (
+            not self.messages or message.time_sent > self.messages.last_key()
+        )
         self.messages.put(message.time_sent, message)
+        if appended:
+            self._power_messages_cache["count"] += 1
+            self._index_power_message(self._power_messages_cache["inboxes"], message)
+        else:
+            self._power_messages_cache = None
         return message.time_sent
 
+    def get_power_messages(self, power_name):
+        """Return current phase messages visible to a power, i.e. messages sent or received by this power
+        and global messages, sorted by time sent.
+
+        :param power_name: name of the power (e.g. 'FRANCE')
+        :return: list of Message objects
+        """
+        return list(self._get_power_inbox(power_name)[0])
+
+    def get_power_message_lines(self, power_name):
+        """Return current phase messages visible to a power, rendered as text lines
+        (e.g. 'France -> England: Hello\\n'), sorted by time sent.
+
+        :param power_name: name of the power (e.g. 'FRANCE')
+        :return: list of strings
+        """
+        return list(self._get_power_inbox(power_name)[1])
     # Vote methods. For server and omniscient games only.
     # Observer game should not see votes.
     # Power game should know only vote of related power (votes for all other power should be 'neutral' in a power game).
@@ -1545,6 +1641,75 @@ class Game(Jsonable):
             else OrderSettings.ORDER_SET_EMPTY
         )
 
+    def validate_orders(self, power_name, orders):
+        """Validate a set of orders for a power against possible orders of current phase.
+        Orders are first expanded like in set_orders() (e.g. 'A PARIS BUR' becomes 'A PAR - BUR').
+        An order is valid if its location is orderable by the power and if it's a possible order for
+        this location. If many orders are given for a same location, only the last one is kept, like with
+        set_orders(). Possible orders are computed only once per phase (see get_all_possible_orders()),
+        so validation costs an order expansion and a set lookup per order.
+
+        :param power_name: The name of the power (e.g. 'FRANCE')
+        :param orders: The list of orders (e.g. ['A MAR - PAR', 'A PAR - BER', ...])
+        :return: a tuple (valid orders, invalid orders, reasons):
+
+            - valid orders: list of expanded valid orders, that can be set with set_orders(..., expand=False)
+            - invalid orders: list of invalid orders, as given
+            - reasons: list of errors (as in game error list), one per invalid order
+        """
+        if self._possible_orders_cache is None or self._possible_orders_cache[0] != self.phase:
+            self.get_all_possible_orders()
+        possible_orders = self._possible_orders_cache[1]
+        orderable_locations = set(self.get_orderable_locations(power_name))
+
+        valid_orders, invalid_orders, reasons = [], [], []
+        ordered_locations = {}  # {location: (index of its order in valid_orders, order as given)}
+        for order in orders:
+            if " ".join(order.upper().split()) == "WAIVE":
+                words = ["WAIVE"]
+                location = None
+                if not any("WAIVE" in possible_orders[loc] for loc in orderable_locations):
+                    invalid_orders.append(order)
+                    reasons.append(err.GAME_ORDER_NOT_ALLOWED % "WAIVE")
+                    continue
+            else:
+                # Expansion errors are returned as reasons and not kept in game errors.
+                nb_errors = len(self.error)
+                words = self._expand_phase_order(order) if order.strip() else []
+                expansion_errors = self.error[nb_errors:]
+                del self.error[nb_errors:]
+                normalized_order = " ".join(words)
+                if len(words) < 2:
+                    invalid_orders.append(order)
+                    reasons.append(
+                        expansion_errors[0] if expansion_errors else err.STD_GAME_BAD_ORDER % normalized_order
+                    )
+                    continue
+                location = words[1]
+                if location[:3] not in orderable_locations:
+                    invalid_orders.append(order)
+                    reasons.append(err.STD_GAME_UNORDERABLE_UNIT % normalized_order)
+                    continue
+                if normalized_order not in possible_orders.get(location, ()):
+                    invalid_orders.append(order)
+                    reasons.append(err.GAME_ORDER_NOT_ALLOWED % normalized_order)
+                    continue
+                location = location[:3]
+            normalized_order = " ".join(words)
+
+            # Replacing previous order for same location
+            if location in ordered_locations:
+                index, previous_order = ordered_locations[location]
+                invalid_orders.append(previous_order)
+                reasons.append(err.STD_GAME_UNIT_REORDERED % " ".join(valid_orders[index].split()[:2]))
+                valid_orders[index] = normalized_order
+                ordered_locations[location] = (index, order)
+            else:
+                if location is not None:
+                    ordered_locations[location] = (len(valid_orders), order)
+                valid_orders.append(normalized_order)
+        return valid_orders, invalid_orders, reasons
+
     def set_wait(self, power_name, wait):
         """Set wait flag for a power.
 
@@ -1607,6 +1772,7 @@ class Game(Jsonable):
         """Clears all caches"""
         self.convoy_paths_possible, self.convoy_paths_dest = None, None
         self._unit_owner_cache = None
+        self._possible_orders_cache = None
 
     def set_current_phase(self, new_phase):
         """Changes the phase to the specified new phase (e.g. 'S1901M')"""
@@ -1734,7 +1900,7 @@ class Game(Jsonable):
     def process(self):
         """Processes the current phase of the game.
 
-        :return: game phase data with data before processing.
+        :return: game phase data with data before processing, or None in simulation mode.
         """
         assert self.messages is not None
         assert isinstance(self.messages, SortedDict)
@@ -1760,9 +1926,17 @@ class Game(Jsonable):
 
         # result_history should have been updated with orders results for processed (previous) phase.
 
-        self.clear_vote()
+        if not self.simulation:
+            self.clear_vote()
         self.clear_orders()
         self.messages.clear()
+        self._power_messages_cache = None
+        if not self.keep_history:
+            # Only keep last processed phase.
+            previous_results = self.result_history[previous_phase]
+            for history in (self.order_history, self.message_history, self.state_history, self.result_history):
+                history.clear()
+            self.result_history.put(previous_phase, previous_results)
         self.order_history.put(previous_phase, previous_orders)
         self.message_history.put(previous_phase, previous_messages)
         self.state_history.put(previous_phase, previous_state)
@@ -1779,6 +1953,8 @@ class Game(Jsonable):
                     self.set_orders(power_name, [])
                     self.set_wait(power_name, False)
 
+        if self.simulation:
+            return None
         return GamePhaseData(
             name=str(previous_phase),
             state=previous_state,
@@ -1849,7 +2025,7 @@ class Game(Jsonable):
         :param is_home: Indicates that the location being added/removed is a home
         :return: Nothing
         """
-        if self.map is None:
+        if self.map is None or self.simulation:
             return
         zobrist = self.__class__.zobrist_tables[self.map_name]
         loc = loc[:3].upper() if is_center or is_home else loc.upper()
@@ -2062,6 +2238,7 @@ class Game(Jsonable):
 
         # Game is completed
         if self.get_current_phase() == "COMPLETED":
+            self._possible_orders_cache = (self.phase, possible_orders)
             return {loc: list(possible_orders[loc]) for loc in possible_orders}
 
         # Building a dict of (unit, is_dislodged, retreat_list, duplicate) for each power
@@ -2289,7 +2466,8 @@ class Game(Jsonable):
                         for loc in self.map.find_coasts(site):
                             possible_orders[loc].add("WAIVE")
 
-        # Returning
+        # Caching possible orders for validate_orders(), then returning
+        self._possible_orders_cache = (self.phase, possible_orders)
         return {loc: list(possible_orders[loc]) for loc in possible_orders}
 
     # ====================================================================
@@ -2313,16 +2491,14 @@ class Game(Jsonable):
         convoying_locs = set(convoying_locs)
 
         # Finding all possible convoy paths
-        for nb_fleets in range(1, len(convoying_locs) + 1):
-            for start, fleets, dests in self.map.convoy_paths[nb_fleets]:
-                if fleets.issubset(convoying_locs):
-                    self.convoy_paths_possible += [(start, fleets, dests)]
+        for start, fleets, dests in self.map.convoy_paths.get_possible_paths(convoying_locs):
+            self.convoy_paths_possible += [(start, fleets, dests)]
 
-                    # Marking path to dest
-                    self.convoy_paths_dest.setdefault(start, {})
-                    for dest in dests:
-                        self.convoy_paths_dest[start].setdefault(dest, [])
-                        self.convoy_paths_dest[start][dest] += [fleets]
+            # Marking path to dest
+            self.convoy_paths_dest.setdefault(start, {})
+            for dest in dests:
+                self.convoy_paths_dest[start].setdefault(dest, [])
+                self.convoy_paths_dest[start][dest] += [fleets]
 
     def _is_convoyer(self, army, loc):
         """Detects if there is a convoyer at thru location for army/fleet (e.g. can an army be convoyed through PAR)
@@ -3662,6 +3838,46 @@ class Game(Jsonable):
     # ====================================================================
     #   Private Interface - ORDER Submission methods
     # ====================================================================
+    def _expand_movement_order(self, word):
+        """Completes the expansion of a movement phase order as set_orders() does (coasts and unit types)
+
+        :param word: The order words, as returned by _expand_order() (e.g. ['PAR', '-', 'BUR'])
+        :return: The expanded order (e.g. ['A', 'PAR', '-', 'BUR']), adds error to self.error if any
+        """
+        assert self.map is not None
+        word = self._expand_coast(word)
+        word = self._add_unit_types(word)
+        word = self.map.default_coast(word)
+
+        # Last word is '?' - Removing it
+        if word and len(word[-1]) == 1 and not word[-1].isalpha():
+            word = word[:-1]
+        return word
+
+    def _expand_phase_order(self, order):
+        """Expands an order for current phase type as set_orders() does, before it is validated
+
+        :param order: The order (e.g. 'A PARIS BUR', 'A PAR-BUR', 'A MUN R BER', 'A PAR B')
+        :return: The expanded order words (e.g. ['A', 'PAR', '-', 'BUR']), adds error to self.error if any
+        """
+        if self.phase_type == "R":
+            word = self._add_unit_types(self._expand_order([order]))
+            # Add 'R' as order type for Retreat, 'D' for Disband
+            if len(word) > 3 and word[0] == "R":
+                del word[0]
+            if word and word[0] in "RD":
+                word = word[1:] + word[:1]
+            if len(word) == 4 and word[2] == "-":
+                word[2] = "R"
+            return word
+        if self.phase_type == "A":
+            word = self._expand_order([order])
+            if word and word[-1] == "D":
+                word = self._add_unit_types(word)
+            return word
+        word = self._expand_order(order.split())
+        return self._expand_movement_order(word) if len(word) >= 2 else word
+
     def _add_order(self, power, word, expand=True, replace=True):
         """Adds an order for a power
         :param power: The power instance issuing the order
@@ -3684,14 +3900,7 @@ class Game(Jsonable):
 
         if expand:
             # Check that the order is valid. If not, self.error will say why.
-            word = self._expand_order(word)
-            word = self._expand_coast(word)
-            word = self._add_unit_types(word)
-            word = self.map.default_coast(word)
-
-            # Last word is '?' - Removing it
-            if word and len(word[-1]) == 1 and not word[-1].isalpha():
-                word = word[:-1]
+            word = self._expand_movement_order(self._expand_order(word))
             if len(word) < 2:
                 return self.error.append(err.STD_GAME_BAD_ORDER % " ".join(word))
 
@@ -4153,10 +4362,53 @@ class Game(Jsonable):
         :return: 1 if the locations are adjacent for the move, 0 otherwise
         """
         assert self.map is not None
-        # Check if the map says the adjacency is good
-        if not self.map.abuts(unit_type, unit_loc, order_type, other_loc):
-            return 0
-        return 1
+        # The map abuts tables only contain 0 or 1
+        return self.map.abuts(unit_type, unit_loc, order_type, other_loc)
+
+    def _is_power_messages_cache_valid(self, power_messages_cache=None):
+        """Returns a boolean that indicates if the per-power message index (by default, the current one)
+        matches current messages"""
+        if power_messages_cache is None:
+            power_messages_cache = self._power_messages_cache
+        return (
+            power_messages_cache is not None
+            and power_messages_cache["messages"] is self.messages
+            and power_messages_cache["count"] == len(self.messages)
+        )
+
+    def _get_power_inbox(self, power_name):
+        """Returns the (messages, lines) lists visible to a power, (re)building the per-power message index if needed"""
+        power_messages_cache = self._power_messages_cache
+        if not self._is_power_messages_cache_valid(power_messages_cache):
+            # The index is built locally and published once complete, so that threads reading
+            # inboxes concurrently (e.g. parallel summaries) never see a partially built index.
+            inboxes = {name: ([], []) for name in self.powers}
+            for message in self.messages.values() if self.messages else ():
+                self._index_power_message(inboxes, message)
+            power_messages_cache = {
+                "messages": self.messages,
+                "count": len(self.messages) if self.messages else 0,
+                "inboxes": inboxes,
+            }
+            self._power_messages_cache = power_messages_cache
+        return power_messages_cache["inboxes"].get(power_name, ((), ()))
+
+    @staticmethod
+    def _index_power_message(inboxes, message):
+        """Adds a message to the given inboxes of the powers that can see it"""
+        if message.recipient == GLOBAL:
+            power_names = inboxes
+        else:
+            power_names = {message.sender, message.recipient}.intersection(inboxes)
+        line = "%s -> %s: %s\n" % (
+            message.sender.title(),
+            message.recipient.title(),
+            message.message,
+        )
+        for power_name in power_names:
+            power_messages, power_lines = inboxes[power_name]
+            power_messages.append(message)
+            power_lines.append(line)
 
     def _build_unit_owner_cache(self):
         """Builds the unit_owner cache"""
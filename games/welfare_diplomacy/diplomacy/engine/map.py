@@ -46,14 +46,18 @@ class Map:
 
     - **abbrev**: Contains the power abbreviation, otherwise defaults to first letter of PowerName
       e.g. {'ENGLISH': 'E'}
-    - **abuts_cache**: Contains a cache of abuts for ['A,'F'] between all locations for orders ['S', 'C', '-']
-      e.g. {(A, PAR, -, MAR): 1, ...}
+    - **abuts_tables**: Contains dense adjacency tables for ['A', 'F', '?'] and orders ['S', 'C', '-'], indexed
+      by location id. e.g. {('A', '-'): [bytearray(b'\\x00\\x01...'), ...], ...} where table[unit_id][other_id] is 1
+      if the locations are adjacent for the order
+    - **area_types**: Contains the area type of each location, indexed by location id
+      e.g. ['WATER', 'WATER', 'COAST', ...]
     - **aliases**: Contains a dict of all the aliases (e.g. full province name to 3 char)
       e.g. {'EAST': 'EAS', 'STP ( /SC )': 'STP/SC', 'FRENCH': 'FRANCE', 'BUDAPEST': 'BUD', 'NOR': 'NWY', ... }
     - **centers**: Contains a dict of owned supply centers for each player at the beginning of the map
       e.g. {'RUSSIA': ['MOS', 'SEV', 'STP', 'WAR'], 'FRANCE': ['BRE', 'MAR', 'PAR'], ... }
     - **convoy_paths**: Contains a list of all possible convoys paths bucketed by number of fleets
       format: {nb of fleets: [(START_LOC, {FLEET LOC}, {DEST LOCS})]}
+      (a read-only, memory-mapped ConvoyPathsIndex shared by all maps with the same name)
     - **dest_with_coasts**: Contains a dictionary of locs with all destinations (incl coasts) that can be reached
       e.g. {'PAR': ['BRE', 'PIC', 'BUR', ...], ...}
     - **dummies**: Indicates the list of powers that are dummies
@@ -78,6 +82,8 @@ class Map:
       e.g. {'LVP': ['CLY', 'edi', 'IRI', 'NAO', 'WAL', 'yor'], ...}
     - **loc_coasts**: Contains a mapping of all coasts for every location
       e.g. {'PAR': ['PAR'], 'BUL': ['BUL', 'BUL/EC', 'BUL/SC'], ... }
+    - **loc_ids**: Contains the integer id of each location (in upper case) used to index the adjacency tables
+      e.g. {'ADR': 0, 'AEG': 1, ..., 'BUL/EC': 15, 'BUL/SC': 16, 'BUL': 17, ...}
     - **loc_name**: Dict that indicates the 3 letter name of each location
       e.g. {'GULF OF LYON': 'LYO', 'BREST': 'BRE', 'BUDAPEST': 'BUD', 'RUHR': 'RUH', ... }
     - **loc_type**: Dict that indicates if each location is 'WATER', 'COAST', 'LAND', or 'PORT'
@@ -128,7 +134,9 @@ class Map:
         "validated",
         "flow_sign",
         "root_map",
-        "abuts_cache",
+        "abuts_tables",
+        "area_types",
+        "loc_ids",
         "homes",
         "loc_name",
         "loc_type",
@@ -181,7 +189,7 @@ class Map:
         self.first_year = 1901
         self.victory = self.phase = self.validated = self.flow_sign = None
         self.root_map = None
-        self.abuts_cache = {}
+        self.abuts_tables, self.area_types, self.loc_ids = {}, [], {}
         self.homes, self.loc_name, self.loc_type, self.loc_abut, self.loc_coasts = (
             {},
             {},
@@ -212,9 +220,11 @@ class Map:
         self.load()
         self.build_cache()
         self.validate()
-        if name not in CONVOYS_PATH_CACHE and use_cache:
-            CONVOYS_PATH_CACHE[name] = add_to_cache(name)
-        self.convoy_paths = CONVOYS_PATH_CACHE.get(name, {})
+        if name not in CONVOYS_PATH_CACHE:
+            convoy_paths = get_convoy_paths_index(name, build=use_cache)
+            if convoy_paths is not None:
+                CONVOYS_PATH_CACHE[name] = convoy_paths
+        self.convoy_paths = CONVOYS_PATH_CACHE.get(name, EMPTY_CONVOY_PATHS)
         if use_cache:
             MAP_CACHE[name] = self
 
@@ -856,15 +866,38 @@ class Map:
                 if loc.upper()[:3] == map_loc.upper()[:3]
             ]
 
-        # Building abuts cache
+        # Assigning an integer id to every location
+        self.area_types = [self.area_type(loc) for loc in self.locs]
+        self.loc_ids = {loc.upper(): loc_id for loc_id, loc in enumerate(self.locs)}
+
+        # Building abuts tables
+        # Only locations sharing their first 3 letters with an adjacency can abut, so the other locations are skipped
+        nb_locs = len(self.locs)
         for unit_type in ["A", "F"]:
-            for unit_loc in self.locs:
-                for other_loc in self.locs:
+            for order_type in ["-", "S", "C"]:
+                self.abuts_tables[(unit_type, order_type)] = [
+                    bytearray(nb_locs) for _ in range(nb_locs)
+                ]
+        for unit_loc, unit_loc_id in self.loc_ids.items():
+            abut_prefixes = {place.upper()[:3] for place in self.abut_list(unit_loc)}
+            for other_loc, other_loc_id in self.loc_ids.items():
+                if other_loc[:3] not in abut_prefixes:
+                    continue
+                for unit_type in ["A", "F"]:
                     for order_type in ["-", "S", "C"]:
-                        # Calculating and setting in cache
-                        unit_loc, other_loc = unit_loc.upper(), other_loc.upper()
-                        query_tuple = (unit_type, unit_loc, order_type, other_loc)
-                        self.abuts_cache[query_tuple] = self._abuts(*query_tuple)
+                        self.abuts_tables[(unit_type, order_type)][unit_loc_id][
+                            other_loc_id
+                        ] = self._abuts(unit_type, unit_loc, order_type, other_loc)
+
+        # Unknown unit types ('?') abut if either an army or a fleet would
+        for order_type in ["-", "S", "C"]:
+            self.abuts_tables[("?", order_type)] = [
+                bytearray(army | fleet for army, fleet in zip(army_row, fleet_row))
+                for army_row, fleet_row in zip(
+                    self.abuts_tables[("A", order_type)],
+                    self.abuts_tables[("F", order_type)],
+                )
+            ]
 
         # Building dest_with_coasts
         for loc in self.locs:
@@ -968,6 +1001,11 @@ class Map:
             if loc.startswith(place):
                 self.loc_type.pop(loc)
 
+        # Removing loc_ids (the location can no longer be found in the abuts tables)
+        for loc in list(self.loc_ids):
+            if loc.startswith(place):
+                self.loc_ids.pop(loc)
+
     def norm_power(self, power):
         """Normalise the name of a power (removes spaces)
 
@@ -1261,6 +1299,9 @@ class Map:
         :param loc: The name of the location to query
         :return: Type of the location ('WATER', 'COAST', 'PORT', 'LAND', 'SHUT')
         """
+        loc_id = self.loc_ids.get(loc)
+        if loc_id is not None:
+            return self.area_types[loc_id]
         return self.loc_type.get(loc.upper()) or self.loc_type.get(loc.lower())
 
     def default_coast(self, word):
@@ -1300,28 +1341,31 @@ class Map:
     def abuts(self, unit_type, unit_loc, order_type, other_loc):
         """Determines if a order for unit_type from unit_loc to other_loc is adjacent.
 
-        **Note**: This method uses the precomputed cache
+        **Note**: This method uses the precomputed abuts tables
 
-        :param unit_type: The type of unit ('A' or 'F')
+        :param unit_type: The type of unit ('A', 'F' or '?')
         :param unit_loc: The location of the unit ('BUR', 'BUL/EC')
         :param order_type: The type of order ('S' for Support, 'C' for Convoy', '-' for move)
         :param other_loc: The location of the other unit
         :return: 1 if the locations are adjacent for the move, 0 otherwise
         """
-        if unit_type == "?":
-            return self.abuts_cache.get(
-                ("A", unit_loc.upper(), order_type, other_loc.upper()), 0
-            ) or self.abuts_cache.get(
-                ("F", unit_loc.upper(), order_type, other_loc.upper()), 0
-            )
-
-        query_tuple = (unit_type, unit_loc.upper(), order_type, other_loc.upper())
-        return self.abuts_cache.get(query_tuple, 0)
+        table = self.abuts_tables.get((unit_type, order_type))
+        if table is None:
+            return 0
+        unit_loc_id = self.loc_ids.get(unit_loc)
+        if unit_loc_id is None:
+            unit_loc_id = self.loc_ids.get(unit_loc.upper())
+        other_loc_id = self.loc_ids.get(other_loc)
+        if other_loc_id is None:
+            other_loc_id = self.loc_ids.get(other_loc.upper())
+        if unit_loc_id is None or other_loc_id is None:
+            return 0
+        return table[unit_loc_id][other_loc_id]
 
     def _abuts(self, unit_type, unit_loc, order_type, other_loc):
         """Determines if a order for unit_type from unit_loc to other_loc is adjacent
 
-        **Note**: This method is used to generate the abuts_cache
+        **Note**: This method is used to generate the abuts_tables
 
         :param unit_type: The type of unit ('A' or 'F')
         :param unit_loc: The location of the unit ('BUR', 'BUL/EC')
@@ -1672,8 +1716,11 @@ class Map:
 
 # Loading at the bottom, to avoid load recursion
 from games.welfare_diplomacy.diplomacy.utils.convoy_paths import (
-    add_to_cache,
-    get_convoy_paths_cache,
+    get_convoy_paths_index,
+)  # pylint: disable=wrong-import-position
+from games.welfare_diplomacy.diplomacy.utils.convoy_paths_index import (
+    EMPTY_CONVOY_PATHS,
 )  # pylint: disable=wrong-import-position
 
-CONVOYS_PATH_CACHE = get_convoy_paths_cache()
+# Memory-mapped convoy paths index, loaded lazily for each map name
+CONVOYS_PATH_CACHE = {}
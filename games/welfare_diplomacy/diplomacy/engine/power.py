@@ -149,6 +149,37 @@ class Power(Jsonable):
         setattr(result, 'game', None)
         return result
 
+    def fork(self, game=None):
+        """ Lightweight copy used by :meth:`diplomacy.Game.fork`.
+            Board state (units, centers, orders, retreats, ...) is copied, controller history is shared
+            copy-on-write.
+
+            :param game: the game object the new power belongs to.
+            :return: a new Power
+        """
+        cls = self.__class__
+        result = cls.__new__(cls)
+        result.game = game
+        result.name = self.name
+        result.abbrev = self.abbrev
+        result.role = self.role
+        result.adjust = list(self.adjust)
+        result.centers = list(self.centers)
+        result.units = list(self.units)
+        result.influence = list(self.influence)
+        result.homes = list(self.homes) if self.homes is not None else None
+        result.welfare_points = self.welfare_points
+        result.retreats = {unit: list(locs) for unit, locs in self.retreats.items()}
+        result.goner = self.goner
+        result.civil_disorder = self.civil_disorder
+        result.orders = dict(self.orders)
+        result.controller = self.controller.share()
+        result.vote = self.vote
+        result.order_is_set = self.order_is_set
+        result.wait = self.wait
+        result.tokens = set(self.tokens)
+        return result
+
     def reinit(self, include_flags=6):
         """ Performs a reinitialization of some of the parameters
 
@@ -129,29 +129,27 @@ class Notifier:
             :type previous_phase_data: diplomacy.utils.game_phase_data.GamePhaseData
             :type current_phase_data: diplomacy.utils.game_phase_data.GamePhaseData
         """
-        # Send game updates to observers ans omniscient observers..
-        for game_role, token in server_game.get_observer_addresses():
-            yield self._notify(notifications.GameProcessed(
-                token=token,
-                game_id=server_game.game_id,
-                game_role=game_role,
-                previous_phase_data=server_game.filter_phase_data(previous_phase_data, strings.OBSERVER_TYPE, False),
-                current_phase_data=server_game.filter_phase_data(current_phase_data, strings.OBSERVER_TYPE, True)
-            ))
-        for game_role, token in server_game.get_omniscient_addresses():
-            yield self._notify(notifications.GameProcessed(
-                token=token,
-                game_id=server_game.game_id,
-                game_role=game_role,
-                previous_phase_data=server_game.filter_phase_data(previous_phase_data, strings.OMNISCIENT_TYPE, False),
-                current_phase_data=server_game.filter_phase_data(current_phase_data, strings.OMNISCIENT_TYPE, True)))
-        # Send game updates to powers.
-        for power in server_game.powers.values():
-            yield self._notify_power(server_game.game_id, power, notifications.GameProcessed,
-                                     previous_phase_data=server_game.filter_phase_data(
-                                         previous_phase_data, power.name, False),
-                                     current_phase_data=server_game.filter_phase_data(
-                                         current_phase_data, power.name, True))
+        # Phase data is filtered and encoded once per view (observer, omniscient or power),
+        # then shared by all tokens with this view.
+        views = [(strings.OBSERVER_TYPE, list(server_game.get_observer_addresses())),
+                 (strings.OMNISCIENT_TYPE, list(server_game.get_omniscient_addresses()))]
+        views.extend((power.name, [(power.name, token) for token in power.tokens])
+                     for power in server_game.powers.values())
+        for view, addresses in views:
+            if not addresses:
+                continue
+            view_previous_phase_data = server_game.filter_phase_data(previous_phase_data, view, False)
+            view_current_phase_data = server_game.filter_phase_data(current_phase_data, view, True)
+            encoded_params = notifications.GameProcessed.encode_params(view_previous_phase_data,
+                                                                       view_current_phase_data)
+            for game_role, token in addresses:
+                notification = notifications.GameProcessed(token=token,
+                                                           game_id=server_game.game_id,
+                                                           game_role=game_role,
+                                                           previous_phase_data=view_previous_phase_data,
+                                                           current_phase_data=view_current_phase_data)
+                notification.encoded_params = encoded_params
+                yield self._notify(notification)
         # Also send wait flag for each power.
         for power in server_game.powers.values():
             yield self.notify_power_wait_flag(server_game, power, power.wait)
@@ -167,6 +167,26 @@ def on_create_game(server, request, connection_handler):
 
     return responses.DataGame(data=client_game, request_id=request.request_id)
 
+def _remove_deleted_account_from_game(server_game, server, token):
+    """ Remove tokens and usernames no longer in server from given game, after an account was deleted.
+
+        :param server_game: game to update
+        :param server: server which received the DeleteAccount request.
+        :param token: token which sent the DeleteAccount request.
+        :type server_game: diplomacy.server.server_game.ServerGame
+        :type server: diplomacy.Server
+    """
+    server_game.filter_tokens(server.users.has_token)
+    filter_status = server_game.filter_usernames(server.users.has_username)
+
+    # If this account was a player for this game, notify game about new dummy powers.
+    if filter_status > 0:
+        server.stop_game_if_needed(server_game)
+        Notifier(server, ignore_tokens=[token]).notify_game_powers_controllers(server_game)
+
+    # Require game disk backup.
+    server.save_game(server_game)
+
 def on_delete_account(server, request, connection_handler):
     """ Manage request DeleteAccount.
 
@@ -201,16 +221,7 @@ def on_delete_account(server, request, connection_handler):
         # Remove tokens related to this account from loaded server games.
         # Unregister this account from moderators, omniscient observers and players of loaded games.
         for server_game in server.games.values():  # type: ServerGame
-            server_game.filter_tokens(server.users.has_token)
-            filter_status = server_game.filter_usernames(server.users.has_username)
-
-            # If this account was a player for this game, notify game about new dummy powers.
-            if filter_status > 0:
-                server.stop_game_if_needed(server_game)
-                Notifier(server, ignore_tokens=[token]).notify_game_powers_controllers(server_game)
-
-            # Require game disk backup.
-            server.save_game(server_game)
+            server.run_when_game_idle(server_game, _remove_deleted_account_from_game, server, token)
 
         # Require server data disk backup.
         server.save_data()
@@ -954,8 +965,8 @@ def on_set_grade(server, request, connection_handler):
 
                 # We check games where user is not explicitly allowed to be moderator or omniscient.
                 if not server_game.is_moderator(username) and not server_game.is_omniscient(username):
-                    transfer_special_tokens(server_game, server, username, grade_update,
-                                            grade_update == strings.PROMOTE)
+                    server.run_when_game_idle(server_game, transfer_special_tokens, server, username, grade_update,
+                                              grade_update == strings.PROMOTE)
 
     else:
         # Requested omniscient or moderator grade update for a specific game.
@@ -1238,6 +1249,15 @@ MAPPING = {
     requests.Vote: on_vote,
 }
 
+@gen.coroutine
+def _handle_request_after_process(server, request, connection_handler):
+    """ (coroutine) Wait for game targeted by given request to be processed, then handle request.
+        See handle_request() for parameters and returned value.
+    """
+    yield server.wait_game_processed(request.game_id)
+    response = yield handle_request(server, request, connection_handler)
+    return response
+
 def handle_request(server, request, connection_handler):
     """ (coroutine) Find request handler function for associated request, run it and return its result.
 
@@ -1251,6 +1271,10 @@ def handle_request(server, request, connection_handler):
     request_handler_fn = MAPPING.get(type(request), None)
     if not request_handler_fn:
         raise exceptions.RequestException()
+    game_id = getattr(request, 'game_id', None)
+    if game_id is not None and server.is_game_in_process(game_id):
+        # Game is being processed by an adjudication worker. Handle request once processing is done.
+        return _handle_request_after_process(server, request, connection_handler)
     if gen.is_coroutine_function(request_handler_fn):
         # Throw the future returned by this coroutine.
         return request_handler_fn(server, request, connection_handler)
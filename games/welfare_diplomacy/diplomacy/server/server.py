@@ -48,6 +48,9 @@
     - **backup_delay_seconds**: (int) number of seconds to wait between two consecutive full server backup
       on disk (default 10 minutes)
     - **ping_seconds**: (int) ping period used by server to check is connected sockets are alive.
+    - **nb_adjudication_workers**: (int) number of games server can process (adjudicate) at the same time.
+      Games are processed in worker threads, so that IO loop keeps handling requests and notifications
+      of other games while a game is processed. (default 4)
     - **max_games**: (int) maximum number of games server accepts to create.
       If there are at least such number of games on server, server will not accept
       further game creation requests. If 0, no limit. (default 0)
@@ -57,6 +60,7 @@
 """
 import atexit
 import base64
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import os
 from random import randint
@@ -69,6 +73,7 @@ import tornado.web
 from tornado import gen
 from tornado.ioloop import IOLoop
 from tornado.iostream import StreamClosedError
+from tornado.locks import Event
 from tornado.queues import Queue
 from tornado.websocket import WebSocketClosedError
 
@@ -81,6 +86,8 @@ from games.welfare_diplomacy.diplomacy.server.connection_handler import Connecti
 from games.welfare_diplomacy.diplomacy.server.notifier import Notifier
 from games.welfare_diplomacy.diplomacy.server.scheduler import Scheduler
 from games.welfare_diplomacy.diplomacy.server.server_game import ServerGame
+from games.welfare_diplomacy.diplomacy.server.storage import (GameJournal, delete_game_files, get_game_filename,
+                                                              load_game_dict, load_json_from_disk, save_json_on_disk)
 from games.welfare_diplomacy.diplomacy.server.users import Users
 from games.welfare_diplomacy.diplomacy.engine.map import Map
 from games.welfare_diplomacy.diplomacy.utils import common, exceptions, strings, constants
@@ -104,39 +111,6 @@ def get_absolute_path(directory=None):
     """
     return os.path.abspath(directory or os.getcwd())
 
-def get_backup_filename(filename):
-    """ Return a backup filename from given filename (given filename with a special suffix). """
-    return '%s.backup' % filename
-
-def save_json_on_disk(filename, json_dict):
-    """ Save given JSON dictionary into given filename and back-up previous file version if exists. """
-    if os.path.exists(filename):
-        os.rename(filename, get_backup_filename(filename))
-    with open(filename, 'w') as file:
-        json.dump(json_dict, file)
-
-def load_json_from_disk(filename):
-    """ Return a JSON dictionary loaded from given filename.
-        If JSON parsing fail for given filename, try to load JSON dictionary for a backup file
-        (if present) and rename backup file to given filename
-        (backup file becomes current file versions).
-
-        :param filename: file path to open
-        :return: JSON dictionary loaded from file
-        :rtype: dict
-    """
-    try:
-        with open(filename, 'rb') as file:
-            json_dict = json.load(file)
-    except ValueError as exception:
-        backup_filename = get_backup_filename(filename)
-        if not os.path.isfile(backup_filename):
-            raise exception
-        with open(backup_filename, 'rb') as backup_file:
-            json_dict = json.load(backup_file)
-        os.rename(backup_filename, filename)
-    return json_dict
-
 def ensure_path(folder_path):
     """ Make sure given folder path exists and return given path.
         Raises an exception if path does not exists, cannot be created or is not a folder.
@@ -197,7 +171,8 @@ class Server:
     """ Server class. """
     __slots__ = ['data_path', 'games_path', 'available_maps', 'maps_mtime', 'notifications',
                  'games_scheduler', 'allow_registrations', 'max_games', 'remove_canceled_games', 'users', 'games',
-                 'daide_servers', 'backup_server', 'backup_games', 'backup_delay_seconds', 'ping_seconds',
+                 'daide_servers', 'backup_server', 'backup_games', 'game_journals', 'backup_delay_seconds',
+                 'ping_seconds', 'nb_adjudication_workers', 'adjudication_executor', 'games_in_process',
                  'interruption_handler', 'backend', 'games_with_dummy_powers', 'dispatched_dummy_powers']
 
     # Servers cache.
@@ -236,6 +211,12 @@ class Server:
         self.games_scheduler = Scheduler(1, self._process_game)
         self.backup_server = None
         self.backup_games = {}
+        self.game_journals = {}  # type: Dict[str, GameJournal]
+        # Executor running game processing. Initialized when server tasks are set.
+        self.adjudication_executor = None  # type: ThreadPoolExecutor
+        # Dictionary mapping ID of a game currently processed by an adjudication worker
+        # to an event set when processing is done.
+        self.games_in_process = {}  # type: Dict[str, Event]
         self.interruption_handler = InterruptionHandler(self)
         # Backend objects used to run server. If None, server is not yet started.
         # Initialized when you call Server.start() (see method below).
@@ -247,6 +228,7 @@ class Server:
         self.remove_canceled_games = False
         self.backup_delay_seconds = constants.DEFAULT_BACKUP_DELAY_SECONDS
         self.ping_seconds = constants.DEFAULT_PING_SECONDS
+        self.nb_adjudication_workers = constants.DEFAULT_NB_ADJUDICATION_WORKERS
         self.users = None  # type: Users  # Users and administrators usernames.
         self.available_maps = {}  # type: Dict[str, List[str]] # {"map_name" => list("map_power")}
         self.maps_mtime = 0  # Latest maps modification date (used to manage maps cache in server object).
@@ -276,8 +258,11 @@ class Server:
         self.remove_canceled_games = bool(kwargs.pop(strings.REMOVE_CANCELED_GAMES, self.remove_canceled_games))
         self.backup_delay_seconds = int(kwargs.pop(strings.BACKUP_DELAY_SECONDS, self.backup_delay_seconds))
         self.ping_seconds = int(kwargs.pop(strings.PING_SECONDS, self.ping_seconds))
+        self.nb_adjudication_workers = int(kwargs.pop(strings.NB_ADJUDICATION_WORKERS, self.nb_adjudication_workers))
         assert not kwargs
+        assert self.nb_adjudication_workers > 0
         LOGGER.debug('Ping        : %s', self.ping_seconds)
+        LOGGER.debug('Adjudication workers: %s', self.nb_adjudication_workers)
         LOGGER.debug('Backup delay: %s', self.backup_delay_seconds)
 
         # Add server on servers cache.
@@ -292,7 +277,7 @@ class Server:
         """ Load a dictionary (self.available_maps) mapping every map name to a dict of map info.
             for all maps available in diplomacy package.
         """
-        diplomacy_map_dir = os.path.join(diplomacy.settings.PACKAGE_DIR, strings.MAPS)
+        diplomacy_map_dir = os.path.join(games.welfare_diplomacy.diplomacy.settings.PACKAGE_DIR, strings.MAPS)
         new_maps_mtime = self.maps_mtime
         for filename in os.listdir(diplomacy_map_dir):
             if filename.endswith('.map'):
@@ -330,6 +315,8 @@ class Server:
             self.allow_registrations = server_info[strings.ALLOW_REGISTRATIONS]
             self.backup_delay_seconds = server_info[strings.BACKUP_DELAY_SECONDS]
             self.ping_seconds = server_info[strings.PING_SECONDS]
+            self.nb_adjudication_workers = server_info.get(strings.NB_ADJUDICATION_WORKERS,
+                                                           self.nb_adjudication_workers)
             self.max_games = server_info[strings.MAX_GAMES]
             self.remove_canceled_games = server_info[strings.REMOVE_CANCELED_GAMES]
             self.users = Users.from_dict(server_info[strings.USERS])
@@ -377,11 +364,15 @@ class Server:
         if force:
             for server_game in self.games.values():
                 self.save_game(server_game)
-        for game_id, game_dict in self.backup_games.items():
-            game_path = os.path.join(self.games_path, '%s.json' % game_id)
-            save_json_on_disk(game_path, game_dict)
+        for game_id in list(self.backup_games):
+            if game_id in self.games_in_process:
+                # Game is currently modified by an adjudication worker. It will be saved at next backup.
+                continue
+            server_game = self.backup_games.pop(game_id)
+            if game_id not in self.game_journals:
+                self.game_journals[game_id] = GameJournal(self.games_path, game_id)
+            self.game_journals[game_id].save(server_game)
             LOGGER.info('Game data saved: %s', game_id)
-        self.backup_games.clear()
 
     def backup_now(self, force=False):
         """ Save backup of server data and loaded games immediately.
@@ -401,7 +392,15 @@ class Server:
             :type server_game: ServerGame
         """
         LOGGER.debug('Processing game %s (status %s).', server_game.game_id, server_game.status)
-        previous_phase_data, current_phase_data, kicked_powers = server_game.process()
+        # Game is processed in an adjudication worker, so that IO loop can still handle other games.
+        # Requests on this game wait until processing is done (see wait_game_processed()).
+        processed_event = self.games_in_process[server_game.game_id] = Event()
+        try:
+            previous_phase_data, current_phase_data, kicked_powers = yield IOLoop.current().run_in_executor(
+                self.adjudication_executor, server_game.process)
+        finally:
+            del self.games_in_process[server_game.game_id]
+            processed_event.set()
         self.save_game(server_game)
 
         if previous_phase_data is None and kicked_powers is None:
@@ -437,6 +436,43 @@ class Server:
         # Game must be stopped if not active.
         return not server_game.is_game_active
 
+    def is_game_in_process(self, game_id):
+        """ Return True if given game ID is currently processed by an adjudication worker. """
+        return game_id in self.games_in_process
+
+    @gen.coroutine
+    def wait_game_processed(self, game_id):
+        """ Wait until given game ID is no longer processed by an adjudication worker.
+
+            :param game_id: ID of game to wait for.
+        """
+        while game_id in self.games_in_process:
+            yield self.games_in_process[game_id].wait()
+
+    def run_when_game_idle(self, server_game, callback, *args):
+        """ Call ``callback(server_game, *args)`` on IO loop thread once given game is not processed
+            by an adjudication worker. If game is not currently processed, callback is called immediately.
+            Otherwise, callback is called later, so that a game is never modified while it is processed.
+
+            :param server_game: game to update
+            :param callback: function to call with given game and args
+            :param args: additional arguments to pass to callback
+            :type server_game: ServerGame
+        """
+        if server_game.game_id in self.games_in_process:
+            IOLoop.current().spawn_callback(self._run_after_game_processed, server_game, callback, *args)
+        else:
+            callback(server_game, *args)
+
+    @gen.coroutine
+    def _run_after_game_processed(self, server_game, callback, *args):
+        """ (coroutine) Wait for given game to be processed, then call ``callback(server_game, *args)``.
+            Callback is not called if game was deleted from server in the meantime.
+        """
+        yield self.wait_game_processed(server_game.game_id)
+        if self.games.get(server_game.game_id) is server_game:
+            callback(server_game, *args)
+
     @gen.coroutine
     def _task_save_database(self):
         """ IO loop callable: save database and loaded games periodically.
@@ -468,8 +504,12 @@ class Server:
         """
         io_loop.add_callback(self._task_save_database)
         io_loop.add_callback(self._task_send_notifications)
-        # These both coroutines are used to manage games.
-        io_loop.add_callback(self.games_scheduler.process_tasks)
+        # These coroutines are used to manage games.
+        # One task consumer is started per adjudication worker, so that many games can be processed at once.
+        self.adjudication_executor = ThreadPoolExecutor(max_workers=self.nb_adjudication_workers,
+                                                        thread_name_prefix='adjudication')
+        for _ in range(self.nb_adjudication_workers):
+            io_loop.add_callback(self.games_scheduler.process_tasks)
         io_loop.add_callback(self.games_scheduler.schedule)
         # Set callback on KeyboardInterrupt.
         signal.signal(signal.SIGINT, self.interruption_handler.handler)
@@ -537,6 +577,7 @@ class Server:
             strings.ALLOW_REGISTRATIONS: self.allow_registrations,
             strings.BACKUP_DELAY_SECONDS: self.backup_delay_seconds,
             strings.PING_SECONDS: self.ping_seconds,
+            strings.NB_ADJUDICATION_WORKERS: self.nb_adjudication_workers,
             strings.MAX_GAMES: self.max_games,
             strings.REMOVE_CANCELED_GAMES: self.remove_canceled_games,
             strings.USERS: self.users.to_dict(),
@@ -545,12 +586,13 @@ class Server:
         }
 
     def save_game(self, server_game):
-        """ Update on-memory version of given server game.
+        """ Register given server game to be saved on disk at next backup.
+            Only game changes since previous backup are then written (see :class:`GameJournal`).
 
             :param server_game: server game
             :type server_game: ServerGame
         """
-        self.backup_games[server_game.game_id] = server_game.to_dict()
+        self.backup_games[server_game.game_id] = server_game
         # Check dummy powers for a game every time we have to save it.
         self.register_dummy_power_names(server_game)
 
@@ -617,7 +659,7 @@ class Server:
         """ Return True if server database contains such game ID. """
         if game_id in self.games:
             return True
-        expected_game_path = os.path.join(self.games_path, '%s.json' % game_id)
+        expected_game_path = get_game_filename(self.games_path, game_id)
         return os.path.exists(expected_game_path) and os.path.isfile(expected_game_path)
 
     def load_game(self, game_id):
@@ -639,11 +681,11 @@ class Server:
         """
         if game_id in self.games:
             return self.games[game_id]
-        game_filename = os.path.join(ensure_path(self.games_path), '%s.json' % game_id)
+        game_filename = get_game_filename(ensure_path(self.games_path), game_id)
         if not os.path.isfile(game_filename):
             raise exceptions.GameIdException()
         try:
-            server_game = ServerGame.from_dict(load_json_from_disk(game_filename))  # type: ServerGame
+            server_game = ServerGame.from_dict(load_game_dict(self.games_path, game_id))  # type: ServerGame
             server_game.server = self
             server_game.filter_usernames(self.users.has_username)
             server_game.filter_tokens(self.users.has_token)
@@ -708,14 +750,10 @@ class Server:
         """
         if not (server_game.is_game_canceled or server_game.is_game_completed):
             server_game.set_status(strings.CANCELED)
-        game_filename = os.path.join(self.games_path, '%s.json' % server_game.game_id)
-        backup_game_filename = get_backup_filename(game_filename)
-        if os.path.isfile(game_filename):
-            os.remove(game_filename)
-        if os.path.isfile(backup_game_filename):
-            os.remove(backup_game_filename)
+        delete_game_files(self.games_path, server_game.game_id)
         self.games.pop(server_game.game_id, None)
         self.backup_games.pop(server_game.game_id, None)
+        self.game_journals.pop(server_game.game_id, None)
         self.games_with_dummy_powers.pop(server_game.game_id, None)
         self.dispatched_dummy_powers.pop(server_game.game_id, None)
         # Stop DAIDE server associated to this game.
@@ -834,14 +872,24 @@ class Server:
     def remove_token(self, token):
         """ Disconnect given token from related user and loaded games. Stop related games if needed,
             e.g. if a game does not have anymore expected number of controlled powers.
+            Games currently processed by an adjudication worker are updated once processing is done.
         """
         self.users.disconnect_token(token)
         for server_game in self.games.values():  # type: ServerGame
-            server_game.remove_token(token)
-            self.stop_game_if_needed(server_game)
-            self.save_game(server_game)
+            self.run_when_game_idle(server_game, self._remove_game_token, token)
         self.save_data()
 
+    def _remove_game_token(self, server_game, token):
+        """ Disconnect given token from given game, stop game if needed and require game backup.
+
+            :param server_game: game to update
+            :param token: token to disconnect
+            :type server_game: ServerGame
+        """
+        server_game.remove_token(token)
+        self.stop_game_if_needed(server_game)
+        self.save_game(server_game)
+
     def assert_token(self, token, connection_handler):
         """ Check if given token is associated to an user, check if token is still valid,
             and link token to given connection handler. If any step failed, raise an exception.
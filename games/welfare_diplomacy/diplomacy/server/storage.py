@@ -0,0 +1,212 @@
+# ==============================================================================
+# Copyright (C) 2019 - Philip Paquette, Steven Bocco
+#
+#  This program is free software: you can redistribute it and/or modify it under
+#  the terms of the GNU Affero General Public License as published by the Free
+#  Software Foundation, either version 3 of the License, or (at your option) any
+#  later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#  FOR A PARTICULAR PURPOSE.  See the GNU Affero General Public License for more
+#  details.
+#
+#  You should have received a copy of the GNU Affero General Public License along
+#  with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ==============================================================================
+""" Disk storage of server data and games.
+
+    Each game is stored in a snapshot file ``<game_id>.json`` (full game JSON dictionary)
+    and an append-only journal file ``<game_id>.journal``. Each journal line is a JSON dictionary
+    with the game fields which are not phase histories (current state, powers, messages, etc.)
+    and the history phases added since previous journal line. So, cost of a game save is proportional
+    to what changed in game, not to game length.
+
+    Journal is compacted into a new snapshot once it becomes larger than snapshot.
+    A game is loaded by replaying journal lines over snapshot. Snapshot and journal lines share a journal ID,
+    so that journal lines remaining from an interrupted compaction are ignored.
+"""
+import logging
+import os
+import uuid
+
+import ujson as json
+
+from games.welfare_diplomacy.diplomacy.utils import parsing, strings
+
+LOGGER = logging.getLogger(__name__)
+
+# Game fields saved phase by phase in journal.
+HISTORY_FIELDS = (strings.MESSAGE_HISTORY, strings.ORDER_HISTORY, strings.RESULT_HISTORY, strings.STATE_HISTORY)
+
+# Keys used in snapshot and journal lines.
+JOURNAL_ID = 'journal_id'
+JOURNAL_GAME = 'game'
+JOURNAL_HISTORY = 'history'
+
+def get_backup_filename(filename):
+    """ Return a backup filename from given filename (given filename with a special suffix). """
+    return '%s.backup' % filename
+
+def save_json_on_disk(filename, json_dict):
+    """ Save given JSON dictionary into given filename and back-up previous file version if exists. """
+    if os.path.exists(filename):
+        os.rename(filename, get_backup_filename(filename))
+    with open(filename, 'w') as file:
+        json.dump(json_dict, file)
+
+def load_json_from_disk(filename):
+    """ Return a JSON dictionary loaded from given filename.
+        If JSON parsing fail for given filename, try to load JSON dictionary for a backup file
+        (if present) and rename backup file to given filename
+        (backup file becomes current file versions).
+
+        :param filename: file path to open
+        :return: JSON dictionary loaded from file
+        :rtype: dict
+    """
+    try:
+        with open(filename, 'rb') as file:
+            json_dict = json.load(file)
+    except ValueError as exception:
+        backup_filename = get_backup_filename(filename)
+        if not os.path.isfile(backup_filename):
+            raise exception
+        with open(backup_filename, 'rb') as backup_file:
+            json_dict = json.load(backup_file)
+        os.rename(backup_filename, filename)
+    return json_dict
+
+def get_game_filename(games_path, game_id):
+    """ Return path of snapshot file for given game ID. """
+    return os.path.join(games_path, '%s.json' % game_id)
+
+def get_journal_filename(games_path, game_id):
+    """ Return path of journal file for given game ID. """
+    return os.path.join(games_path, '%s.journal' % game_id)
+
+def load_game_dict(games_path, game_id):
+    """ Return JSON dictionary of given game, loaded from game snapshot and replayed journal.
+
+        :param games_path: folder containing games files.
+        :param game_id: ID of game to load.
+        :return: game JSON dictionary
+        :rtype: dict
+    """
+    game_dict = load_json_from_disk(get_game_filename(games_path, game_id))
+    journal_id = game_dict.pop(JOURNAL_ID, None)
+    journal_filename = get_journal_filename(games_path, game_id)
+    if journal_id is None or not os.path.isfile(journal_filename):
+        return game_dict
+    with open(journal_filename, 'rb') as file:
+        for line in file:
+            try:
+                entry = json.loads(line)
+            except ValueError:
+                # Last line may be incomplete if server stopped while writing it.
+                LOGGER.warning('Ignored invalid journal line for game %s', game_id)
+                break
+            if entry[JOURNAL_ID] != journal_id:
+                continue
+            game_dict.update(entry[JOURNAL_GAME])
+            for field, phases in entry[JOURNAL_HISTORY].items():
+                game_dict.setdefault(field, {}).update(phases)
+    return game_dict
+
+def delete_game_files(games_path, game_id):
+    """ Delete snapshot, snapshot backup and journal files of given game ID, if they exist. """
+    game_filename = get_game_filename(games_path, game_id)
+    for filename in (game_filename, get_backup_filename(game_filename), get_journal_filename(games_path, game_id)):
+        if os.path.isfile(filename):
+            os.remove(filename)
+
+class GameJournal:
+    """ Save a server game on disk as a snapshot followed by a journal of changes.
+        A journal remembers which history phases were already saved, so it must be used
+        for only one game object, and game must be saved only through this journal.
+
+        A new snapshot is written at first save, when journal becomes larger than snapshot,
+        or when a game history does not only append new phases (e.g. history was cleared).
+    """
+    __slots__ = ['games_path', 'game_id', 'journal_id', 'history_marks', 'snapshot_size', 'journal_size']
+
+    def __init__(self, games_path, game_id):
+        """ Constructor
+
+            :param games_path: folder containing games files.
+            :param game_id: ID of game to save.
+        """
+        self.games_path = games_path
+        self.game_id = game_id
+        self.journal_id = None
+        # Dictionary mapping history field name to a couple (number of saved phases, last saved phase).
+        self.history_marks = {}
+        self.snapshot_size = 0
+        self.journal_size = 0
+
+    def save(self, server_game):
+        """ Save given server game on disk.
+
+            :param server_game: game to save
+            :type server_game: diplomacy.server.server_game.ServerGame
+        """
+        if (self.journal_id is None
+                or self.journal_size > self.snapshot_size
+                or not all(self._extends_history(field, getattr(server_game, field)) for field in HISTORY_FIELDS)):
+            self.compact(server_game)
+        else:
+            self._append(server_game)
+
+    def compact(self, server_game):
+        """ Save given server game into a new snapshot and remove previous journal.
+
+            :param server_game: game to save
+            :type server_game: diplomacy.server.server_game.ServerGame
+        """
+        self.journal_id = str(uuid.uuid4())
+        game_dict = server_game.to_dict()
+        game_dict[JOURNAL_ID] = self.journal_id
+        game_filename = get_game_filename(self.games_path, self.game_id)
+        save_json_on_disk(game_filename, game_dict)
+        journal_filename = get_journal_filename(self.games_path, self.game_id)
+        if os.path.isfile(journal_filename):
+            os.remove(journal_filename)
+        self.snapshot_size = os.path.getsize(game_filename)
+        self.journal_size = 0
+        self._mark_histories(server_game)
+
+    def _append(self, server_game):
+        """ Append changes of given server game since previous save to journal. """
+        model = server_game.get_model()
+        entry = {
+            JOURNAL_ID: self.journal_id,
+            JOURNAL_GAME: {key: parsing.to_json(getattr(server_game, key), key_type)
+                           for key, key_type in model.items() if key not in HISTORY_FIELDS},
+            JOURNAL_HISTORY: {}
+        }
+        for field in HISTORY_FIELDS:
+            history = getattr(server_game, field)
+            nb_saved_phases, _ = self.history_marks[field]
+            if len(history) > nb_saved_phases:
+                new_phases = {}
+                for index in range(nb_saved_phases, len(history)):
+                    phase = history.key_from_index(index)
+                    new_phases[phase] = history[phase]
+                entry[JOURNAL_HISTORY][field] = parsing.to_json(new_phases, model[field])
+        line = '%s\n' % json.dumps(entry)
+        with open(get_journal_filename(self.games_path, self.game_id), 'a') as file:
+            file.write(line)
+        self.journal_size += len(line)
+        self._mark_histories(server_game)
+
+    def _extends_history(self, field, history):
+        """ Return True if given history still starts with phases already saved for given field. """
+        nb_saved_phases, last_saved_phase = self.history_marks[field]
+        return len(history) >= nb_saved_phases and (
+            not nb_saved_phases or history.key_from_index(nb_saved_phases - 1) == last_saved_phase)
+
+    def _mark_histories(self, server_game):
+        """ Remember history phases saved for given server game. """
+        for field in HISTORY_FIELDS:
+            history = getattr(server_game, field)
+            self.history_marks[field] = (len(history), history.last_key() if history else None)
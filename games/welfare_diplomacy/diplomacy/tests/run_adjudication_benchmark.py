@@ -0,0 +1,309 @@
+# ==============================================================================
+# Copyright (C) 2019 - Philip Paquette
+#
+#  This program is free software: you can redistribute it and/or modify it under
+#  the terms of the GNU Affero General Public License as published by the Free
+#  Software Foundation, either version 3 of the License, or (at your option) any
+#  later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#  FOR A PARTICULAR PURPOSE.  See the GNU Affero General Public License for more
+#  details.
+#
+#  You should have received a copy of the GNU Affero General Public License along
+#  with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ==============================================================================
+""" Adjudication throughput benchmark.
+    Replay adjudication scenarios through :meth:`Game.set_orders` and :meth:`Game.process` and report:
+
+    - phases processed per second
+    - calls and time spent in some engine functions (``_resolve_moves``, ``_valid_order``,
+      ``get_all_possible_orders`` and ``render``)
+    - peak memory allocated by Python (measured in a separate run, with ``tracemalloc``)
+
+    Two suites are run:
+
+    - **datc**: all DATC test cases from :mod:`diplomacy.tests.test_datc`
+    - **games**: recorded games in saved game format (JSON or JSON lines). By default, games recorded in
+      folder diplomacy/tests/network are used. For each replayed phase, all possible orders are computed and
+      game is rendered.
+
+    To run benchmark: ::
+
+        python -m games.welfare_diplomacy.diplomacy.tests.run_adjudication_benchmark
+
+    To save a baseline, then compare a later run against it: ::
+
+        python -m games.welfare_diplomacy.diplomacy.tests.run_adjudication_benchmark --save-baseline=baseline.json
+        python -m games.welfare_diplomacy.diplomacy.tests.run_adjudication_benchmark --baseline=baseline.json
+
+    When comparing, script exits with status 1 if any metric is worse than baseline
+    by more than given tolerance (``--tolerance``, default 0.2, i.e. 20 %).
+
+    For help: ::
+
+        python -m games.welfare_diplomacy.diplomacy.tests.run_adjudication_benchmark --help
+"""
+import argparse
+import glob
+import io
+import os
+import sys
+import time
+import tracemalloc
+from contextlib import redirect_stdout
+from functools import wraps
+
+import ujson as json
+
+from games.welfare_diplomacy.diplomacy.engine.game import Game
+from games.welfare_diplomacy.diplomacy.tests.test_datc import TestDATC
+
+# Game methods whose calls and time are reported.
+PROFILED_METHODS = ('_resolve_moves', '_valid_order', 'get_all_possible_orders', 'render')
+
+# Folder containing default recorded games.
+GAMES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'network')
+
+class FunctionTimer:
+    """ Replace profiled Game methods with wrappers counting calls and time spent in these methods.
+        Only outermost calls are timed, so that recursive calls are not counted twice.
+        To be used as a context manager: original methods are restored on exit.
+    """
+    __slots__ = ['calls', 'seconds', 'depths', 'originals']
+
+    def __init__(self):
+        self.calls = {name: 0 for name in PROFILED_METHODS}
+        self.seconds = {name: 0. for name in PROFILED_METHODS}
+        self.depths = {name: 0 for name in PROFILED_METHODS}
+        self.originals = {}
+
+    def _wrap(self, name, method):
+        """ Return a wrapper timing given method. """
+        @wraps(method)
+        def wrapper(*args, **kwargs):
+            """ Timed method. """
+            self.depths[name] += 1
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.depths[name] -= 1
+                if not self.depths[name]:
+                    self.calls[name] += 1
+                    self.seconds[name] += time.perf_counter() - start
+        return wrapper
+
+    def __enter__(self):
+        for name in PROFILED_METHODS:
+            self.originals[name] = Game.__dict__[name]
+            setattr(Game, name, self._wrap(name, self.originals[name]))
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        for name, method in self.originals.items():
+            setattr(Game, name, method)
+        self.originals.clear()
+
+    def to_dict(self):
+        """ Return timings as a dictionary mapping each method name to its number of calls,
+            total time and mean time per call (both in seconds).
+        """
+        return {name: {'calls': self.calls[name],
+                       'seconds': self.seconds[name],
+                       'mean_seconds': self.seconds[name] / self.calls[name] if self.calls[name] else 0.}
+                for name in PROFILED_METHODS}
+
+class BenchmarkDATC(TestDATC):
+    """ DATC test cases replayed for benchmark. Time spent in game processing is accumulated. """
+
+    def __init__(self):
+        self.nb_phases = 0
+        self.process_seconds = 0.
+
+    def process(self, game):
+        """ Process given game and accumulate processing time. """
+        # pylint: disable=arguments-differ
+        start = time.perf_counter()
+        game.process()
+        self.process_seconds += time.perf_counter() - start
+        self.nb_phases += 1
+
+def run_datc():
+    """ Replay all DATC test cases.
+
+        :return: a dictionary with number of cases, number of failed cases, number of processed phases
+            and time spent in processing.
+    """
+    datc = BenchmarkDATC()
+    test_names = sorted(name for name in dir(TestDATC) if name.startswith('test_'))
+    nb_failures = 0
+    for test_name in test_names:
+        try:
+            # Test cases print unexpected results. We just count failures.
+            with redirect_stdout(io.StringIO()):
+                getattr(datc, test_name)()
+        except AssertionError:
+            nb_failures += 1
+    return {'cases': len(test_names),
+            'failures': nb_failures,
+            'phases': datc.nb_phases,
+            'process_seconds': datc.process_seconds}
+
+def load_games(paths):
+    """ Load saved games from given paths. Each path is either a JSON file containing one saved game,
+        or a JSON lines file containing one saved game per line.
+
+        :param paths: list of file paths
+        :return: list of saved games (dictionaries)
+    """
+    saved_games = []
+    for path in paths:
+        with open(path, 'r') as file:
+            content = file.read()
+        try:
+            saved_games.append(json.loads(content))
+        except ValueError:
+            saved_games.extend(json.loads(line) for line in content.splitlines() if line.strip())
+    return saved_games
+
+def run_games(saved_games):
+    """ Replay orders of given saved games. Before processing each phase, all possible orders are computed
+        and game is rendered. Replay of a game stops at first phase that does not match saved game
+        (e.g. if game was played with rules not supported by engine).
+
+        :param saved_games: list of saved games (dictionaries)
+        :return: a dictionary with number of games, number of processed phases and time spent in processing.
+    """
+    nb_phases = 0
+    process_seconds = 0.
+    for saved_game in saved_games:
+        game = Game(map_name=saved_game.get('map', 'standard'), rules=saved_game.get('rules', []))
+        for phase_dct in saved_game.get('phases', []):
+            if game.is_game_done or game.get_current_phase() != phase_dct['name']:
+                break
+            game.get_all_possible_orders()
+            for power_name, orders in (phase_dct.get('orders') or {}).items():
+                if orders:
+                    game.set_orders(power_name, orders)
+            game.render()
+            start = time.perf_counter()
+            game.process()
+            process_seconds += time.perf_counter() - start
+            nb_phases += 1
+    return {'games': len(saved_games),
+            'phases': nb_phases,
+            'process_seconds': process_seconds}
+
+def run_suite(suite_function, measure_memory):
+    """ Run given suite and return its report.
+
+        :param suite_function: function without arguments running suite and returning a report dictionary.
+        :param measure_memory: if True, suite is run a second time with tracemalloc to measure peak memory.
+        :return: suite report, updated with phases per second, profiled functions and optional peak memory.
+    """
+    with FunctionTimer() as timer:
+        report = suite_function()
+    report['phases_per_second'] = report['phases'] / report['process_seconds'] if report['process_seconds'] else 0.
+    report['functions'] = timer.to_dict()
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            suite_function()
+            report['peak_memory_bytes'] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return report
+
+def compare(report, baseline, tolerance):
+    """ Compare a benchmark report to a baseline report.
+
+        :param report: current benchmark report
+        :param baseline: baseline benchmark report
+        :param tolerance: relative tolerance (e.g. 0.2 for 20 %)
+        :return: list of regression descriptions. Empty if no regression.
+    """
+    regressions = []
+
+    def check(label, value, baseline_value, higher_is_better):
+        """ Add a regression if value is worse than baseline value by more than tolerance. """
+        if not baseline_value:
+            return
+        ratio = value / baseline_value
+        if (ratio < 1 - tolerance) if higher_is_better else (ratio > 1 + tolerance):
+            regressions.append('%s: %.6g (baseline %.6g, ratio %.2f)' % (label, value, baseline_value, ratio))
+
+    for suite_name, suite_report in report.items():
+        suite_baseline = baseline.get(suite_name)
+        if suite_baseline is None:
+            continue
+        check('%s phases per second' % suite_name,
+              suite_report['phases_per_second'], suite_baseline['phases_per_second'], True)
+        if 'peak_memory_bytes' in suite_report and 'peak_memory_bytes' in suite_baseline:
+            check('%s peak memory' % suite_name,
+                  suite_report['peak_memory_bytes'], suite_baseline['peak_memory_bytes'], False)
+        for name, timing in suite_report['functions'].items():
+            if name in suite_baseline['functions']:
+                check('%s %s mean time' % (suite_name, name),
+                      timing['mean_seconds'], suite_baseline['functions'][name]['mean_seconds'], False)
+    return regressions
+
+def print_report(report):
+    """ Print given benchmark report. """
+    for suite_name, suite_report in report.items():
+        print('[%s] %d phases in %.3f s: %.1f phases/s'
+              % (suite_name, suite_report['phases'], suite_report['process_seconds'],
+                 suite_report['phases_per_second']))
+        if 'failures' in suite_report:
+            print('  %d cases, %d failed' % (suite_report['cases'], suite_report['failures']))
+        if 'peak_memory_bytes' in suite_report:
+            print('  peak memory: %.1f MiB' % (suite_report['peak_memory_bytes'] / 2 ** 20))
+        for name, timing in suite_report['functions'].items():
+            print('  %-25s %8d calls %10.3f s %12.1f us/call'
+                  % (name, timing['calls'], timing['seconds'], timing['mean_seconds'] * 1e6))
+
+def main():
+    """ Main function for this module. Run benchmark, print report and optionally save or compare it
+        to a baseline.
+    """
+    parser = argparse.ArgumentParser(description='Run adjudication throughput benchmark.')
+    parser.add_argument('--games', action='append',
+                        help='Saved game file (JSON or JSON lines) to replay. Can be given many times. '
+                             'If not provided, games recorded in diplomacy/tests/network are used.')
+    parser.add_argument('--suites', default='datc,games',
+                        help='Comma-separated list of suites to run (default: datc,games).')
+    parser.add_argument('--no-memory', action='store_true',
+                        help='Do not measure peak memory (skip second run of each suite).')
+    parser.add_argument('--save-baseline', help='Save benchmark report into given JSON file.')
+    parser.add_argument('--baseline', help='Compare benchmark report to baseline saved in given JSON file.')
+    parser.add_argument('--tolerance', type=float, default=0.2,
+                        help='Relative tolerance used to compare with baseline (default: 0.2).')
+    args = parser.parse_args()
+
+    suite_functions = {'datc': run_datc}
+    saved_games = load_games(args.games or sorted(glob.glob(os.path.join(GAMES_DIR, '*.json'))))
+    suite_functions['games'] = lambda: run_games(saved_games)
+
+    report = {}
+    for suite_name in args.suites.split(','):
+        report[suite_name] = run_suite(suite_functions[suite_name], not args.no_memory)
+    print_report(report)
+
+    if args.save_baseline:
+        with open(args.save_baseline, 'w') as file:
+            json.dump(report, file, indent=2)
+        print('Baseline saved in %s' % args.save_baseline)
+
+    if args.baseline:
+        with open(args.baseline, 'r') as file:
+            baseline = json.load(file)
+        regressions = compare(report, baseline, args.tolerance)
+        for regression in regressions:
+            print('REGRESSION %s' % regression)
+        if regressions:
+            sys.exit(1)
+        print('No regression compared to %s' % args.baseline)
+
+if __name__ == '__main__':
+    main()
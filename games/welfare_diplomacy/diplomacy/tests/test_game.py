@@ -18,7 +18,11 @@
     - Contains tests for the game object
 """
 from copy import deepcopy
+import ujson as json
+
+from games.welfare_diplomacy.diplomacy.communication.notifications import GameProcessed
 from games.welfare_diplomacy.diplomacy.engine.game import Game
+from games.welfare_diplomacy.diplomacy.engine.message import Message, GLOBAL
 from games.welfare_diplomacy.diplomacy.utils.order_results import BOUNCE
 
 def test_is_game_done():
@@ -541,6 +545,61 @@ def test_deepcopy():
     assert game != game2
     assert game.get_hash() == game2.get_hash()
 
+def test_fork():
+    """ Tests - fork """
+    game = Game()
+    game.set_orders('FRANCE', ['A PAR - BUR', 'A MAR - BUR'])
+    game.process()
+    game.set_orders('FRANCE', ['A PAR - BUR'])
+    game2 = game.fork()
+    assert game2.get_hash() == game.get_hash()
+    assert game2.map is game.map
+    assert game2.get_power('FRANCE').game is game2
+    assert game2.get_orders('FRANCE') == game.get_orders('FRANCE')
+    assert list(game2.state_history.keys()) == list(game.state_history.keys())
+
+    # Processing the fork must leave the original game untouched.
+    game2.process()
+    assert game2.get_current_phase() != 'F1901M'
+    assert game.get_current_phase() == 'F1901M'
+    assert 'A BUR' in game2.get_units('FRANCE')
+    assert 'A PAR' in game.get_units('FRANCE')
+    assert game.get_orders('FRANCE') == ['A PAR - BUR']
+    assert len(game2.state_history) == 2
+    assert len(game.state_history) == 1
+    assert game._unit_owner('A PAR') is game.get_power('FRANCE')                           # pylint: disable=protected-access
+
+    # And the other way around.
+    game.add_message(Message(phase=game.current_short_phase, sender='FRANCE', recipient=GLOBAL, message='Hello'))
+    assert len(game.messages) == 1
+    assert not game2.messages
+
+def test_power_messages():
+    """ Tests - get_power_messages and get_power_message_lines """
+    game = Game()
+    phase = game.current_short_phase
+    game.add_message(Message(phase=phase, sender='FRANCE', recipient=GLOBAL, message='Hello', time_sent=10))
+    game.add_message(Message(phase=phase, sender='FRANCE', recipient='ENGLAND', message='Channel?', time_sent=20))
+    assert game.get_power_message_lines('ENGLAND') == ['France -> Global: Hello\n', 'France -> England: Channel?\n']
+    assert game.get_power_message_lines('GERMANY') == ['France -> Global: Hello\n']
+
+    # Messages added after the index was built, in order and out of order.
+    game.add_message(Message(phase=phase, sender='GERMANY', recipient='ENGLAND', message='Denmark?', time_sent=30))
+    game.add_message(Message(phase=phase, sender='ENGLAND', recipient='FRANCE', message='Sure', time_sent=15))
+    assert [message.time_sent for message in game.get_power_messages('ENGLAND')] == [10, 15, 20, 30]
+    assert game.get_power_message_lines('FRANCE') == ['France -> Global: Hello\n', 'England -> France: Sure\n',
+                                                      'France -> England: Channel?\n']
+    assert game.get_power_message_lines('ITALY') == ['France -> Global: Hello\n']
+
+    # Forks and copies have their own index, and index is cleared when processing.
+    game2 = game.fork()
+    game2.add_message(Message(phase=phase, sender='ITALY', recipient='AUSTRIA', message='Peace', time_sent=40))
+    assert game2.get_power_message_lines('AUSTRIA') == ['France -> Global: Hello\n', 'Italy -> Austria: Peace\n']
+    assert game.get_power_message_lines('AUSTRIA') == ['France -> Global: Hello\n']
+    assert deepcopy(game).get_power_message_lines('ITALY') == ['France -> Global: Hello\n']
+    game.process()
+    assert game.get_power_messages('ENGLAND') == []
+
 def test_automatic_draw():
     """ Tests - draw """
     game = Game()
@@ -667,3 +726,62 @@ def test_unit_owner():
 
     assert game._unit_owner('F SEV', coast_required=0) is game.get_power('RUSSIA')                                      # pylint: disable=protected-access
     assert game._unit_owner('F SEV', coast_required=1) is game.get_power('RUSSIA')                                      # pylint: disable=protected-access
+
+def test_game_processed_encoded_params():
+    """ Test that game processed notifications give same JSON with shared encoded params. """
+    game = Game()
+    previous_phase_data = game.get_phase_data()
+    game.set_orders('FRANCE', ['A PAR - BUR'])
+    game.process()
+    current_phase_data = game.get_phase_data()
+    encoded_params = GameProcessed.encode_params(previous_phase_data, current_phase_data)
+    for token in ('token_1', 'token_2'):
+        notification = GameProcessed(token=token, game_id=game.game_id, game_role='FRANCE',
+                                     previous_phase_data=previous_phase_data,
+                                     current_phase_data=current_phase_data)
+        expected_json = notification.json()
+        notification.encoded_params = encoded_params
+        assert json.loads(notification.json()) == json.loads(expected_json)
+        assert GameProcessed.from_dict(json.loads(notification.json())).token == token
+
+def test_simulation_mode():
+    """ Test that a simulation game adjudicates like a regular game, without server bookkeeping. """
+    game = Game()
+    simulation = Game(simulation=True)
+    assert simulation.simulation and not simulation.keep_history
+    assert simulation.get_hash() == '0'
+    for _ in range(6):
+        possible_orders = game.get_all_possible_orders()
+        for power_name, locations in game.get_orderable_locations().items():
+            orders = [possible_orders[loc][0] for loc in locations if possible_orders[loc]]
+            game.set_orders(power_name, orders)
+            simulation.set_orders(power_name, orders)
+        phase_data = game.process()
+        assert phase_data is not None
+        assert simulation.process() is None
+        assert simulation.get_state()['units'] == game.get_state()['units']
+        assert simulation.get_state()['centers'] == game.get_state()['centers']
+        assert simulation.result_history.last_value() == game.result_history.last_value()
+        assert len(simulation.state_history) == len(simulation.result_history) == 1
+    assert len(game.state_history) == 6
+    assert Game(simulation=True, keep_history=True).keep_history
+
+def test_validate_orders():
+    """ Test bulk order validation against possible orders. """
+    game = Game()
+    valid_orders, invalid_orders, reasons = game.validate_orders(
+        'FRANCE', ['a par -  bur', 'A MAR - SPA', 'A MAR - PIE', 'A LON H', 'F BRE - ROM', 'HOLD'])
+    assert valid_orders == ['A PAR - BUR', 'A MAR - PIE']
+    assert invalid_orders == ['A MAR - SPA', 'A LON H', 'F BRE - ROM', 'HOLD']
+    assert len(reasons) == len(invalid_orders)
+    assert 'REORDERED' in str(reasons[0])
+    assert 'UNORDERABLE' in str(reasons[1])
+    assert 'NOT ALLOWED' in str(reasons[2])
+    game.set_orders('FRANCE', valid_orders, expand=False)
+    assert sorted(game.get_orders('FRANCE')) == ['A MAR - PIE', 'A PAR - BUR']
+    assert game.validate_orders('FRANCE', ['A PAR-BUR', 'A MAR BUR', 'F BRE-MAO']) == (
+        ['A PAR - BUR', 'A MAR - BUR', 'F BRE - MAO'], [], [])
+    assert game.validate_orders('FRANCE', ['A PARIS - BURGUNDY']) == (['A PAR - BUR'], [], [])
+    assert not game.error
+    game.process()
+    assert game.validate_orders('FRANCE', ['A BUR - MUN']) == (['A BUR - MUN'], [], [])
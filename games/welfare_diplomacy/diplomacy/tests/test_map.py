@@ -123,6 +123,22 @@ def test_abuts():
     assert this_map.abuts('F', 'VEN', 'S', 'TUS') == 0
     assert this_map.abuts('A', 'POR', 'C', 'MAO') == 1
 
+def test_abuts_tables():
+    """ Tests that map.abuts_tables matches map._abuts for every location """
+    this_map = deepcopy(Map())
+    for unit_type in ['A', 'F']:
+        for order_type in ['-', 'S', 'C']:
+            for unit_loc in this_map.locs:
+                for other_loc in this_map.locs:
+                    assert this_map.abuts(unit_type, unit_loc, order_type, other_loc) \
+                           == this_map._abuts(unit_type, unit_loc, order_type, other_loc)     # pylint: disable=protected-access
+    assert this_map.abuts('?', 'bul', 'S', 'con') == 1
+    assert this_map.abuts('A', 'PAR', 'H', 'BUR') == 0
+    assert this_map.abuts('A', 'PAR', '-', 'XYZ') == 0
+    assert this_map.area_type('bul') == 'COAST'
+    this_map.drop('STP')
+    assert this_map.abuts('F', 'BOT', 'S', 'STP') == 0
+
 def test_is_valid_unit():
     """ Tests maps.is_valid_unit """
     # ADR = WATER
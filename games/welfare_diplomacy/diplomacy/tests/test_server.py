@@ -0,0 +1,113 @@
+# ==============================================================================
+# Copyright (C) 2019 - Philip Paquette
+#
+#  This program is free software: you can redistribute it and/or modify it under
+#  the terms of the GNU Affero General Public License as published by the Free
+#  Software Foundation, either version 3 of the License, or (at your option) any
+#  later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#  FOR A PARTICULAR PURPOSE.  See the GNU Affero General Public License for more
+#  details.
+#
+#  You should have received a copy of the GNU Affero General Public License along
+#  with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ==============================================================================
+""" Test server game processing in adjudication workers. """
+from concurrent.futures import ThreadPoolExecutor
+import tempfile
+import threading
+
+from tornado import gen
+from tornado.ioloop import IOLoop
+
+from games.welfare_diplomacy.diplomacy.communication import requests
+from games.welfare_diplomacy.diplomacy.daide import request_managers as daide_request_managers
+from games.welfare_diplomacy.diplomacy.daide.requests import RequestBuilder
+from games.welfare_diplomacy.diplomacy.daide.utils import str_to_bytes
+from games.welfare_diplomacy.diplomacy.server.request_managers import handle_request
+from games.welfare_diplomacy.diplomacy.server.server import Server
+from games.welfare_diplomacy.diplomacy.server.server_game import ServerGame
+from games.welfare_diplomacy.diplomacy.utils.common import hash_password
+
+class _BlockingServerGame(ServerGame):
+    """ Server game whose processing blocks until test allows it to finish. """
+
+    def __init__(self, **kwargs):
+        super(_BlockingServerGame, self).__init__(**kwargs)
+        self.process_started = threading.Event()
+        self.process_allowed = threading.Event()
+        self.tokens_while_processed = None
+
+    def process(self):
+        """ Wait until processing is allowed, and record power tokens seen at end of processing. """
+        self.process_started.set()
+        self.process_allowed.wait()
+        self.tokens_while_processed = set(self.get_power('FRANCE').tokens)
+        return None, None, None
+
+@gen.coroutine
+def _daide_request_during_process(server, server_game):
+    """ Send a DAIDE NOW request while given game is processed by an adjudication worker. """
+    process_future = server._process_game(server_game)  # pylint: disable=protected-access
+    yield IOLoop.current().run_in_executor(None, server_game.process_started.wait)
+
+    request = RequestBuilder.from_bytes(str_to_bytes('NOW'))
+    request.game_id = server_game.game_id
+    response_future = daide_request_managers.handle_request(server, request, None)
+    yield gen.moment
+    # Game is not read while it is processed.
+    assert not response_future.done()
+
+    server_game.process_allowed.set()
+    yield process_future
+    response, = yield response_future
+    assert bytes(response).startswith(str_to_bytes('NOW'))
+
+def _run_with_blocking_game(coroutine_fn, *args):
+    """ Create a server with a blocking game and run given coroutine with server and game as first arguments. """
+    with tempfile.TemporaryDirectory() as server_dir:
+        server = Server(server_dir)
+        server.adjudication_executor = ThreadPoolExecutor(max_workers=1)
+        server_game = _BlockingServerGame(game_id='test_game')
+        server.games[server_game.game_id] = server_game
+        try:
+            IOLoop.current().run_sync(lambda: coroutine_fn(server, server_game, *args))
+        finally:
+            server_game.process_allowed.set()
+            server.adjudication_executor.shutdown()
+
+def test_daide_request_during_game_processing():
+    """ Test that a DAIDE request received while a game is processed is handled once processing is done. """
+    _run_with_blocking_game(_daide_request_during_process)
+
+@gen.coroutine
+def _logout_during_process(server, server_game):
+    """ Logout a player token while given game is processed by an adjudication worker. """
+    connection_handler = object()
+    server.users.add_user('user', hash_password('password'))
+    token = server.users.connect_user('user', connection_handler)
+    server_game.control('FRANCE', 'user', token)
+
+    process_future = server._process_game(server_game)  # pylint: disable=protected-access
+    assert server.is_game_in_process(server_game.game_id)
+    yield IOLoop.current().run_in_executor(None, server_game.process_started.wait)
+
+    yield handle_request(server, requests.Logout(token=token), connection_handler)
+    assert not server.users.has_token(token)
+    # Game is not modified while it is processed.
+    assert server_game.has_token(token)
+    assert server_game.game_id not in server.backup_games
+
+    server_game.process_allowed.set()
+    yield process_future
+    yield server.wait_game_processed(server_game.game_id)
+    yield gen.moment
+    assert server_game.tokens_while_processed == {token}
+    assert not server_game.has_token(token)
+    assert server_game.game_id in server.backup_games
+
+def test_logout_during_game_processing():
+    """ Test that a logout received while a game is processed updates game only once processing is done. """
+    _run_with_blocking_game(_logout_during_process)
@@ -0,0 +1,75 @@
+# ==============================================================================
+# Copyright (C) 2019 - Philip Paquette
+#
+#  This program is free software: you can redistribute it and/or modify it under
+#  the terms of the GNU Affero General Public License as published by the Free
+#  Software Foundation, either version 3 of the License, or (at your option) any
+#  later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#  FOR A PARTICULAR PURPOSE.  See the GNU Affero General Public License for more
+#  details.
+#
+#  You should have received a copy of the GNU Affero General Public License along
+#  with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ==============================================================================
+""" Test server game storage (snapshot and journal). """
+import os
+import tempfile
+
+import ujson as json
+
+from games.welfare_diplomacy.diplomacy.engine.message import Message
+from games.welfare_diplomacy.diplomacy.server.server_game import ServerGame
+from games.welfare_diplomacy.diplomacy.server.storage import (GameJournal, delete_game_files, get_game_filename,
+                                                              get_journal_filename, load_game_dict)
+
+def _play_phase(game):
+    """ Add a message, set some orders and process given game. """
+    game.add_message(Message(sender='FRANCE', recipient='ENGLAND', message='Hello in %s' % game.current_short_phase,
+                             phase=game.current_short_phase))
+    game.set_orders('FRANCE', ['A PAR - BUR'])
+    game.process()
+
+def test_game_journal():
+    """ Test that a game saved through a journal is loaded back identically. """
+    game = ServerGame(game_id='test_game')
+    with tempfile.TemporaryDirectory() as games_path:
+        journal = GameJournal(games_path, game.game_id)
+        journal.save(game)
+        snapshot_size = os.path.getsize(get_game_filename(games_path, game.game_id))
+        assert not os.path.isfile(get_journal_filename(games_path, game.game_id))
+
+        # Next save only appends to journal.
+        _play_phase(game)
+        journal.save(game)
+        assert os.path.getsize(get_game_filename(games_path, game.game_id)) == snapshot_size
+        assert os.path.isfile(get_journal_filename(games_path, game.game_id))
+        assert load_game_dict(games_path, game.game_id) == json.loads(json.dumps(game.to_dict()))
+
+        # Journal is compacted when needed.
+        for _ in range(5):
+            _play_phase(game)
+            journal.save(game)
+            assert journal.journal_size <= journal.snapshot_size * 2
+            assert load_game_dict(games_path, game.game_id) == json.loads(json.dumps(game.to_dict()))
+
+        # Lines from a previous journal are ignored.
+        journal.compact(game)
+        _play_phase(game)
+        journal.save(game)
+        journal_id = journal.journal_id
+        with open(get_journal_filename(games_path, game.game_id)) as file:
+            previous_lines = file.read()
+        game.clear_orders()
+        game.message_history.clear()
+        journal.save(game)
+        assert journal.journal_id != journal_id
+        assert not os.path.isfile(get_journal_filename(games_path, game.game_id))
+        with open(get_journal_filename(games_path, game.game_id), 'w') as file:
+            file.write(previous_lines)
+        assert load_game_dict(games_path, game.game_id) == json.loads(json.dumps(game.to_dict()))
+
+        delete_game_files(games_path, game.game_id)
+        assert not os.listdir(games_path)
@@ -0,0 +1,436 @@
+# ==============================================================================
+# Copyright (C) 2019 - Philip Paquette, Steven Bocco
+#
+#  This program is free software: you can redistribute it and/or modify it under
+#  the terms of the GNU Affero General Public License as published by the Free
+#  Software Foundation, either version 3 of the License, or (at your option) any
+#  later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#  FOR A PARTICULAR PURPOSE.  See the GNU Affero General Public License for more
+#  details.
+#
+#  You should have received a copy of the GNU Affero General Public License along
+#  with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ==============================================================================
+""" Compact phase history
+    - Binary, columnar encoding of game phases (as returned by GamePhaseData.to_dict()).
+    - Every string (power names, units, locations, orders, results, notes) is interned once per game
+      in a string pool, and phases are stored as a flat array of 16-bit (or 32-bit, for very large games)
+      integers referencing that pool.
+    - Message bodies are not stored in the game record: they are appended to a separate text log,
+      and the game record only keeps (offset, length) pointers into that log.
+
+    File layout (little-endian), one record per game, records appended one after the other:
+
+    .. code-block:: text
+
+        MAGIC (4 bytes) | header length (u32) | header (JSON, utf-8)
+                        | nb ints (u32)       | ints (i16 or i32 * nb ints, see header 'int_type')
+                        | nb messages (u32)   | messages (MESSAGE_STRUCT * nb messages)
+
+    Use :func:`diplomacy.utils.export.to_compact_saved_game_format` and
+    :func:`diplomacy.utils.export.load_compact_saved_games_from_disk` to write and read such files.
+"""
+from array import array
+import mmap
+import os
+import struct
+import sys
+
+import ujson as json
+
+# Constants
+MAGIC = b'DPH1'
+TEXT_LOG_SUFFIX = '.messages'
+UINT32_STRUCT = struct.Struct('<I')
+# time_sent, phase index, sender sid, recipient sid, text offset, text length
+MESSAGE_STRUCT = struct.Struct('<qiiiQI')
+STATE_KEYS = ('timestamp', 'zobrist_hash', 'note', 'name', 'units', 'retreats', 'centers', 'homes', 'influence',
+              'civil_disorder', 'builds', 'welfare_points')
+SAVED_GAME_STATE_KEYS = ('game_id', 'map', 'rules')
+
+class StringPool:
+    """ Interns strings into consecutive integer IDs. """
+    __slots__ = ['strings', 'ids']
+
+    def __init__(self, strings=()):
+        """ Constructor
+
+            :param strings: Optional initial list of strings (e.g. loaded from a header).
+        """
+        self.strings = list(strings)
+        self.ids = {string: sid for sid, string in enumerate(self.strings)}
+
+    def __len__(self):
+        return len(self.strings)
+
+    def intern(self, string):
+        """ Return the ID of given string, adding it to the pool if needed. """
+        sid = self.ids.get(string)
+        if sid is None:
+            sid = self.ids[string] = len(self.strings)
+            self.strings.append(string)
+        return sid
+
+class _PhaseEncoder:
+    """ Encodes phase dicts of one game into a string pool, an integer stream and a message table. """
+    __slots__ = ['pool', 'ints', 'messages', 'phase_offsets', 'timestamps', 'extras', 'text_log']
+
+    def __init__(self, text_log):
+        """ Constructor
+
+            :param text_log: binary file object opened in append mode, where message bodies are written.
+        """
+        self.pool = StringPool()
+        self.ints = array('i')
+        self.messages = bytearray()
+        self.phase_offsets = []
+        self.timestamps = []
+        self.extras = []
+        self.text_log = text_log
+
+    def _add_list(self, strings):
+        """ Write length-prefixed list of string IDs. """
+        self.ints.append(len(strings))
+        self.ints.extend(self.pool.intern(string) for string in strings)
+
+    def add_phase(self, phase_dct):
+        """ Encode a phase dict (GamePhaseData.to_dict() format). """
+        ints, intern = self.ints, self.pool.intern
+        state = phase_dct['state']
+        phase_ix = len(self.phase_offsets)
+        self.phase_offsets.append(len(ints))
+        self.timestamps.append(state.get('timestamp', 0))
+        self.extras.append({key: value for key, value in state.items()
+                            if key not in STATE_KEYS and key not in SAVED_GAME_STATE_KEYS} or None)
+
+        # Phase info
+        ints.append(intern(phase_dct['name']))
+        ints.append(intern(state.get('name', phase_dct['name'])))
+        ints.append(intern(state.get('note', '')))
+        ints.append(intern(str(state.get('zobrist_hash', '0'))))
+
+        # Powers state
+        power_names = list(state['units'])
+        ints.append(len(power_names))
+        for power_name in power_names:
+            ints.append(intern(power_name))
+            self._add_list(state['units'][power_name])
+            self._add_list(state['centers'].get(power_name, []))
+            self._add_list(state['homes'].get(power_name, []))
+            self._add_list(state['influence'].get(power_name, []))
+            ints.append(state['civil_disorder'].get(power_name, 0))
+            ints.append(state['welfare_points'].get(power_name, 0))
+            builds = state['builds'].get(power_name, {})
+            ints.append(builds.get('count', 0))
+            self._add_list(builds.get('homes', []))
+            retreats = state['retreats'].get(power_name, {})
+            ints.append(len(retreats))
+            for unit, locs in retreats.items():
+                ints.append(intern(unit))
+                self._add_list(locs)
+
+        # Orders (None is encoded with a negative length)
+        orders = phase_dct.get('orders', {})
+        ints.append(len(orders))
+        for power_name, power_orders in orders.items():
+            ints.append(intern(power_name))
+            if power_orders is None:
+                ints.append(-1)
+            else:
+                self._add_list(power_orders)
+
+        # Results
+        results = phase_dct.get('results', {})
+        ints.append(len(results))
+        for unit, unit_results in results.items():
+            ints.append(intern(unit))
+            self._add_list([str(result) for result in unit_results])
+
+        # Messages
+        for message in phase_dct.get('messages', []):
+            body = message['message'].encode('utf-8')
+            offset = self.text_log.tell()
+            self.text_log.write(body)
+            self.messages += MESSAGE_STRUCT.pack(message['time_sent'] or 0,
+                                                 phase_ix,
+                                                 intern(message['sender']),
+                                                 intern(message['recipient']),
+                                                 offset,
+                                                 len(body))
+
+    def to_bytes(self, header):
+        """ Return the binary game record.
+
+            :param header: dict of game-level fields (id, map, rules, ...) to store in record header.
+        """
+        ints = self.ints
+        if -32768 <= min(ints, default=0) and max(ints, default=0) < 32768:
+            ints = array('h', ints)
+        header = dict(header,
+                      int_type=ints.typecode,
+                      strings=self.pool.strings,
+                      phase_offsets=self.phase_offsets,
+                      timestamps=self.timestamps,
+                      extras=self.extras)
+        header_bytes = json.dumps(header).encode('utf-8')
+        if sys.byteorder != 'little':
+            ints = array(ints.typecode, ints)
+            ints.byteswap()
+        return b''.join([MAGIC,
+                         UINT32_STRUCT.pack(len(header_bytes)), header_bytes,
+                         UINT32_STRUCT.pack(len(ints)), ints.tobytes(),
+                         UINT32_STRUCT.pack(len(self.messages) // MESSAGE_STRUCT.size), bytes(self.messages)])
+
+class CompactGameHistory:
+    """ Read-only view on a game record written in compact format.
+        Phases are decoded lazily, message bodies are read lazily from the text log.
+
+        Properties:
+
+        - **game_id**: game ID.
+        - **map_name**: name of map used by game.
+        - **rules**: list of game rules.
+        - **strings**: string pool (list of strings) for this game.
+    """
+    __slots__ = ['game_id', 'map_name', 'rules', 'strings', 'phase_offsets', 'timestamps', 'extras',
+                 'ints', 'messages', 'text_log']
+
+    def __init__(self, header, ints, messages, text_log):
+        """ Constructor
+
+            :param header: record header (dict).
+            :param ints: integer stream of the record (array of int32 or memoryview).
+            :param messages: raw message table (bytes or memoryview).
+            :param text_log: mmap (or bytes) of the message text log, or None if there is none.
+        """
+        self.game_id = header.get('id')
+        self.map_name = header.get('map', 'standard')
+        self.rules = header.get('rules', [])
+        self.strings = header['strings']
+        self.phase_offsets = header['phase_offsets']
+        self.timestamps = header['timestamps']
+        self.extras = header['extras']
+        self.ints = ints
+        self.messages = messages
+        self.text_log = text_log
+
+    def __len__(self):
+        return len(self.phase_offsets)
+
+    @property
+    def phase_names(self):
+        """ Return list of phase names, in game order. """
+        return [self.strings[self.ints[offset]] for offset in self.phase_offsets]
+
+    def _read_list(self, position):
+        """ Return (list of strings, next position) for length-prefixed list at given position. """
+        ints, strings = self.ints, self.strings
+        length = ints[position]
+        position += 1
+        return [strings[sid] for sid in ints[position:position + length]], position + length
+
+    def _skip_list(self, position):
+        """ Return position after length-prefixed list at given position. """
+        return position + 1 + self.ints[position]
+
+    def iter_power_counts(self):
+        """ Fast path for analysis: yield (phase name, {power name: (nb units, nb centers, welfare points)})
+            for each phase, without building full phase dicts.
+        """
+        ints, strings = self.ints, self.strings
+        for offset in self.phase_offsets:
+            nb_powers = ints[offset + 4]
+            position = offset + 5
+            counts = {}
+            for _ in range(nb_powers):
+                power_name = strings[ints[position]]
+                nb_units = ints[position + 1]
+                position = self._skip_list(position + 1)
+                nb_centers = ints[position]
+                position = self._skip_list(position)
+                position = self._skip_list(position)                        # homes
+                position = self._skip_list(position)                        # influence
+                welfare_points = ints[position + 1]
+                position = self._skip_list(position + 3)                    # builds homes
+                nb_retreats = ints[position]
+                position += 1
+                for _ in range(nb_retreats):
+                    position = self._skip_list(position + 1)
+                counts[power_name] = (nb_units, nb_centers, welfare_points)
+            yield strings[ints[offset]], counts
+
+    def get_message_text(self, offset, length):
+        """ Return message body stored at given position in text log. """
+        return bytes(self.text_log[offset:offset + length]).decode('utf-8')
+
+    def get_messages(self, phase_index=None):
+        """ Return list of message dicts (Message.to_dict() format), optionally only for given phase index. """
+        strings = self.strings
+        phase_names = self.phase_names
+        messages = []
+        for time_sent, phase_ix, sender, recipient, offset, length in MESSAGE_STRUCT.iter_unpack(self.messages):
+            if phase_index is not None and phase_ix != phase_index:
+                continue
+            messages.append({'sender': strings[sender],
+                             'recipient': strings[recipient],
+                             'time_sent': time_sent,
+                             'phase': phase_names[phase_ix],
+                             'message': self.get_message_text(offset, length)})
+        return messages
+
+    def get_messages_per_phase(self):
+        """ Return list of message dicts (Message.to_dict() format) for each phase, in a single scan
+            of message table. Messages are bucketed with the phase index stored in each message.
+        """
+        strings = self.strings
+        phase_names = self.phase_names
+        messages_per_phase = [[] for _ in phase_names]
+        for time_sent, phase_ix, sender, recipient, offset, length in MESSAGE_STRUCT.iter_unpack(self.messages):
+            messages_per_phase[phase_ix].append({'sender': strings[sender],
+                                                 'recipient': strings[recipient],
+                                                 'time_sent': time_sent,
+                                                 'phase': phase_names[phase_ix],
+                                                 'message': self.get_message_text(offset, length)})
+        return messages_per_phase
+
+    def get_phase(self, phase_index, messages=None):
+        """ Decode a phase.
+
+            :param phase_index: index of phase to decode.
+            :param messages: optional list of message dicts for this phase (to avoid scanning message table).
+            :return: phase dict (GamePhaseData.to_dict() format, as in saved games).
+        """
+        ints, strings = self.ints, self.strings
+        position = self.phase_offsets[phase_index]
+        phase_name = strings[ints[position]]
+        state = {'timestamp': self.timestamps[phase_index],
+                 'zobrist_hash': strings[ints[position + 3]],
+                 'note': strings[ints[position + 2]],
+                 'name': strings[ints[position + 1]],
+                 'units': {}, 'retreats': {}, 'centers': {}, 'homes': {}, 'influence': {},
+                 'civil_disorder': {}, 'builds': {}, 'welfare_points': {}}
+        position += 4
+        nb_powers = ints[position]
+        position += 1
+        for _ in range(nb_powers):
+            power_name = strings[ints[position]]
+            state['units'][power_name], position = self._read_list(position + 1)
+            state['centers'][power_name], position = self._read_list(position)
+            state['homes'][power_name], position = self._read_list(position)
+            state['influence'][power_name], position = self._read_list(position)
+            state['civil_disorder'][power_name] = ints[position]
+            state['welfare_points'][power_name] = ints[position + 1]
+            build_count = ints[position + 2]
+            build_homes, position = self._read_list(position + 3)
+            state['builds'][power_name] = {'count': build_count, 'homes': build_homes}
+            retreats = {}
+            nb_retreats = ints[position]
+            position += 1
+            for _ in range(nb_retreats):
+                unit = strings[ints[position]]
+                retreats[unit], position = self._read_list(position + 1)
+            state['retreats'][power_name] = retreats
+        if self.extras[phase_index]:
+            state.update(self.extras[phase_index])
+        state['game_id'] = self.game_id
+        state['map'] = self.map_name
+        state['rules'] = list(self.rules)
+
+        orders = {}
+        nb_orders = ints[position]
+        position += 1
+        for _ in range(nb_orders):
+            power_name = strings[ints[position]]
+            if ints[position + 1] < 0:
+                orders[power_name] = None
+                position += 2
+            else:
+                orders[power_name], position = self._read_list(position + 1)
+
+        results = {}
+        nb_results = ints[position]
+        position += 1
+        for _ in range(nb_results):
+            unit = strings[ints[position]]
+            results[unit], position = self._read_list(position + 1)
+
+        if messages is None:
+            messages = self.get_messages(phase_index)
+        return {'name': phase_name, 'state': state, 'orders': orders, 'results': results, 'messages': messages}
+
+    def to_saved_game(self):
+        """ Return the game in the saved game format (see :func:`diplomacy.utils.export.to_saved_game_format`) """
+        messages_per_phase = self.get_messages_per_phase()
+        return {'id': self.game_id,
+                'map': self.map_name,
+                'rules': list(self.rules),
+                'phases': [self.get_phase(phase_ix, messages_per_phase[phase_ix]) for phase_ix in range(len(self))]}
+
+def write_compact_games(phase_dicts_per_game, output_path, output_mode='a'):
+    """ Write games in compact format.
+
+        :param phase_dicts_per_game: iterable of (header dict, list of phase dicts) - one couple per game.
+            Header must contain game fields 'id', 'map' and 'rules'.
+        :param output_path: path to compact file. Message bodies are written to output_path + TEXT_LOG_SUFFIX.
+        :param output_mode: 'a' to append games to existing file, 'w' to overwrite it.
+        :return: number of bytes written in the compact file (message text log excluded).
+    """
+    assert output_mode in ('a', 'w'), 'Expected output modes are "a" and "w".'
+    nb_bytes = 0
+    with open(output_path, output_mode + 'b') as output_file, \
+            open(output_path + TEXT_LOG_SUFFIX, output_mode + 'b') as text_log:
+        for header, phase_dicts in phase_dicts_per_game:
+            encoder = _PhaseEncoder(text_log)
+            for phase_dct in phase_dicts:
+                encoder.add_phase(phase_dct)
+            record = encoder.to_bytes(header)
+            output_file.write(record)
+            nb_bytes += len(record)
+    return nb_bytes
+
+def read_compact_games(input_path):
+    """ Read all games from a compact file.
+        Compact file is memory-mapped: integer streams and message tables are not copied.
+
+        :param input_path: path to compact file.
+        :return: list of CompactGameHistory
+    """
+    games = []
+    if not os.path.getsize(input_path):
+        return games
+    text_log = None
+    text_log_path = input_path + TEXT_LOG_SUFFIX
+    if os.path.exists(text_log_path) and os.path.getsize(text_log_path):
+        with open(text_log_path, 'rb') as text_file:
+            text_log = mmap.mmap(text_file.fileno(), 0, access=mmap.ACCESS_READ)
+    with open(input_path, 'rb') as input_file:
+        buffer = memoryview(mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ))
+    position = 0
+    while position < len(buffer):
+        if buffer[position:position + len(MAGIC)] != MAGIC:
+            raise ValueError('Invalid compact game record at offset %d in %s' % (position, input_path))
+        position += len(MAGIC)
+        header_length, = UINT32_STRUCT.unpack_from(buffer, position)
+        position += UINT32_STRUCT.size
+        header = json.loads(bytes(buffer[position:position + header_length]).decode('utf-8'))
+        position += header_length
+        nb_ints, = UINT32_STRUCT.unpack_from(buffer, position)
+        position += UINT32_STRUCT.size
+        int_type = header.get('int_type', 'i')
+        int_size = array(int_type).itemsize
+        ints = buffer[position:position + int_size * nb_ints]
+        if sys.byteorder == 'little':
+            ints = ints.cast(int_type)
+        else:
+            ints = array(int_type, bytes(ints))
+            ints.byteswap()
+        position += int_size * nb_ints
+        nb_messages, = UINT32_STRUCT.unpack_from(buffer, position)
+        position += UINT32_STRUCT.size
+        messages = buffer[position:position + nb_messages * MESSAGE_STRUCT.size]
+        position += nb_messages * MESSAGE_STRUCT.size
+        games.append(CompactGameHistory(header, ints, messages, text_log))
+    return games
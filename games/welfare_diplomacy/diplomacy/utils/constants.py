@@ -28,6 +28,9 @@ DEFAULT_BACKUP_DELAY_SECONDS = 10 * 60  # 10 minutes.
 # Default server ping interval. # Used for sockets ping.
 DEFAULT_PING_SECONDS = 30
 
+# Default number of worker threads used by server to process (adjudicate) games.
+DEFAULT_NB_ADJUDICATION_WORKERS = 4
+
 # Time to wait to receive a response for a request sent to server.
 REQUEST_TIMEOUT_SECONDS = 30
 
@@ -16,6 +16,8 @@
 # ==============================================================================
 """ Convoy paths
     - Contains utilities to generate all the possible convoy paths for a given map
+    - Generated paths are kept in a pickle cache, and converted once per map into a memory-mappable
+      index (see :mod:`diplomacy.utils.convoy_paths_index`) that is shared by all processes loading the map.
 """
 import collections
 import hashlib
@@ -28,6 +30,7 @@ import threading
 import tqdm
 from games.welfare_diplomacy.diplomacy.engine.map import Map
 from games.welfare_diplomacy.diplomacy import settings
+from games.welfare_diplomacy.diplomacy.utils.convoy_paths_index import ConvoyPathsIndex, write_convoy_paths_index
 
 # Using `os.path.expanduser()` to find home directory in a more cross-platform way.
 HOME_DIRECTORY = os.path.expanduser('~')
@@ -43,6 +46,7 @@ MAX_CONVOY_LENGTH = 13                      # Convoys over this length are not s
 CACHE_FILE_NAME = 'convoy_paths_cache.pkl'
 INTERNAL_CACHE_PATH = os.path.join(settings.PACKAGE_DIR, 'maps', CACHE_FILE_NAME)
 EXTERNAL_CACHE_PATH = os.path.join(HOME_DIRECTORY, '.cache', 'diplomacy', CACHE_FILE_NAME)
+EXTERNAL_INDEX_DIR = os.path.join(HOME_DIRECTORY, '.cache', 'diplomacy', 'convoy_paths')
 
 def _display_progress_bar(queue, max_loop_iters):
     """ Displays a progress bar
@@ -186,6 +190,26 @@ def get_file_md5(file_path):
             hash_md5.update(chunk)
     return hash_md5.hexdigest()
 
+def get_map_path(map_name):
+    """ Returns the path of the file of a map
+
+        :param map_name: The name of the map (or full path to a custom map file)
+        :return: The path of the map file, or None if the map file does not exist
+    """
+    if os.path.exists(map_name):
+        map_path = map_name
+    else:
+        map_path = os.path.join(settings.PACKAGE_DIR, 'maps', map_name + '.map')
+    return map_path if os.path.exists(map_path) else None
+
+def get_index_path(map_hash):
+    """ Returns the path of the convoy paths index of a map
+
+        :param map_hash: The MD5 hash of the map file
+        :return: The path of the index file (versioned with the convoy paths generator version)
+    """
+    return os.path.join(EXTERNAL_INDEX_DIR, '{}_{}.idx'.format(map_hash, __VERSION__))
+
 def add_to_cache(map_name, max_convoy_length=MAX_CONVOY_LENGTH):
     """ Lazy generates convoys paths for a map and adds it to the disk cache
 
@@ -218,11 +242,8 @@ def add_to_cache(map_name, max_convoy_length=MAX_CONVOY_LENGTH):
             pass
 
     # Getting map MD5 hash
-    if os.path.exists(map_name):
-        map_path = map_name
-    else:
-        map_path = os.path.join(settings.PACKAGE_DIR, 'maps', map_name + '.map')
-    if not os.path.exists(map_path):
+    map_path = get_map_path(map_name)
+    if map_path is None:
         return None
     map_hash = get_file_md5(map_path)
 
@@ -237,6 +258,27 @@ def add_to_cache(map_name, max_convoy_length=MAX_CONVOY_LENGTH):
     # Returning
     return convoy_paths[map_hash]
 
+def get_convoy_paths_index(map_name, build=True):
+    """ Returns the memory-mapped convoy paths index of a map, building it from the cache if needed
+
+        :param map_name: The name of the map (or full path to a custom map file)
+        :param build: Boolean flag to indicate we want to build the index (and generate the convoy paths)
+                      if it does not exist yet
+        :return: A ConvoyPathsIndex, or None if the index does not exist (or the map file does not exist)
+    """
+    map_path = get_map_path(map_name)
+    if map_path is None:
+        return None
+    index_path = get_index_path(get_file_md5(map_path))
+    if not os.path.exists(index_path):
+        if not build:
+            return None
+        convoy_paths = add_to_cache(map_name)
+        if convoy_paths is None:
+            return None
+        write_convoy_paths_index(convoy_paths, index_path, version=__VERSION__)
+    return ConvoyPathsIndex.open(index_path)
+
 def get_convoy_paths_cache():
     """ Returns the current cache from disk """
     disk_convoy_paths = {}                  # Uses hash as key
@@ -276,6 +318,8 @@ def rebuild_all_maps():
     """ Rebuilds all the maps in the external cache """
     if os.path.exists(EXTERNAL_CACHE_PATH):
         os.remove(EXTERNAL_CACHE_PATH)
+    for index_path in glob.glob(os.path.join(EXTERNAL_INDEX_DIR, '*.idx')):
+        os.remove(index_path)
 
     files_path = glob.glob(settings.PACKAGE_DIR + '/maps/*.map')
     for file_path in files_path:
@@ -283,4 +327,4 @@ def rebuild_all_maps():
         map_hash = get_file_md5(file_path)
         print('-' * 80)
         print('Adding {} (Hash: {}) to cache\n'.format(file_path, map_hash))
-        add_to_cache(map_name)
+        get_convoy_paths_index(map_name)
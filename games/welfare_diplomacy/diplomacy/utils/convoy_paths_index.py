@@ -0,0 +1,294 @@
+# ==============================================================================
+# Copyright (C) 2019 - Philip Paquette
+#
+#  This program is free software: you can redistribute it and/or modify it under
+#  the terms of the GNU Affero General Public License as published by the Free
+#  Software Foundation, either version 3 of the License, or (at your option) any
+#  later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#  FOR A PARTICULAR PURPOSE.  See the GNU Affero General Public License for more
+#  details.
+#
+#  You should have received a copy of the GNU Affero General Public License along
+#  with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ==============================================================================
+""" Convoy paths index
+    - Read-only, memory-mappable encoding of the convoy paths of a map
+      (as generated by :mod:`diplomacy.utils.convoy_paths`).
+    - The index file is written once per map and then memory-mapped by every process loading the map,
+      so all processes share the same physical pages and nothing has to be unpickled.
+    - Paths are sorted by number of fleets, and a (start, dest) table gives direct access to all
+      the paths between two locations.
+
+    File layout (little-endian), arrays are aligned on 4 bytes:
+
+    .. code-block:: text
+
+        MAGIC (4 bytes) | header length (u32) | header (JSON, utf-8, padded)
+                        | starts (u16 * nb paths)
+                        | fleet offsets (u32 * (nb paths + 1)) | fleets (u16)
+                        | dest offsets (u32 * (nb paths + 1))  | dests (u16)
+                        | pair keys (u32 * nb pairs, start id * nb locs + dest id, sorted)
+                        | pair offsets (u32 * (nb pairs + 1))  | pair paths (u32)
+"""
+from array import array
+import bisect
+from itertools import islice
+import mmap
+import os
+import struct
+import sys
+
+import ujson as json
+
+# Constants
+MAGIC = b'DCP1'
+UINT32_STRUCT = struct.Struct('<I')
+ARRAYS = (('starts', 'H'),
+          ('fleet_offsets', 'I'), ('fleets', 'H'),
+          ('dest_offsets', 'I'), ('dests', 'H'),
+          ('pair_keys', 'I'), ('pair_offsets', 'I'), ('pair_paths', 'I'))
+
+def _padding(length):
+    """ Return the padding required to align given length on 4 bytes. """
+    return b'\0' * (-length % 4)
+
+def encode_convoy_paths(buckets, version=''):
+    """ Encode convoy paths into the index format.
+
+        :param buckets: Convoy paths bucketed by number of fleets
+            format: {nb of fleets: [(START_LOC, {FLEET LOC}, {DEST LOCS})]}
+        :param version: Version of the convoy paths generator, stored in header.
+        :return: bytes
+    """
+    locs = sorted({loc
+                   for paths in buckets.values()
+                   for start, fleets, dests in paths
+                   for loc in [start] + list(fleets) + list(dests)})
+    loc_ids = {loc: loc_id for loc_id, loc in enumerate(locs)}
+    columns = {name: array(typecode) for name, typecode in ARRAYS}
+    columns['fleet_offsets'].append(0)
+    columns['dest_offsets'].append(0)
+
+    # Paths, sorted by number of fleets
+    bucket_ranges = {}
+    pairs = {}
+    for nb_fleets in sorted(buckets):
+        first_path_id = len(columns['starts'])
+        for start, fleets, dests in buckets[nb_fleets]:
+            path_id = len(columns['starts'])
+            columns['starts'].append(loc_ids[start])
+            columns['fleets'].extend(sorted(loc_ids[loc] for loc in fleets))
+            columns['fleet_offsets'].append(len(columns['fleets']))
+            columns['dests'].extend(sorted(loc_ids[loc] for loc in dests))
+            columns['dest_offsets'].append(len(columns['dests']))
+            for dest in dests:
+                pairs.setdefault(loc_ids[start] * len(locs) + loc_ids[dest], []).append(path_id)
+        bucket_ranges[nb_fleets] = [first_path_id, len(columns['starts'])]
+
+    # (start, dest) table
+    columns['pair_offsets'].append(0)
+    for pair_key in sorted(pairs):
+        columns['pair_keys'].append(pair_key)
+        columns['pair_paths'].extend(pairs[pair_key])
+        columns['pair_offsets'].append(len(columns['pair_paths']))
+
+    header = {'version': version,
+              'locs': locs,
+              'buckets': [[nb_fleets] + bucket_range for nb_fleets, bucket_range in bucket_ranges.items()],
+              'lengths': {name: len(columns[name]) for name, _ in ARRAYS}}
+    header_bytes = json.dumps(header).encode('utf-8')
+    header_bytes += b' ' * (-(len(MAGIC) + UINT32_STRUCT.size + len(header_bytes)) % 4)
+    chunks = [MAGIC, UINT32_STRUCT.pack(len(header_bytes)), header_bytes]
+    for name, _ in ARRAYS:
+        column = columns[name]
+        if sys.byteorder != 'little':
+            column.byteswap()
+        chunks += [column.tobytes(), _padding(len(column) * column.itemsize)]
+    return b''.join(chunks)
+
+def write_convoy_paths_index(buckets, output_path, version=''):
+    """ Write convoy paths to an index file.
+        File is written to a temporary file first and then renamed, so that concurrent readers
+        never see a partially written index.
+
+        :param buckets: Convoy paths bucketed by number of fleets
+        :param output_path: Path of index file to write.
+        :param version: Version of the convoy paths generator, stored in header.
+    """
+    os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+    temp_path = '%s.%d.tmp' % (output_path, os.getpid())
+    with open(temp_path, 'wb') as output_file:
+        output_file.write(encode_convoy_paths(buckets, version))
+    os.replace(temp_path, output_path)
+
+class ConvoyPathsIndex:
+    """ Read-only view on convoy paths stored in index format.
+        Can be used as the {nb of fleets: [(START_LOC, {FLEET LOC}, {DEST LOCS})]} dict it was built from,
+        paths being decoded on access.
+
+        Properties:
+
+        - **path**: path of the index file, or None if index is stored in memory.
+        - **version**: version of the convoy paths generator used to build the index.
+        - **locs**: list of all locations found in convoy paths, indexed by location ID.
+        - **loc_ids**: dict mapping each location to its ID.
+    """
+    __slots__ = ['path', 'version', 'locs', 'loc_ids', 'buffer', 'bucket_ranges', 'starts',
+                 'fleet_offsets', 'fleets', 'dest_offsets', 'dests', 'pair_keys', 'pair_offsets', 'pair_paths',
+                 'decoded_paths']
+
+    def __init__(self, buffer, path=None):
+        """ Constructor
+
+            :param buffer: bytes (or mmap) of the index.
+            :param path: path of the index file, if buffer was read from a file.
+        """
+        self.path = path
+        self.buffer = buffer
+        view = memoryview(buffer)
+        if view[:len(MAGIC)] != MAGIC:
+            raise ValueError('Invalid convoy paths index%s' % (' in %s' % path if path else ''))
+        position = len(MAGIC)
+        header_length, = UINT32_STRUCT.unpack_from(view, position)
+        position += UINT32_STRUCT.size
+        header = json.loads(bytes(view[position:position + header_length]).decode('utf-8'))
+        position += header_length
+        self.version = header['version']
+        self.locs = header['locs']
+        self.loc_ids = {loc: loc_id for loc_id, loc in enumerate(self.locs)}
+        self.bucket_ranges = {nb_fleets: (first, last) for nb_fleets, first, last in header['buckets']}
+        for name, typecode in ARRAYS:
+            length = header['lengths'][name]
+            nb_bytes = length * array(typecode).itemsize
+            column = view[position:position + nb_bytes]
+            if sys.byteorder == 'little':
+                column = column.cast(typecode)
+            else:
+                column = array(typecode, bytes(column))
+                column.byteswap()
+            setattr(self, name, column)
+            position += nb_bytes + len(_padding(nb_bytes))
+        # Per-process list of decoded paths, built on first call to get_possible_paths().
+        self.decoded_paths = None
+
+    @classmethod
+    def open(cls, input_path):
+        """ Memory-map an index file.
+
+            :param input_path: path of index file.
+            :return: ConvoyPathsIndex
+        """
+        with open(input_path, 'rb') as input_file:
+            buffer = mmap.mmap(input_file.fileno(), 0, access=mmap.ACCESS_READ)
+        return cls(buffer, path=input_path)
+
+    @classmethod
+    def from_buckets(cls, buckets, version=''):
+        """ Build an in-memory index from convoy paths bucketed by number of fleets. """
+        return cls(encode_convoy_paths(buckets, version))
+
+    def __reduce__(self):
+        """ Pickle as file path (or bytes for in-memory indexes), so that unpickling re-maps the file. """
+        if self.path is not None:
+            return ConvoyPathsIndex.open, (self.path,)
+        return ConvoyPathsIndex, (bytes(self.buffer),)
+
+    def __copy__(self):
+        """ Index is read-only, so copies are not needed. """
+        return self
+
+    def __deepcopy__(self, memo):
+        """ Index is read-only, so copies are not needed. """
+        return self
+
+    def __len__(self):
+        """ Return number of buckets. """
+        return len(self.bucket_ranges)
+
+    def __iter__(self):
+        """ Iterate over bucket keys (number of fleets). """
+        return iter(self.bucket_ranges)
+
+    def __contains__(self, nb_fleets):
+        """ Determines if there is a bucket for given number of fleets. """
+        return nb_fleets in self.bucket_ranges
+
+    def __getitem__(self, nb_fleets):
+        """ Return list of paths (start, {fleets}, {dests}) using exactly nb_fleets fleets. """
+        first, last = self.bucket_ranges[nb_fleets]
+        return [self.get_path(path_id) for path_id in range(first, last)]
+
+    def get(self, nb_fleets, default=None):
+        """ Return list of paths using exactly nb_fleets fleets, or default if there is no such bucket. """
+        return self[nb_fleets] if nb_fleets in self.bucket_ranges else default
+
+    def keys(self):
+        """ Return bucket keys (number of fleets). """
+        return self.bucket_ranges.keys()
+
+    def items(self):
+        """ Iterate over (number of fleets, list of paths) couples. """
+        for nb_fleets in self.bucket_ranges:
+            yield nb_fleets, self[nb_fleets]
+
+    def values(self):
+        """ Iterate over lists of paths for each bucket. """
+        for nb_fleets in self.bucket_ranges:
+            yield self[nb_fleets]
+
+    @property
+    def nb_paths(self):
+        """ Return total number of convoy paths. """
+        return len(self.starts)
+
+    def get_path(self, path_id):
+        """ Decode a path.
+
+            :param path_id: ID of path (position of path in index).
+            :return: (START_LOC, {FLEET LOC}, {DEST LOCS})
+        """
+        locs = self.locs
+        fleets = self.fleets[self.fleet_offsets[path_id]:self.fleet_offsets[path_id + 1]]
+        dests = self.dests[self.dest_offsets[path_id]:self.dest_offsets[path_id + 1]]
+        return locs[self.starts[path_id]], {locs[loc_id] for loc_id in fleets}, {locs[loc_id] for loc_id in dests}
+
+    def get_fleets(self, start, dest):
+        """ Return all the sets of fleets able to convoy a unit from start to dest.
+
+            :param start: start location (e.g. 'LON')
+            :param dest: destination location (e.g. 'BRE')
+            :return: list of {FLEET LOC}, sorted by number of fleets
+        """
+        start_id, dest_id = self.loc_ids.get(start), self.loc_ids.get(dest)
+        if start_id is None or dest_id is None:
+            return []
+        pair_key = start_id * len(self.locs) + dest_id
+        position = bisect.bisect_left(self.pair_keys, pair_key)
+        if position == len(self.pair_keys) or self.pair_keys[position] != pair_key:
+            return []
+        locs, fleet_offsets = self.locs, self.fleet_offsets
+        return [{locs[loc_id] for loc_id in self.fleets[fleet_offsets[path_id]:fleet_offsets[path_id + 1]]}
+                for path_id in self.pair_paths[self.pair_offsets[position]:self.pair_offsets[position + 1]]]
+
+    def get_possible_paths(self, convoying_locs):
+        """ Return all paths that can be convoyed using only fleets at given locations.
+
+            :param convoying_locs: collection of locations with a fleet able to convoy.
+            :return: list of (START_LOC, {FLEET LOC}, {DEST LOCS}), sorted by number of fleets
+        """
+        convoying_locs = set(convoying_locs)
+        if self.decoded_paths is None:
+            self.decoded_paths = [self.get_path(path_id) for path_id in range(self.nb_paths)]
+
+        # Paths are sorted by number of fleets, so we can stop at the last path using len(convoying_locs) fleets
+        last_path_id = 0
+        for nb_fleets, (_, last) in self.bucket_ranges.items():
+            if nb_fleets <= len(convoying_locs):
+                last_path_id = max(last_path_id, last)
+
+        return [path for path in islice(self.decoded_paths, last_path_id) if path[1].issubset(convoying_locs)]
+
+EMPTY_CONVOY_PATHS = ConvoyPathsIndex.from_buckets({})
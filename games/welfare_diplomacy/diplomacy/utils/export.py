@@ -23,6 +23,7 @@ import ujson as json
 from games.welfare_diplomacy.diplomacy.engine.game import Game
 from games.welfare_diplomacy.diplomacy.engine.map import Map
 from games.welfare_diplomacy.diplomacy.utils import strings
+from games.welfare_diplomacy.diplomacy.utils.compact_history import read_compact_games, write_compact_games
 from games.welfare_diplomacy.diplomacy.utils.game_phase_data import GamePhaseData
 
 # Constants
@@ -124,6 +125,49 @@ def load_saved_games_from_disk(input_path, on_error='raise'):
     # Returning
     return loaded_games
 
+def to_compact_saved_game_format(games, output_path, output_mode='a'):
+    """ Writes games to disk in the compact binary format (see :mod:`diplomacy.utils.compact_history`)
+        Strings are interned per game and message bodies are written in a separate text log
+        (output_path + '.messages'), which makes files much smaller than the .jsonl saved games.
+
+        :param games: A game, a saved game (from :meth:`to_saved_game_format`), or a list of those.
+        :param output_path: Path to file.
+        :param output_mode: Optional. The mode to use to write to the output_path. Either 'a' (default) or 'w'.
+        :return: The number of bytes written to output_path (message text log excluded)
+        :type output_path: str
+        :type output_mode: str, optional
+        :rtype: int
+    """
+    if not isinstance(games, (list, tuple)):
+        games = [games]
+
+    def _iter_games():
+        """ Yield (header, phase dicts) for each game. """
+        for game in games:
+            saved_game = to_saved_game_format(game) if isinstance(game, Game) else game
+            header = {'id': saved_game['id'], 'map': saved_game['map'], 'rules': saved_game['rules']}
+            yield header, saved_game['phases']
+
+    return write_compact_games(_iter_games(), output_path, output_mode)
+
+def load_compact_saved_games_from_disk(input_path, as_games=False):
+    """ Loads games saved with :meth:`to_compact_saved_game_format`
+
+        :param input_path: The path to the input file.
+        :param as_games: Optional. If True, rebuild :class:`diplomacy.engine.game.Game` objects.
+            Otherwise (default), return lightweight read-only :class:`diplomacy.utils.compact_history.CompactGameHistory`
+            views, that decode phases on demand (much faster for analysis).
+        :type input_path: str
+        :rtype: List[diplomacy.utils.compact_history.CompactGameHistory] | List[diplomacy.Game]
+    """
+    if not os.path.exists(input_path):
+        LOGGER.warning('File %s does not exist. Aborting.', input_path)
+        return []
+    compact_games = read_compact_games(input_path)
+    if as_games:
+        return [from_saved_game_format(compact_game.to_saved_game()) for compact_game in compact_games]
+    return compact_games
+
 def is_valid_saved_game(saved_game):
     """ Checks if the saved game is valid.
         This is an expensive operation because it replays the game.
@@ -20,7 +20,7 @@ from games.welfare_diplomacy.diplomacy.utils.sorted_set import SortedSet
 
 class SortedDict:
     """ Dict with sorted keys. """
-    __slots__ = ['__val_type', '__keys', '__couples']
+    __slots__ = ['__val_type', '__keys', '__couples', '__shared']
 
     def __init__(self, key_type, val_type, kwargs=None):
         """ Initialize a typed SortedDict.
@@ -32,6 +32,7 @@ class SortedDict:
         self.__val_type = val_type
         self.__keys = SortedSet(key_type)
         self.__couples = {}
+        self.__shared = False
         if kwargs is not None:
             assert is_dictionary(kwargs)
             for key, value in kwargs.items():
@@ -105,15 +106,18 @@ class SortedDict:
         """ Add a key with a value to the dict. """
         if not isinstance(value, self.__val_type):
             raise TypeError('Expected value type %s, got %s' % (self.__val_type, type(value)))
-        if key not in self.__keys:
+        self.__unshare()
+        if key not in self.__couples:
             self.__keys.add(key)
         self.__couples[key] = value
 
     def remove(self, key):
         """ Pop (remove and return) value associated with given key, or None if key not found. """
-        if key in self.__couples:
-            self.__keys.remove(key)
-        return self.__couples.pop(key, None)
+        if key not in self.__couples:
+            return None
+        self.__unshare()
+        self.__keys.remove(key)
+        return self.__couples.pop(key)
 
     def first_key(self):
         """ Get the lowest key from the dict. """
@@ -252,6 +256,11 @@ class SortedDict:
 
     def clear(self):
         """ Remove all items from dict. """
+        if self.__shared:
+            self.__keys = SortedSet(self.__keys.element_type)
+            self.__couples = {}
+            self.__shared = False
+            return
         self.__couples.clear()
         self.__keys.clear()
 
@@ -265,3 +274,27 @@ class SortedDict:
     def copy(self):
         """ Return a copy of this sorted dict. """
         return SortedDict(self.__keys.element_type, self.__val_type, self.__couples)
+
+    def share(self):
+        """ Return a copy-on-write copy of this sorted dict.
+
+            Both dicts share the same internal storage until one of them is modified,
+            at which point the modified dict takes its own (shallow) copy of keys and values.
+            Values themselves are never copied, so this is intended for dicts whose values
+            are not mutated in place (e.g. game histories).
+
+            :return: a new SortedDict, built in constant time.
+        """
+        shared = SortedDict.__new__(SortedDict)
+        shared.__val_type = self.__val_type
+        shared.__keys = self.__keys
+        shared.__couples = self.__couples
+        shared.__shared = self.__shared = True
+        return shared
+
+    def __unshare(self):
+        """ Take a private copy of internal storage if it is currently shared with another dict. """
+        if self.__shared:
+            self.__keys = self.__keys.copy()
+            self.__couples = dict(self.__couples)
+            self.__shared = False
@@ -96,7 +96,11 @@ class SortedSet:
     def add(self, element):
         """ Add an element. """
         assert isinstance(element, self.__type)
-        if self.__list:
+        if self.__list and self.__list[-1] < element:
+            # Fast path for elements added in increasing order (e.g. game phases).
+            self.__list.append(element)
+            best_position = len(self.__list) - 1
+        elif self.__list:
             best_position = bisect.bisect_left(self.__list, element)
             if best_position == len(self.__list):
                 self.__list.append(element)
@@ -159,3 +163,9 @@ class SortedSet:
     def clear(self):
         """ Remove all items from set. """
         self.__list.clear()
+
+    def copy(self):
+        """ Return a shallow copy of this sorted set (values are already sorted, so no re-insertion). """
+        result = SortedSet(self.__type)
+        result.__list = list(self.__list)
+        return result
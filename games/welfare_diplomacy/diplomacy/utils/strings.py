@@ -103,6 +103,7 @@ MODERATORS = 'moderators'
 N_CONTROLS = 'n_controls'
 N_PLAYERS = 'n_players'
 NAME = 'name'
+NB_ADJUDICATION_WORKERS = 'nb_adjudication_workers'
 NEUTRAL = 'neutral'
 NO = 'no'
 NO_RULES = 'no_rules'
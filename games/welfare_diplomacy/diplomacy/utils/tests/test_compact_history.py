@@ -0,0 +1,73 @@
+# ==============================================================================
+# Copyright (C) 2019 - Philip Paquette, Steven Bocco
+#
+#  This program is free software: you can redistribute it and/or modify it under
+#  the terms of the GNU Affero General Public License as published by the Free
+#  Software Foundation, either version 3 of the License, or (at your option) any
+#  later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#  FOR A PARTICULAR PURPOSE.  See the GNU Affero General Public License for more
+#  details.
+#
+#  You should have received a copy of the GNU Affero General Public License along
+#  with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ==============================================================================
+""" Test compact phase history format. """
+import os
+import tempfile
+
+import ujson as json
+
+from games.welfare_diplomacy.diplomacy.engine.game import Game
+from games.welfare_diplomacy.diplomacy.engine.message import Message, GLOBAL
+from games.welfare_diplomacy.diplomacy.utils import export
+
+def _play_game():
+    """ Play a few phases with orders and messages. """
+    game = Game()
+    game.add_message(Message(phase=game.current_short_phase, sender='FRANCE', recipient=GLOBAL, message='Hello'))
+    game.add_message(Message(phase=game.current_short_phase, sender='FRANCE', recipient='ENGLAND',
+                             message='Bonjour l\'Angleterre, ça va ?'))
+    game.set_orders('FRANCE', ['A PAR - BUR', 'A MAR - SPA'])
+    game.set_orders('GERMANY', ['A MUN - BUR'])
+    game.process()
+    game.set_orders('FRANCE', ['A SPA - POR'])
+    game.process()
+    game.process()
+    game.add_message(Message(phase=game.current_short_phase, sender='ITALY', recipient='AUSTRIA', message='Peace?'))
+    return game
+
+def test_compact_round_trip():
+    """ Test that games written in compact format are read back identically. """
+    game = _play_game()
+    saved_game = export.to_saved_game_format(game)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'games.dph')
+        export.to_compact_saved_game_format([saved_game, saved_game], path, output_mode='w')
+        export.to_compact_saved_game_format(game, path)
+        compact_games = export.load_compact_saved_games_from_disk(path)
+        assert len(compact_games) == 3
+        expected = json.loads(json.dumps(saved_game))
+        for compact_game in compact_games:
+            assert compact_game.phase_names == [phase['name'] for phase in saved_game['phases']]
+            loaded = json.loads(json.dumps(compact_game.to_saved_game()))
+            if compact_game is compact_games[-1]:
+                # Current phase state of a game is exported with a new timestamp.
+                loaded['phases'][-1]['state']['timestamp'] = expected['phases'][-1]['state']['timestamp']
+            assert loaded == expected
+        assert len(compact_games[0].get_messages(0)) == 2
+        assert compact_games[0].get_messages(0)[1]['message'] == 'Bonjour l\'Angleterre, ça va ?'
+
+        for (phase_name, counts), phase in zip(compact_games[0].iter_power_counts(), saved_game['phases']):
+            assert phase_name == phase['name']
+            assert counts == {power_name: (len(units), len(phase['state']['centers'][power_name]),
+                                           phase['state']['welfare_points'][power_name])
+                              for power_name, units in phase['state']['units'].items()}
+
+        loaded_game, = export.load_compact_saved_games_from_disk(path, as_games=True)[:1]
+        assert loaded_game.get_current_phase() == game.get_current_phase()
+        assert loaded_game.get_hash() == game.get_hash()
+        assert len(loaded_game.messages) == 1
+        assert len(loaded_game.message_history) == len(game.message_history)
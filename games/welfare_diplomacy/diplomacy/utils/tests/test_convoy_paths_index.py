@@ -0,0 +1,66 @@
+# ==============================================================================
+# Copyright (C) 2019 - Philip Paquette
+#
+#  This program is free software: you can redistribute it and/or modify it under
+#  the terms of the GNU Affero General Public License as published by the Free
+#  Software Foundation, either version 3 of the License, or (at your option) any
+#  later version.
+#
+#  This program is distributed in the hope that it will be useful, but WITHOUT
+#  ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS
+#  FOR A PARTICULAR PURPOSE.  See the GNU Affero General Public License for more
+#  details.
+#
+#  You should have received a copy of the GNU Affero General Public License along
+#  with this program.  If not, see <https://www.gnu.org/licenses/>.
+# ==============================================================================
+""" Test convoy paths index. """
+from copy import deepcopy
+import os
+import pickle
+import tempfile
+
+from games.welfare_diplomacy.diplomacy.engine.map import Map
+from games.welfare_diplomacy.diplomacy.utils.convoy_paths import add_to_cache
+from games.welfare_diplomacy.diplomacy.utils.convoy_paths_index import ConvoyPathsIndex, write_convoy_paths_index
+
+def test_index_matches_buckets():
+    """ Test that index returns the same paths as the buckets it was built from. """
+    buckets = add_to_cache('standard')
+    with tempfile.TemporaryDirectory() as temp_dir:
+        index_path = os.path.join(temp_dir, 'standard.idx')
+        write_convoy_paths_index(buckets, index_path, version='test')
+        index = ConvoyPathsIndex.open(index_path)
+        assert index.version == 'test'
+        assert list(index) == list(buckets)
+        assert index.nb_paths == sum(len(paths) for paths in buckets.values())
+        for nb_fleets, paths in buckets.items():
+            assert index[nb_fleets] == paths
+
+        # Lookups by (start, dest)
+        expected_fleets = [fleets for paths in buckets.values() for start, fleets, dests in paths
+                           if start == 'LON' and 'BRE' in dests]
+        assert expected_fleets
+        assert index.get_fleets('LON', 'BRE') == expected_fleets
+        assert index.get_fleets('LON', 'MOS') == []
+        assert index.get_fleets('XYZ', 'BRE') == []
+
+        # Paths available with given fleets
+        convoying_locs = {'ENG', 'MAO', 'NTH', 'BUR'}
+        assert index.get_possible_paths(convoying_locs) == [path for nb_fleets in range(1, len(convoying_locs) + 1)
+                                                            for path in buckets[nb_fleets]
+                                                            if path[1].issubset(convoying_locs)]
+
+        # Pickling re-maps the file, copies are not needed
+        assert pickle.loads(pickle.dumps(index)).path == index_path
+        assert deepcopy(index) is index
+
+def test_map_convoy_paths():
+    """ Test that maps load the convoy paths index. """
+    this_map = Map('standard')
+    assert isinstance(this_map.convoy_paths, ConvoyPathsIndex)
+    assert this_map.convoy_paths.nb_paths
+    assert deepcopy(this_map).convoy_paths is this_map.convoy_paths
+    empty_index = ConvoyPathsIndex.from_buckets({})
+    assert not empty_index.nb_paths
+    assert empty_index.get_possible_paths({'ENG'}) == []
@@ -134,6 +134,22 @@ def test_equality():
     assert sorted_dict_float_int_1 == sorted_dict_float_int_2
     assert sorted_dict_float_int_1 != sorted_dict_float_int_3
 
+def test_share():
+    """ Test SortedDict method share() (copy-on-write copy). """
+
+    sorted_dict = SortedDict(int, str, {1: 'one', 2: 'two'})
+    shared = sorted_dict.share()
+    assert shared == sorted_dict
+    shared.put(3, 'three')
+    assert 3 in shared and 3 not in sorted_dict
+    sorted_dict.remove(1)
+    assert 1 in shared and 1 not in sorted_dict
+    shared_again = shared.share()
+    shared_again.clear()
+    assert not shared_again
+    assert list(shared.keys()) == [1, 2, 3]
+    assert list(sorted_dict.keys()) == [2]
+
 def test_sub_and_remove_sub():
     """Test SortedDict methods sub() and remove_sub()."""
 
@@ -154,7 +154,7 @@ for i in range(0, max_years, step): # focal
         print(f'Background: switches after {j} years')
 
         # Create a new game instance
-        game_instance = Game()
+        game_instance = Game(simulation=True)
         initial_state = diplomacy_state.WelfareDiplomacyState(game_instance)
 
         # Focal policy
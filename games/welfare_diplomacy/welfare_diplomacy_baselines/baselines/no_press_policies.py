@@ -299,7 +299,7 @@ def smart_policy_experiment():
     for year in range(4):
         for pow in range(7):
             logging.info(f"Power {pow} plays SwitchPolicy with SmartDisbandPolicy(num_to_disband=1) from year {year}")
-            game_instance = Game(map_name="standard_welfare")
+            game_instance = Game(map_name="standard_welfare", simulation=True)
             initial_state = diplomacy_state.WelfareDiplomacyState(game_instance)
             test_policy = SwitchPolicy(disband_policies.SmartDisbandPolicy(num_to_disband=1), year_to_switch=year)
             bg_policy = get_network_policy_instance()
@@ -314,7 +314,7 @@ def smart_policy_experiment():
             )
 
             logging.info(f"Power {pow} plays SwitchPolicy with RandomDisbandPolicy(num_to_disband=1) from year {year}")
-            game_instance = Game(map_name="standard_welfare")
+            game_instance = Game(map_name="standard_welfare", simulation=True)
             initial_state = diplomacy_state.WelfareDiplomacyState(game_instance)
             test_policy = SwitchPolicy(disband_policies.RandomDisbandPolicy(num_to_disband=1), year_to_switch=year)
             bg_policy = get_network_policy_instance()
@@ -329,7 +329,7 @@ def smart_policy_experiment():
             )
 
 def exploiter_test():
-    game_instance = Game(map_name="standard_welfare")
+    game_instance = Game(map_name="standard_welfare", simulation=True)
     initial_state = diplomacy_state.WelfareDiplomacyState(game_instance)
     background_policy = disband_policies.RandomDisbandPolicy(p=0.2, max_years=10)
     test_policy = ExploiterPolicy(9, 12, 0, disband_policies.SmartDisbandPolicy(num_to_disband=1))
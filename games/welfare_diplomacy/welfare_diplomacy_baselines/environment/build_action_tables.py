@@ -0,0 +1,46 @@
+# Copyright 2021 DeepMind Technologies Limited
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#    http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+# ==============================================================================
+
+"""Rebuilds the derived action tables stored in environment/data.
+
+Run this after changing data/possible_actions.npy or the action conversions in
+mila_actions.py:
+
+  python environment/build_action_tables.py
+"""
+
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
+
+import numpy as np
+
+from environment import action_list
+from environment import mila_actions
+
+
+def main():
+  keys, offsets, actions = mila_actions.build_mila_action_index(
+      action_list.POSSIBLE_ACTIONS)
+  np.save(action_list.MILA_ACTION_INDEX_KEYS_PATH, keys)
+  np.save(action_list.MILA_ACTION_INDEX_OFFSETS_PATH, offsets)
+  np.save(action_list.MILA_ACTION_INDEX_ACTIONS_PATH, actions)
+  print(f'Wrote MILA action index: {len(keys)} MILA actions, '
+        f'{len(actions)} actions.')
+
+
+if __name__ == '__main__':
+  main()
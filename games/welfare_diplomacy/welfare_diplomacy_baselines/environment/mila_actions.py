@@ -24,6 +24,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), ".."))
 import collections
 from typing import List, Set, Union
 import immutabledict
+import numpy as np
 
 from environment import action_list, action_utils, province_order
 from environment import observation_utils as utils
@@ -288,23 +289,38 @@ def action_to_mila_actions(
     return list(mila_action_strings)
 
 
-# Build Inverse Mapping
-_mila_action_to_deepmind_actions = collections.defaultdict(set)
-for _action in action_list.POSSIBLE_ACTIONS:
-    _mila_action_list = action_to_mila_actions(_action)
-    for _mila_action in _mila_action_list:
-        _mila_action_to_deepmind_actions[_mila_action].add(_action)
-_mila_action_to_deepmind_actions = immutabledict.immutabledict(
-    {k: frozenset(v) for k, v in _mila_action_to_deepmind_actions.items()}
-)
+def build_mila_action_index(possible_actions):
+    """Builds the inverse mapping from MILA action strings to deepmind actions.
+
+    Returns (keys, offsets, actions) arrays, in the format of
+    action_list.MILA_ACTION_INDEX. Used by build_action_tables.py.
+    """
+    mila_action_to_deepmind_actions = collections.defaultdict(set)
+    for action in possible_actions:
+        for mila_action in action_to_mila_actions(action):
+            mila_action_to_deepmind_actions[mila_action].add(int(action))
+    keys = sorted(mila_action_to_deepmind_actions)
+    offsets = np.zeros(len(keys) + 1, dtype=np.int64)
+    actions = []
+    for key_index, key in enumerate(keys):
+        actions.extend(sorted(mila_action_to_deepmind_actions[key]))
+        offsets[key_index + 1] = len(actions)
+    return (
+        np.asarray(keys, dtype=np.bytes_),
+        offsets,
+        np.asarray(actions, dtype=np.int64),
+    )
 
 
 def mila_action_to_possible_actions(mila_action: str) -> List[action_utils.Action]:
     """Converts a MILA action string to all deepmind actions it could refer to."""
-    if mila_action not in _mila_action_to_deepmind_actions:
+    keys, offsets, actions = action_list.MILA_ACTION_INDEX
+    encoded_action = mila_action.encode()
+    key_index = np.searchsorted(keys, encoded_action)
+    if key_index == len(keys) or keys[key_index] != encoded_action:
         raise ValueError("Unrecognised MILA action %s" % mila_action)
     else:
-        return list(_mila_action_to_deepmind_actions[mila_action])
+        return list(actions[offsets[key_index]:offsets[key_index + 1]])
 
 
 def mila_action_to_action(
@@ -6,6 +6,7 @@ import gym
 from gym.core import RenderFrame
 
 from games.welfare_diplomacy.diplomacy import Game, GamePhaseData, Message, Power
+from agent_manager.agents.welfare_diplomacy.constants import SUMMARIZER_MAX_CONCURRENCY_DEFAULT
 from agent_manager.agents.welfare_diplomacy.utils import assert_comma_separated_string
 from agent_manager.agents.welfare_diplomacy.message_summarizers import (
     MessageSummarizer,
@@ -62,7 +63,10 @@ class WelfareDiplomacyEnv(gym.Env):
         self.message_summarizer = (
             model_name_to_message_summarizer(
                 self.summarizer_model,
-                logger=self.logger
+                logger=self.logger,
+                max_concurrency=self.args.game.get(
+                    "game_summarizer_max_concurrency", SUMMARIZER_MAX_CONCURRENCY_DEFAULT
+                ),
             )
             if not self.game.no_press
             else None
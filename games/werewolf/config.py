@@ -22,6 +22,10 @@ NAMES = [
 ]  # names of famous Werewolves according to Wikipedia
 RUN_SYNTHETIC_VOTES = True
 MAX_DEBATE_TURNS = 8
+MAX_BID = 4
+# Opt-in shortcuts for bidding. Both favour faster models, so they are off by default.
+BID_EARLY_EXIT = False  # if True, the first MAX_BID bid takes the floor without waiting for other bids
+BID_TIMEOUT = None  # if set, seconds to collect bids before picking the next speaker
 NUM_PLAYERS = 8
 _THREADS=1
 def get_player_names(): 
@@ -15,14 +15,14 @@
 """Werewolf game."""
 
 from collections import Counter
-from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
 import random
 from typing import List
 
 import tqdm
 
 from games.werewolf.model import Round, RoundLog, State, VoteLog
-from games.werewolf.config import  MAX_DEBATE_TURNS, RUN_SYNTHETIC_VOTES
+from games.werewolf.config import  BID_EARLY_EXIT, BID_TIMEOUT, MAX_BID, MAX_DEBATE_TURNS, RUN_SYNTHETIC_VOTES
 
 def get_max_bids(d):
   """Gets all the keys with the highest value in the dictionary."""
@@ -149,7 +149,7 @@ class GameMaster:
   def _get_bid(self, player_name):
     """Gets the bid for a specific player."""
     player = self.state.players[player_name]
-    bid, log = player.bid()
+    bid, rationale, log = player.bid()
     if bid is None:
       raise ValueError(
           f"{player_name} did not return a valid bid. Find the raw response"
@@ -157,7 +157,7 @@ class GameMaster:
       )
     if bid > 1:
       tqdm.tqdm.write(f"{player_name} bid: {bid}")
-    return bid, log
+    return bid, rationale, log
 
   def get_next_speaker(self):
     """Determine the next speaker based on bids."""
@@ -165,23 +165,47 @@ class GameMaster:
         self.this_round.debate[-1] if self.this_round.debate else (None, None)
     )
 
-    with ThreadPoolExecutor(max_workers=self.num_threads) as executor:
-      player_bids = {
-          player_name: executor.submit(self._get_bid, player_name)
-          for player_name in self.this_round.players
-          if player_name != previous_speaker
-      }
+    # Bids are collected as they complete. If enabled in the config, bidding
+    # stops at the first maximum bid (BID_EARLY_EXIT) or after BID_TIMEOUT, and
+    # outstanding bids are cancelled, so that a slow player does not stall the
+    # debate. By default, all bids are awaited.
+    executor = ThreadPoolExecutor(max_workers=self.num_threads)
+    bid_tasks = {
+        executor.submit(self._get_bid, player_name): player_name
+        for player_name in self.this_round.players
+        if player_name != previous_speaker
+    }
+
+    bid_log = []
+    bids = {}
+
+    def collect(bid_task):
+      player_name = bid_tasks[bid_task]
+      bid, rationale, log = bid_task.result()
+      # Only collected bids update the player: an ignored bid still running
+      # must not change the player during the debate.
+      self.state.players[player_name].bidding_rationale = rationale
+      bids[player_name] = bid
+      bid_log.append((player_name, log))
+      return bid
 
-      bid_log = []
-      bids = {}
+    try:
       try:
-        for player_name, bid_task in player_bids.items():
-          bid, log = bid_task.result()
-          bids[player_name] = bid
-          bid_log.append((player_name, log))
-      except TypeError as e:
-        print(e)
-        raise e
+        for bid_task in as_completed(bid_tasks, timeout=BID_TIMEOUT):
+          if collect(bid_task) == MAX_BID and BID_EARLY_EXIT:
+            break
+      except TimeoutError:
+        if not bids:
+          # Nobody bid in time: wait for the first bid.
+          collect(next(as_completed(bid_tasks)))
+        late_bidders = [name for name in bid_tasks.values() if name not in bids]
+        tqdm.tqdm.write(f"Bids not received in time: {late_bidders}")
+    except TypeError as e:
+      print(e)
+      raise e
+    finally:
+      # Do not wait for running bids, their results are ignored.
+      executor.shutdown(wait=False, cancel_futures=True)
 
     self.this_round.bids.append(bids)
     self.this_round_log.bid.append(bid_log)
@@ -15,7 +15,7 @@
 import dataclasses
 from typing import Any, Dict, List, Optional
 
-import jinja2
+from agent_manager.prompts.renderer import render_prompt
 from games.werewolf import utils
 from games.werewolf.utils import Deserializable
 from games.werewolf import apis
@@ -34,7 +34,7 @@ class LmLog(Deserializable):
 
 
 def format_prompt(prompt_template, worldstate) -> str:
-    return jinja2.Template(prompt_template).render(worldstate)
+    return render_prompt(prompt_template, worldstate)
 
 
 def generate(
@@ -77,7 +77,7 @@ def generate(
                 disable_recitation=True,
                 disable_safety_check=True,
             )
-            result = utils.parse_json(raw_resp)
+            result = utils.parse_json(raw_resp, response_schema)
             print("================prompt==============")
             print(prompt)
             print("=================prompt=============")
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import bisect
 import enum
 import json
 import random
@@ -20,7 +21,7 @@ from typing import Any, Dict, List, Optional, Tuple, Union
 from games.werewolf.lm import LmLog, generate
 from agent_manager.prompts.werewolf_prompt import ACTION_PROMPTS_AND_SCHEMAS
 from games.werewolf.utils import Deserializable
-from games.werewolf.config import  MAX_DEBATE_TURNS, NUM_PLAYERS
+from games.werewolf.config import  MAX_BID, MAX_DEBATE_TURNS, NUM_PLAYERS
 
 # Role names
 VILLAGER = "Villager"
@@ -29,6 +30,12 @@ SEER = "Seer"
 DOCTOR = "Doctor"
 
 
+def parse_observation(observation):
+  """Splits an observation "Round X: text" into its round number and text."""
+  prefix, text = observation.split(":", 1)
+  return int(prefix.split()[1]), text.strip().replace('"', "")
+
+
 def group_and_format_observations(observations):
   """Groups observations by round and formats them for output.
 
@@ -42,8 +49,7 @@ def group_and_format_observations(observations):
 
   grouped = {}
   for obs in observations:
-    round_num = int(obs.split(":", 1)[0].split()[1])
-    obs_text = obs.split(":", 1)[1].strip().replace('"', "")
+    round_num, obs_text = parse_observation(obs)
     grouped.setdefault(round_num, []).append(obs_text)
 
   formatted_obs = []
@@ -63,7 +69,8 @@ class JsonEncoder(json.JSONEncoder):
       return o.value
     if isinstance(o, set):
       return list(o)
-    return o.__dict__
+    # Private attributes are caches derived from public ones.
+    return {k: v for k, v in o.__dict__.items() if not k.startswith("_")}
 
 def to_dict(o: Any) -> Union[Dict[str, Any], List[Any], Any]:
   return json.loads(JsonEncoder().encode(o))
@@ -102,7 +109,13 @@ class GameView:
 
   @classmethod
   def from_json(cls, data: Dict[Any, Any]):
-    return cls(**data)
+    o = cls(
+        round_number=data["round_number"],
+        current_players=data["current_players"],
+        other_wolf=data.get("other_wolf", None),
+    )
+    o.debate = [tuple(entry) for entry in data.get("debate", [])]
+    return o
 
 
 class Player(Deserializable):
@@ -122,6 +135,14 @@ class Player(Deserializable):
     self.observations: List[str] = []
     self.bidding_rationale = ""
     self.gamestate: Optional[GameView] = None
+    # Observations grouped and formatted by round, and formatted debate lines,
+    # extended with new entries only (see _update_observation_view()).
+    self._observation_rounds: List[int] = []
+    self._observation_blocks: List[str] = []
+    self._observations_seen = 0
+    self._last_observation: Optional[str] = None
+    self._debate_lines: List[str] = []
+    self._last_debate_entry: Optional[Tuple[str, str]] = None
 
   def initialize_game_view(
       self, round_number, current_players, other_wolf=None
@@ -155,14 +176,8 @@ class Player(Deserializable):
         for player in self.gamestate.current_players
     ]
     random.shuffle(remaining_players)
-    formatted_debate = [
-        f"{author} (You): {dialogue}"
-        if author == self.name
-        else f"{author}: {dialogue}"
-        for author, dialogue in self.gamestate.debate
-    ]
-
-    formatted_observations = group_and_format_observations(self.observations)
+    formatted_debate = self._update_debate_view()
+    formatted_observations = self._update_observation_view()
 
     return {
         "name": self.name,
@@ -178,6 +193,61 @@ class Player(Deserializable):
         "num_villagers": NUM_PLAYERS - 4, 
     }
 
+  def _update_observation_view(self) -> List[str]:
+    """Returns observations grouped and formatted by round.
+
+    Only observations added since the previous call are parsed. The view is
+    rebuilt if the observations list was replaced or truncated.
+    """
+    seen = self._observations_seen
+    if len(self.observations) < seen or (
+        seen and self.observations[seen - 1] is not self._last_observation
+    ):
+      self._observation_rounds = []
+      self._observation_blocks = []
+      seen = 0
+
+    for obs in self.observations[seen:]:
+      round_num, obs_text = parse_observation(obs)
+      index = bisect.bisect_left(self._observation_rounds, round_num)
+      if (
+          index < len(self._observation_rounds)
+          and self._observation_rounds[index] == round_num
+      ):
+        self._observation_blocks[index] += f"\n   - {obs_text}"
+      else:
+        self._observation_rounds.insert(index, round_num)
+        self._observation_blocks.insert(
+            index, f"Round {round_num}:\n   - {obs_text}"
+        )
+
+    self._observations_seen = len(self.observations)
+    self._last_observation = self.observations[-1] if self.observations else None
+    return list(self._observation_blocks)
+
+  def _update_debate_view(self) -> List[str]:
+    """Returns the debate lines formatted from the player's perspective.
+
+    Only entries added since the previous call are formatted. The view is
+    rebuilt if the debate was cleared or replaced.
+    """
+    debate = self.gamestate.debate
+    seen = len(self._debate_lines)
+    if len(debate) < seen or (
+        seen and debate[seen - 1] is not self._last_debate_entry
+    ):
+      self._debate_lines = []
+      seen = 0
+
+    self._debate_lines.extend(
+        f"{author} (You): {dialogue}"
+        if author == self.name
+        else f"{author}: {dialogue}"
+        for author, dialogue in debate[seen:]
+    )
+    self._last_debate_entry = debate[-1] if debate else None
+    return list(self._debate_lines)
+
   def _generate_action(
       self,
       action: str,
@@ -227,13 +297,17 @@ class Player(Deserializable):
       )
     return vote, log
 
-  def bid(self) -> tuple[int , LmLog]:
-    """Place a bid."""
-    bid, log = self._generate_action("bid", options=["0", "1", "2", "3", "4"])
+  def bid(self) -> tuple[int , str, LmLog]:
+    """Place a bid. The bidding rationale is returned rather than stored, so
+    that a bid ignored by the game master does not change the player."""
+    bid, log = self._generate_action(
+        "bid", options=[str(b) for b in range(MAX_BID + 1)]
+    )
+    rationale = ""
     if bid is not None:
       bid = int(bid)
-      self.bidding_rationale = log.result.get("reasoning", "")
-    return bid, log
+      rationale = log.result.get("reasoning", "")
+    return bid, rationale, log
 
   def debate(self) -> tuple[str , LmLog]:
     """Engage in the debate."""
@@ -15,40 +15,15 @@
 """utility functions."""
 
 from typing import Any
-import yaml
 from abc import ABC
 from abc import abstractmethod
-import marko
 
+from agent_manager.prompts.json_extraction import extract_json
 
-def parse_json(text: str) :
-    result_json = parse_json_markdown(text)
 
-    if not result_json:
-        result_json = parse_json_str(text)
-    return result_json
-
-
-def parse_json_markdown(text: str) :
-    ast = marko.parse(text)
-
-    for c in ast.children:
-        # find the first json block (```json or ```JSON)
-        if hasattr(c, "lang") and c.lang.lower() == "json":
-            json_str = c.children[0].children
-            return parse_json_str(json_str)
-
-    return None
-
-
-def parse_json_str(text: str) :
-    try:
-        # use yaml.safe_load which handles missing quotes around field names.
-        result_json = yaml.safe_load(text)
-    except yaml.parser.ParserError:
-        return None
-
-    return result_json
+def parse_json(text: str, response_schema=None) :
+    """Parse the JSON object of a reply, optionally validated against the action response schema."""
+    return extract_json(text, response_schema)
 
 
 class Deserializable(ABC):
@@ -1,7 +1,6 @@
 import json
 import random
 from typing import List, Tuple
-import enum
 from typing import Any, Dict, List, Optional, Tuple, Union
 import os
 import wandb
@@ -11,7 +10,7 @@ from games.werewolf.runner import initialize_players
 from games.werewolf.model import State
 from games.werewolf.game import GameMaster
 from games.werewolf.config import _THREADS
-from games.werewolf.model import Round, RoundLog, State, VoteLog
+from games.werewolf.model import GameView, JsonEncoder, Round, RoundLog, State, VoteLog
 
 class WereWolfEnv(gym.Env):
     """ WereWolfEnv
@@ -31,11 +30,8 @@ class WereWolfEnv(gym.Env):
         self.game=None
         self.state=None
         self.round_debate_players = []
-        self.round_vote_players = []
-        self.round_votes = {}
-        self.round_votes_log = []
-        self.round_summ_players = []
-        self.action_seq=['new_round','eliminate','protect','unmask','resolve_night_phase','check_for_winner','run_day_phase','vote','exile','check_for_winner','run_summaries']
+        # step() returns a batch of observations for each night_actions, vote and run_summaries state
+        self.action_seq=['new_round','night_actions','resolve_night_phase','check_for_winner','run_day_phase','vote','exile','check_for_winner','run_summaries']
         self.action_seq_pointer=-1
         self.wolf_alive=2
         self.vote_wolf=0
@@ -47,6 +43,9 @@ class WereWolfEnv(gym.Env):
         self.key_role_alive=['seer','doctor']
         self.cur_alive_wolf_name = []
         self.cur_alive_good_name=[]
+        # Round-level checkpoint, see enable_checkpoints()
+        self.checkpoint_path = None
+        self.checkpoint_trajectories = None
 
         self.logger.info("=" * 5 + f"WereWolfEnv Init Successfully!: " + "=" * 5)
 
@@ -67,10 +66,6 @@ class WereWolfEnv(gym.Env):
             self.game=None
             self.action_seq_pointer = -1
             self.round_debate_players = []
-            self.round_vote_players = []
-            self.round_votes = {}
-            self.round_votes_log = []
-            self.round_summ_players = []
         self._init_players()
         self.game = GameMaster(self.state, num_threads=_THREADS)
         self.logger.info("=" * 5 + f"WereWolfEnv Reset successfully!: " + "=" * 5)
@@ -88,10 +83,10 @@ class WereWolfEnv(gym.Env):
         self.action_seq_pointer += 1
         cur_action = self.action_seq[self.action_seq_pointer]
         # Execute Night Phase
-        if cur_action == "eliminate":
+        if cur_action == "night_actions":
             message = "The Werewolves are picking someone to remove from the game."
             self.logger.info(message)
-            return self.game.eliminate_pre()
+            return self._night_observations()
 
     def _wandb_log(self):
         # IRP(Identity Inference Accuracy) (correct_identifications / total_identification_attempts) * 100%
@@ -102,6 +97,61 @@ class WereWolfEnv(gym.Env):
 
     def to_dict(self,o: Any) -> Union[Dict[str, Any], List[Any], Any]:
         return json.loads(JsonEncoder().encode(o))
+
+    def enable_checkpoints(self, path, trajectories=None):
+        """Write a checkpoint to path each time a round is completed.
+
+        Args:
+          path: checkpoint file.
+          trajectories: dictionary mapping player names to agent trajectories, saved with the game.
+        """
+        self.checkpoint_path = path
+        self.checkpoint_trajectories = trajectories
+
+    def save_checkpoint(self, path):
+        """Save the game between two rounds, so that it can be resumed with load_checkpoint()."""
+        checkpoint = {
+            "state": self.game.state,
+            "logs": self.game.logs,
+            "action_seq_pointer": self.action_seq_pointer,
+            "metrics": {
+                "vote_wolf": self.vote_wolf,
+                "vote_exile_wolf": self.vote_exile_wolf,
+                "valid_roundvote_times": self.valid_roundvote_times,
+                "good_vote_times": self.good_vote_times,
+                "valid_vote_times": self.valid_vote_times,
+                "all_vote_times": self.all_vote_times,
+            },
+            "trajectories": self.checkpoint_trajectories or {},
+        }
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        # Write to a temporary file first, so that a crash never leaves a truncated checkpoint.
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as file:
+            json.dump(checkpoint, file, cls=JsonEncoder)
+        os.replace(tmp_path, path)
+
+    def load_checkpoint(self, path):
+        """Restore a game saved with save_checkpoint(). The next step([]) starts the following round.
+
+        Returns:
+          Dictionary mapping player names to the saved agent trajectories.
+        """
+        with open(path, "r") as file:
+            checkpoint = json.load(file)
+        self.state = State.from_json(checkpoint["state"])
+        for player in self.state.players.values():
+            if isinstance(player.gamestate, dict):
+                player.gamestate = GameView.from_json(player.gamestate)
+        self.game = GameMaster(self.state, num_threads=_THREADS)
+        self.game.logs = [RoundLog.from_json(log) for log in checkpoint["logs"]]
+        self.action_seq_pointer = checkpoint["action_seq_pointer"]
+        self.round_debate_players = []
+        for name, value in checkpoint["metrics"].items():
+            setattr(self, name, value)
+        self.logger.info(f"WereWolfEnv resumed at round {self.game.current_round_num} from {path}")
+        return checkpoint["trajectories"]
+
     def save_game(self,state: State, logs: List[RoundLog], directory: str):
         """Save the current game state to a specified file.
 
@@ -128,10 +178,10 @@ class WereWolfEnv(gym.Env):
         log_file = f"{directory}/game_logs.json"
 
         with open(game_file, "w") as file:
-            json.dump(state.to_dict(), file, indent=4)
+            json.dump(state, file, cls=JsonEncoder, indent=4)
 
         with open(log_file, "w") as file:
-            json.dump(self.to_dict(logs), file, indent=4)
+            json.dump(logs, file, cls=JsonEncoder, indent=4)
     def _wandb_ksr(self,key_role_alive):
         # KSR(Key role survival rate) (key_role_survived / total_key_role_games) * 100%
         ksr=1
@@ -143,63 +193,144 @@ class WereWolfEnv(gym.Env):
 
 
 
-    def step(self,action,pre_observations=None):
+    def _night_observations(self):
+        # Night actions do not depend on each other: the werewolves, the doctor and the seer decide at once
+        observations = [self.game.eliminate_pre()]
+        if self.game.state.doctor.name in self.game.this_round.players:
+            options = list(self.game.state.doctor.gamestate.current_players)
+            random.shuffle(options)
+            observations.append({
+                "player_name": self.game.state.doctor.name,
+                "game_state": self.game.state.doctor._get_game_state(),
+                "action": "protect",
+                "options": options
+            })
+        if self.game.state.seer.name in self.game.this_round.players:
+            options = [
+                player
+                for player in self.game.state.seer.gamestate.current_players
+                if player != self.game.state.seer.name and player not in self.game.state.seer.previously_unmasked.keys()
+            ]
+            random.shuffle(options)
+            observations.append({
+                "player_name": self.game.state.seer.name,
+                "game_state": self.game.state.seer._get_game_state(),
+                "action": "investigate",
+                "options": options
+            })
+        return observations
+
+    def _night_post(self, actions, pre_observations):
+        for observation, (result, log) in zip(pre_observations, actions):
+            if observation['action'] == "remove":
+                self.game.eliminate_post(observation, result, log)
+            elif observation['action'] == "protect":
+                self.game.protect_post(result, log)
+            elif observation['action'] == "investigate":
+                self.game.this_round_log.investigate = log
+                if result is not None:
+                    self.game.this_round.unmasked = result
+                    self.game.state.seer.reveal_and_update(result, self.game.state.players[result].role)
+                else:
+                    raise ValueError("Unmask function did not return a valid player.")
+
+    def _vote_observations(self):
+        observations = []
+        for voter in self.game.this_round.players:
+            player = self.state.players[voter]
+            options = [player_name for player_name in player.gamestate.current_players
+                       if player_name != player.name]
+            random.shuffle(options)
+            observations.append({
+                "player_name": player.name,
+                "game_state": player._get_game_state(),
+                "action": "vote",
+                "options": options
+            })
+        return observations
+
+    def _vote_post(self, actions, pre_observations):
+        round_votes = {}
+        round_votes_log = []
+        for observation, (vote, log) in zip(pre_observations, actions):
+            pre_player_name = observation['player_name']
+            pre_player = self.game.state.players[pre_player_name]
+            if vote is not None:
+                pre_player._add_observation(
+                    f"After the debate, I voted to remove {vote} from the game."
+                )
+            round_votes_log.append(VoteLog(pre_player_name, vote, log))
+            if vote is not None:
+                round_votes[pre_player_name] = vote
+            else:
+                self.game.this_round.votes.append(round_votes)
+                self.game.this_round_log.votes.append(round_votes_log)
+                raise ValueError(f"{pre_player_name} vote did not return a valid player.")
+        self.game.this_round.votes.append(round_votes)
+        self.game.this_round_log.votes.append(round_votes_log)
+        # ====record vote for wandb====
+        cur_alive_wolf = [w for w in self.game.state.werewolves if w.name in self.game.this_round.players]
+        self.cur_alive_wolf_name = [w.name for w in cur_alive_wolf]
+        self.cur_alive_good_name = [w for w in self.game.this_round.players if w not in self.cur_alive_wolf_name]
+        for k, v in round_votes.items():
+            if k in self.cur_alive_good_name:
+                self.good_vote_times += 1
+                if v in self.cur_alive_wolf_name:
+                    self.vote_wolf += 1
+        self.all_vote_times += 1
+        self._wandb_log()
+        # ====record vote for wandb====
+        for player, vote in round_votes.items():
+            tqdm.write(f"{player} voted to remove {vote}")
+
+    def _summary_observations(self):
+        observations = []
+        for summ_player in self.game.this_round.players:
+            player = self.state.players[summ_player]
+            observations.append({
+                "player_name": player.name,
+                "game_state": player._get_game_state(),
+                "action": "summarize",
+                "options": []
+            })
+        return observations
+
+    def _summary_post(self, actions, pre_observations):
+        for observation, (result, log) in zip(pre_observations, actions):
+            pre_player_name = observation['player_name']
+            pre_player = self.game.state.players[pre_player_name]
+            if result is not None:
+                summary = result.get("summary", None)
+                if summary is not None:
+                    summary = summary.strip('"')
+                    pre_player._add_observation(f"Summary: {summary}")
+                tqdm.write(f"{pre_player_name} summary: {summary}")
+                self.game.this_round_log.summaries.append((pre_player_name, log))
+
+    def step(self, actions, pre_observations=None):
+        """Advance the game with the actions answering the previous observations.
+
+        Observations are returned as a list of decisions which do not depend on each other
+        (all night actions, all votes or all summaries of a round), so that they can be
+        requested concurrently. A debate turn is a list with a single observation.
+
+        Args:
+          actions: one (result, log) action per previous observation, in the same order.
+          pre_observations: list of observations returned by the previous call.
+
+        Returns:
+          A tuple (observations, winner).
+        """
+        pre_observations = pre_observations or []
         self.action_seq_pointer += 1
         cur_action = self.action_seq[self.action_seq_pointer]
         if cur_action == "new_round":
-            observations=self.reset_new_round()
-            if observations is not None:
-                return observations,None
+            return self.reset_new_round(), None
 
         # 1. input None and return the observed value
         # 2. input action and return the next observed value
-        if cur_action=="protect":
-            eliminated,log=action
-            self.game.eliminate_post(pre_observations,eliminated,log)
-            if self.game.state.doctor.name not in self.game.this_round.players:
-                # 执行下一个unmask
-                self.action_seq_pointer += 1
-                cur_action = self.action_seq[self.action_seq_pointer]
-            else:
-                options=list(self.game.state.doctor.gamestate.current_players)
-                random.shuffle(options)
-                observations = {
-                    "player_name": self.game.state.doctor.name,
-                    "game_state": self.game.state.doctor._get_game_state(),
-                    "action": "protect",
-                    "options": options
-                }
-                return observations,None
-        if cur_action=="unmask":
-            protect, log = action
-            self.game.protect_post(protect, log)
-            if self.game.state.seer.name not in self.game.this_round.players:
-                # Execute the next resolve_night_phase
-                self.action_seq_pointer += 1
-                cur_action = self.action_seq[self.action_seq_pointer]
-            else:
-                options = [
-                    player
-                    for player in self.game.state.seer.gamestate.current_players
-                    if player != self.game.state.seer.name and player not in self.game.state.seer.previously_unmasked.keys()
-                ]
-                random.shuffle(options)
-                observations = {
-                    "player_name": self.game.state.seer.name,
-                    "game_state": self.game.state.seer._get_game_state(),
-                    "action": "investigate",
-                    "options": options
-                }
-                return observations,None
-        if cur_action=="resolve_night_phase":
-            unmask, log = action
-            self.game.this_round_log.investigate = log
-
-            if unmask is not None:
-                self.game.this_round.unmasked = unmask
-                self.game.state.seer.reveal_and_update(unmask, self.game.state.players[unmask].role)
-            else:
-                raise ValueError("Unmask function did not return a valid player.")
+        if cur_action == "resolve_night_phase":
+            self._night_post(actions, pre_observations)
             self.game.resolve_night_phase()
             self.action_seq_pointer += 1
             cur_action = self.action_seq[self.action_seq_pointer]
@@ -209,9 +340,9 @@ class WereWolfEnv(gym.Env):
             cur_action = self.action_seq[self.action_seq_pointer]
         if cur_action=="run_day_phase":
             # 1. Process the previous debate results first
-            if pre_observations is not None and pre_observations['action']=="debate":
-                result, log=action
-                pre_speaker=pre_observations['player_name']
+            if pre_observations and pre_observations[0]['action']=="debate":
+                result, log=actions[0]
+                pre_speaker=pre_observations[0]['player_name']
                 if result is not None:
                     dialogue = result.get("say", None)
                     self.game.this_round_log.debate.append((pre_speaker, log))
@@ -230,6 +361,7 @@ class WereWolfEnv(gym.Env):
                     )
 
             # 2. Select the player without debate
+            # Each speaker sees the previous debate lines, so debate turns stay sequential
             next_speaker=None
             for speaker in self.game.this_round.players:
                 # speaker = self.game.state.players[name]
@@ -239,12 +371,12 @@ class WereWolfEnv(gym.Env):
                     break
             if next_speaker is not None:
                 player = self.state.players[next_speaker]
-                observations = {
+                observations = [{
                     "player_name": player.name,
                     "game_state": player._get_game_state(),
                     "action": "debate",
                     "options": []
-                }
+                }]
                 self.action_seq_pointer -= 1
                 return observations,None
             else:
@@ -253,70 +385,13 @@ class WereWolfEnv(gym.Env):
                 self.round_debate_players=[]
 
         if cur_action=="vote":
-            # 1. Process the vote return value first
-            if pre_observations is not None and pre_observations['action'] == "vote":
-                vote, log=action
-                pre_player_name=pre_observations['player_name']
-                pre_player=self.game.state.players[pre_player_name]
-                if vote is not None:
-                    pre_player._add_observation(
-                        f"After the debate, I voted to remove {vote} from the game."
-                    )
-                self.round_votes_log.append(VoteLog(pre_player_name, vote, log))
-
-                if vote is not None:
-                    self.round_votes[pre_player_name]=vote
-                else:
-                    self.game.this_round.votes.append(self.round_votes)
-                    self.game.this_round_log.votes.append(self.round_votes_log)
-                    self.round_votes = {}
-                    self.round_votes_log = []
-                    raise ValueError(f"{pre_player_name} vote did not return a valid player.")
-            
-            # If every player has spoken, then vote
-            # Loop through the votes
-            next_voter=None
-            for voter in self.game.this_round.players:
-                # voter = self.game.state.players[name]
-                if voter not in self.round_vote_players:
-                    next_voter = voter
-                    self.round_vote_players.append(voter)
-                    break
-            if next_voter is not None:
-                player = self.state.players[next_voter]
-                options=[ player_name for player_name in player.gamestate.current_players
-                        if player_name != player.name       ]
-                random.shuffle(options)
-                observations = {
-                    "player_name": player.name,
-                    "game_state": player._get_game_state(),
-                    "action": "vote",
-                    "options": options
-                }
+            # All living players vote at once, then the votes are processed in player order
+            if not pre_observations or pre_observations[0]['action'] != "vote":
                 self.action_seq_pointer -= 1
-                return observations,None
-            else:
-
-                self.round_vote_players=[]
-                self.game.this_round.votes.append(self.round_votes)
-                self.game.this_round_log.votes.append(self.round_votes_log)
-                # ====record vote for wandb====
-                cur_alive_wolf=[w for w in self.game.state.werewolves if w.name in self.game.this_round.players]
-                self.cur_alive_wolf_name=[w.name for w in cur_alive_wolf]
-                self.cur_alive_good_name=[w for w in self.game.this_round.players if w not in self.cur_alive_wolf_name]
-                for k,v in self.round_votes.items():
-                    if k in self.cur_alive_good_name:
-                        self.good_vote_times+=1
-                        if v in self.cur_alive_wolf_name:
-                            self.vote_wolf+=1
-                self.all_vote_times+=1
-                self._wandb_log()
-                # ====record vote for wandb====
-                for player, vote in self.game.this_round.votes[-1].items():
-                    tqdm.write(f"{player} voted to remove {vote}")
-                self.round_votes_log=[]
-                self.action_seq_pointer += 1
-                cur_action = self.action_seq[self.action_seq_pointer]
+                return self._vote_observations(), None
+            self._vote_post(actions, pre_observations)
+            self.action_seq_pointer += 1
+            cur_action = self.action_seq[self.action_seq_pointer]
         if cur_action=="exile":
             self.game.exile()
             # record
@@ -339,54 +414,28 @@ class WereWolfEnv(gym.Env):
             self.action_seq_pointer += 1
             cur_action = self.action_seq[self.action_seq_pointer]
         if cur_action == "run_summaries":
-            # Process the returned results first
-            if pre_observations is not None and pre_observations['action'] == "summarize":
-                result, log=action
-                pre_player_name = pre_observations['player_name']
-                pre_player = self.game.state.players[pre_player_name]
-                if result is not None:
-                    summary = result.get("summary", None)
-                    if summary is not None:
-                        summary = summary.strip('"')
-                        pre_player._add_observation(f"Summary: {summary}")
-                    tqdm.write(f"{pre_player_name} summary: {summary}")
-                    self.game.this_round_log.summaries.append((pre_player_name, log))
-            
-            # To summarize
-            next_summ_player = None
-            for summ_player in self.game.this_round.players:
-                if summ_player not in self.round_summ_players:
-                    next_summ_player = summ_player
-                    self.round_summ_players.append(summ_player)
-                    break
-            if next_summ_player is not None:
-                player = self.state.players[next_summ_player]
-                observations = {
-                    "player_name": player.name,
-                    "game_state": player._get_game_state(),
-                    "action": "summarize",
-                    "options": []
-                }
+            # All living players summarize at once
+            if not pre_observations or pre_observations[0]['action'] != "summarize":
                 self.action_seq_pointer -= 1
-                return observations, None
+                return self._summary_observations(), None
+            self._summary_post(actions, pre_observations)
+            if self.game.state.winner:
+                tqdm.write(f"Round {self.game.current_round_num} is complete.")
+                self.game.this_round.success = True
+                return None, self.game.state.winner
             else:
-                self.round_summ_players=[]
-                if self.game.state.winner:
-                    tqdm.write(f"Round {self.game.current_round_num} is complete.")
-                    self.game.this_round.success = True
-                    return None, self.game.state.winner
-                else:
-                    for name in self.game.this_round.players:
-                        if self.game.state.players[name].gamestate:
-                            self.game.state.players[name].gamestate.round_number = (
-                                    self.game.current_round_num + 1
-                            )
-                            self.game.state.players[name].gamestate.clear_debate()
-                    self.game.current_round_num += 1
-                    self.action_seq_pointer=0
-                    observations = self.reset_new_round()
-                    if observations is not None:
-                        return observations, None
+                for name in self.game.this_round.players:
+                    if self.game.state.players[name].gamestate:
+                        self.game.state.players[name].gamestate.round_number = (
+                                self.game.current_round_num + 1
+                        )
+                        self.game.state.players[name].gamestate.clear_debate()
+                self.game.current_round_num += 1
+                # The next step([]) starts the new round, as after reset()
+                self.action_seq_pointer = -1
+                if self.checkpoint_path:
+                    self.save_checkpoint(self.checkpoint_path)
+                return self.step([])
 
 
     def log_directory(self) -> str:
@@ -400,11 +449,3 @@ class WereWolfEnv(gym.Env):
     def render(self):
         self.logger.warnning("WereWolfEnv has no render!!!")
         return None
-class JsonEncoder(json.JSONEncoder):
-
-  def default(self, o):
-    if isinstance(o, enum.Enum):
-      return o.value
-    if isinstance(o, set):
-      return list(o)
-    return o.__dict__
\ No newline at end of file